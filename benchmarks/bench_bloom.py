@@ -0,0 +1,77 @@
+# --------------- Imports ---------------
+
+from macho.bloom_filter import BLOOM_KINDS, create_bloom_filter
+
+from threading import Thread
+from typing import Any, Dict
+
+import argparse
+import time
+
+# --------------- Bloom Filter Benchmark ---------------
+#
+# Compares every Bloom Filter kind: realized false positive rate, add() & check() cost and memory.
+# Run with:  python benchmarks/bench_bloom.py [--items 100000] [--probability 0.01]
+
+def _run_kind(kind: str, items: int, probability: float, threads: int) -> Dict[str, Any]:
+    bloom = create_bloom_filter(kind, items, probability)
+    present = [f"key:{i}" for i in range(items)]
+    absent = [f"absent:{i}" for i in range(items)]
+
+    start = time.perf_counter_ns()
+    for key in present:
+        bloom.add(key)
+    add_ns = (time.perf_counter_ns() - start) / items
+
+    start = time.perf_counter_ns()
+    for key in present:
+        bloom.check(key)
+    hit_ns = (time.perf_counter_ns() - start) / items
+
+    start = time.perf_counter_ns()
+    false_positives = sum(1 for key in absent if bloom.check(key))
+    miss_ns = (time.perf_counter_ns() - start) / items
+
+    def reader(keys):
+        for key in keys:
+            bloom.check(key)
+
+    workers = [Thread(target=reader, args=(absent[index::threads],)) for index in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    concurrent_ops = items / (time.perf_counter() - start)
+
+    return {
+        "kind": kind,
+        "fpr": false_positives / items,
+        "add_ns": add_ns,
+        "check_hit_ns": hit_ns,
+        "check_miss_ns": miss_ns,
+        "concurrent_checks_per_second": concurrent_ops,
+        "bytes": bloom.nbytes
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="False positive rate & lookup cost of Macho's Bloom Filters")
+    parser.add_argument("--items", type=int, default=100_000, help="Keys inserted (and absent keys checked)")
+    parser.add_argument("--probability", type=float, default=0.01, help="Target false positive rate")
+    parser.add_argument("--threads", type=int, default=4, help="Threads for the concurrent check() run")
+    args = parser.parse_args()
+
+    print(f"{args.items} items, target false positive rate {args.probability}")
+    print(f"{'kind':<10}{'fpr':>9}{'add ns':>10}{'hit ns':>10}{'miss ns':>10}{'MT checks/s':>14}{'KiB':>9}")
+    for kind in BLOOM_KINDS:
+        result = _run_kind(kind, args.items, args.probability, args.threads)
+        print(
+            f"{kind:<10}{result['fpr']:>9.4f}{result['add_ns']:>10.0f}{result['check_hit_ns']:>10.0f}"
+            f"{result['check_miss_ns']:>10.0f}{result['concurrent_checks_per_second']:>14.0f}"
+            f"{result['bytes'] / 1024:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# --------------- Imports ---------------
+
+from macho.clock import CLOCK_KINDS, ManualClock, create_clock
+from macho.models import LRUCache, instrumented
+
+import argparse
+import random
+import time
+
+# --------------- Clock Overhead Benchmark ---------------
+#
+# Measures the cost of a single clock read and the pr. operation cost of add() & get() on a single
+# LRU shard (instrumentation 'off', so only TTL & lifecycle times read the clock) for every clock.
+# Run with:  python benchmarks/bench_clock.py [--ops 20000] [--size 16]
+
+def _clocks(resolution: float) -> dict:
+    clocks = {kind: create_clock(kind, resolution) for kind in CLOCK_KINDS}
+    clocks["manual"] = ManualClock()
+    return clocks
+
+def _time_now(clock, ops: int) -> float:
+    now = clock.now
+    start = time.perf_counter_ns()
+    for _ in range(ops):
+        now()
+    return (time.perf_counter_ns() - start) / ops
+
+def _run_clock(clock, ops: int, size: int, seed: int) -> dict:
+    shard = instrumented(LRUCache, "off")(max_cache_size=size, default_ttl=600.0)
+    shard.clock = clock
+
+    rng = random.Random(seed)
+    keys = [rng.randrange(size * 2) for _ in range(ops)]    # ~50% hit ratio once warm
+
+    for key in range(size):
+        shard.add(key, key)
+
+    start = time.perf_counter_ns()
+    for key in keys:
+        shard.add(key, key)
+    add_ns = (time.perf_counter_ns() - start) / ops
+
+    start = time.perf_counter_ns()
+    for key in keys:
+        shard.get(key)
+    get_ns = (time.perf_counter_ns() - start) / ops
+
+    return {"now_ns": _time_now(clock, ops), "add_ns": add_ns, "get_ns": get_ns}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pr. operation overhead of Macho's clocks")
+    parser.add_argument("--ops", type=int, default=20_000, help="Operations timed pr. method")
+    parser.add_argument("--size", type=int, default=16, help="Shard capacity")
+    parser.add_argument("--resolution", type=float, default=0.005, help="Tick interval of the 'coarse' clock")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs is reported")
+    args = parser.parse_args()
+
+    clocks = _clocks(args.resolution)
+    runs = {kind: [] for kind in clocks}
+    for seed in range(args.repeat):             # Interleave clocks so drift affects all of them equally
+        for kind, clock in clocks.items():
+            runs[kind].append(_run_clock(clock, args.ops, args.size, seed))
+
+    results = {
+        kind: {metric: min(run[metric] for run in kind_runs) for metric in ("now_ns", "add_ns", "get_ns")}
+        for kind, kind_runs in runs.items()
+    }
+
+    baseline = results["precise"]
+    print(f"{'clock':<10}{'now (ns)':>10}{'add (ns/op)':>14}{'saved':>8}{'get (ns/op)':>14}{'saved':>8}")
+    for kind, result in results.items():
+        print(
+            f"{kind:<10}{result['now_ns']:>10.0f}"
+            f"{result['add_ns']:>14.0f}{baseline['add_ns'] - result['add_ns']:>+8.0f}"
+            f"{result['get_ns']:>14.0f}{baseline['get_ns'] - result['get_ns']:>+8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
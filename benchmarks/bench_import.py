@@ -0,0 +1,79 @@
+# --------------- Imports ---------------
+
+from typing import Dict, List, Tuple
+
+import argparse
+import subprocess
+import sys
+
+# --------------- Import Time Benchmark ---------------
+#
+# Guards the cold import cost of Macho, measured with 'python -X importtime'.
+# Fails (exit code 1) if an optional dashboard dependency is imported, or the import exceeds the budget.
+# Run with:  python benchmarks/bench_import.py [--statement "import macho"] [--budget-ms 50]
+
+FORBIDDEN_MODULES = ("streamlit", "pandas", "plotly")
+
+
+def measure(statement: str) -> Tuple[int, Dict[str, int]]:
+    """
+    Runs 'statement' in a fresh interpreter with -X importtime.
+
+    ----- Return -----
+    Tuple[int, Dict[str, int]]
+        Total import time of Macho (µs) & the cumulative import time (µs) pr. imported module.
+
+    ----- Notes -----
+    Lazily resolved attributes (e.g. macho.Cache) show up as separate top-level imports,
+    so the total sums every top-level 'macho' entry instead of only the package itself.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    ).stderr
+
+    modules: Dict[str, int] = {}
+    total = 0
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():            # Header line
+            continue
+        module = name.strip()
+        modules[module] = int(cumulative)
+        if name[1:2] != " " and module.split(".")[0] == "macho":    # Top-level entries are not indented
+            total += int(cumulative)
+    return total, modules
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Cold import time of Macho")
+    parser.add_argument("--statement", default="import macho", help="Statement to time")
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="Maximum allowed import time of macho")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs is reported")
+    parser.add_argument("--top", type=int, default=10, help="Number of slowest modules to list")
+    args = parser.parse_args()
+
+    runs: List[Tuple[int, Dict[str, int]]] = [measure(args.statement) for _ in range(args.repeat)]
+    macho_us, modules = min(runs, key=lambda run: run[0])
+
+    print(f"{args.statement!r}: macho {macho_us / 1000:.1f} ms (best of {args.repeat})")
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    for name, cumulative in slowest:
+        print(f"  {name:<50}{cumulative / 1000:>10.1f} ms")
+
+    failures = []
+    leaked = sorted({name.split(".")[0] for name in modules} & set(FORBIDDEN_MODULES))
+    if args.statement == "import macho" and leaked:
+        failures.append(f"optional dashboard dependencies imported: {', '.join(leaked)}")
+    if macho_us / 1000 > args.budget_ms:
+        failures.append(f"import took {macho_us / 1000:.1f} ms, budget is {args.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
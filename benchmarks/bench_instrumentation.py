@@ -0,0 +1,69 @@
+# --------------- Imports ---------------
+
+from macho.models import LRUCache, INSTRUMENTATION_LEVELS, instrumented
+
+import argparse
+import random
+import time
+
+# --------------- Instrumentation Overhead Benchmark ---------------
+#
+# Measures the pr. operation cost of every instrumentation level on a single LRU shard.
+# Run with:  python benchmarks/bench_instrumentation.py [--ops 20000] [--size 16]
+
+def _run_level(level: str, ops: int, size: int, sample_rate: int, seed: int) -> dict:
+    shard = instrumented(LRUCache, level)(max_cache_size=size, default_ttl=600.0)
+    shard.sample_rate = sample_rate
+
+    rng = random.Random(seed)
+    keys = [rng.randrange(size * 2) for _ in range(ops)]    # ~50% hit ratio once warm
+
+    for key in range(size):
+        shard.add(key, key)
+
+    start = time.perf_counter_ns()
+    for key in keys:
+        shard.add(key, key)
+    add_ns = (time.perf_counter_ns() - start) / ops
+
+    start = time.perf_counter_ns()
+    for key in keys:
+        shard.get(key)
+    get_ns = (time.perf_counter_ns() - start) / ops
+
+    return {"level": level, "add_ns": add_ns, "get_ns": get_ns}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pr. operation overhead of Macho's instrumentation levels")
+    parser.add_argument("--ops", type=int, default=20_000, help="Operations timed pr. method")
+    parser.add_argument("--size", type=int, default=16, help="Shard capacity")
+    parser.add_argument("--sample-rate", type=int, default=100, help="Sample rate for 'sampled' level")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs is reported")
+    args = parser.parse_args()
+
+    runs = {level: [] for level in INSTRUMENTATION_LEVELS}
+    for seed in range(args.repeat):             # Interleave levels so drift affects all of them equally
+        for level in INSTRUMENTATION_LEVELS:
+            runs[level].append(_run_level(level, args.ops, args.size, args.sample_rate, seed))
+
+    results = {
+        level: {
+            "add_ns": min(run["add_ns"] for run in level_runs),
+            "get_ns": min(run["get_ns"] for run in level_runs)
+        }
+        for level, level_runs in runs.items()
+    }
+
+    baseline = results["off"]
+    print(f"{'level':<10}{'add (ns/op)':>14}{'overhead':>10}{'get (ns/op)':>14}{'overhead':>10}")
+    for level, result in results.items():
+        print(
+            f"{level:<10}"
+            f"{result['add_ns']:>14.0f}{result['add_ns'] - baseline['add_ns']:>+10.0f}"
+            f"{result['get_ns']:>14.0f}{result['get_ns'] - baseline['get_ns']:>+10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
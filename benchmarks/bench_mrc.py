@@ -0,0 +1,62 @@
+# --------------- Imports ---------------
+
+from macho.trace import OP_ADD, OP_GET
+from macho.tuning import MissRatioEstimator, ghost_class
+from macho.utility.utils import cache_list
+
+from workloads import WORKLOADS, build_workload
+
+import argparse
+import time
+
+# --------------- Miss-ratio Curve Benchmark ---------------
+#
+# Compares the miss-ratio curve estimated from SHARDS-sampled ghost caches with the exact curve of a
+# full replay, for every eviction strategy, and reports the pr. operation cost of recording accesses.
+# Run with:  python benchmarks/bench_mrc.py [--workload zipfian] [--ops 200000] [--size 1000] [--rate 0.05]
+
+def _exact(policy: str, workload: list, size: int) -> float:
+    cache = ghost_class(cache_list[policy])(size, float("inf"))
+    for op, key in workload:
+        if op == "get":
+            if cache.get(key) is None:
+                cache.add(key, True)
+        else:
+            cache.add(key, True)
+    total = cache.hits + cache.misses
+    return cache.misses / total if total else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Accuracy & overhead of Macho's miss-ratio curve estimation")
+    parser.add_argument("--workload", choices=WORKLOADS, default="zipfian")
+    parser.add_argument("--ops", type=int, default=200_000, help="Operations replayed")
+    parser.add_argument("--keyspace", type=int, default=20_000, help="Distinct keys in the workload")
+    parser.add_argument("--size", type=int, default=1_000, help="Capacity of the live cache")
+    parser.add_argument("--rate", type=float, default=0.05, help="Share of the keys sampled")
+    args = parser.parse_args()
+
+    workload = build_workload(args.workload, args.ops, args.keyspace)
+    estimator = MissRatioEstimator(args.size, sample_rate=args.rate, interval=0)
+
+    start = time.perf_counter_ns()
+    for op, key in workload:
+        estimator.record(OP_GET if op == "get" else OP_ADD, key)
+    record_ns = (time.perf_counter_ns() - start) / len(workload)
+
+    start = time.perf_counter()
+    samples = estimator.process()
+    process_s = time.perf_counter() - start
+
+    print(f"sampled {samples} of {len(workload)} ops (rate {estimator.rate:.3f}), "
+          f"record {record_ns:.0f} ns/op, ghost replay {process_s:.2f}s")
+    print(f"{'policy':<8}{'size':>8}{'estimated':>11}{'exact':>8}{'error':>8}")
+    for policy, ratios in estimator.miss_ratios().items():
+        for factor, estimated in ratios.items():
+            size = round(args.size * factor)
+            exact = _exact(policy, workload, size)
+            print(f"{policy:<8}{size:>8}{estimated:>11.3f}{exact:>8.3f}{estimated - exact:>+8.3f}")
+
+
+if __name__ == "__main__":
+    main()
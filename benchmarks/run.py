@@ -0,0 +1,220 @@
+# --------------- Imports ---------------
+
+from macho import Cache
+from macho.metrics import LogHistogram
+from macho.utility.utils import cache_list
+
+from workloads import WORKLOADS, build_workload
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from threading import Barrier, Thread
+from typing import Any, Dict, List, Optional
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+# --------------- Benchmark Suite ---------------
+#
+# Reproducible benchmarks for every eviction strategy, shard count and Bloom filter setting.
+# Each configuration runs in a fresh process so peak RSS is measured in isolation.
+#
+#   python benchmarks/run.py                                   # Full matrix, results saved as JSON
+#   python benchmarks/run.py --quick --ops 5000                # Smaller matrix for a fast sanity check
+#   python benchmarks/run.py --compare baseline.json           # Flag regressions against earlier results
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def build_matrix(quick: bool = False) -> List[Dict[str, Any]]:
+    configs = []
+    sizes = (100,) if quick else (100, 1_000)
+    for policy in cache_list:
+        for size in sizes:
+            for workload in WORKLOADS:
+                configs.append({
+                    "suite": "policies", "workload": workload, "policy": policy,
+                    "size": size, "shards": 1, "bloom": False, "threads": 1
+                })
+
+    shard_counts = (1, 64) if quick else (1, 4, 16, 64)
+    for shards in shard_counts:
+        for bloom in (False, True):
+            for threads in (1, 4):
+                configs.append({
+                    "suite": "sharding", "workload": "zipfian", "policy": "lru",
+                    "size": 1_024, "shards": shards, "bloom": bloom, "threads": threads
+                })
+    return configs
+
+
+def config_key(config: Dict[str, Any]) -> str:
+    return "{suite}/{workload}/{policy}/size={size}/shards={shards}/bloom={bloom}/threads={threads}".format(**config)
+
+
+def _peak_rss_bytes() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:                         # Not available on Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run_config(config: Dict[str, Any], ops: int, seed: int) -> Dict[str, Any]:
+    cache = Cache(
+        max_cache_size=config["size"],
+        ttl=600.0,
+        shard_count=config["shards"],
+        strategy=config["policy"],
+        bloom=config["bloom"],
+        probability=0.01
+    )
+    workload = [                                # BloomFilter hashes keys with mmh3, which requires strings
+        (op, f"key:{key}")
+        for op, key in build_workload(config["workload"], ops, keyspace=config["size"] * 10, seed=seed)
+    ]
+
+    threads = config["threads"]
+    histograms = [LogHistogram() for _ in range(threads)]
+    hits = [0] * threads
+    gets = [0] * threads
+    errors: List[BaseException] = []
+    barrier = Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        histogram = histograms[index]
+        local_hits = local_gets = 0
+        barrier.wait()
+        try:
+            for op, key in workload[index::threads]:
+                start = time.perf_counter_ns()
+                if op == "get":
+                    local_gets += 1
+                    if cache.get(key) is None:
+                        cache.add(key, key)
+                    else:
+                        local_hits += 1
+                else:
+                    cache.add(key, key)
+                histogram.record(time.perf_counter_ns() - start)
+        except BaseException as e:
+            errors.append(e)
+        hits[index] = local_hits
+        gets[index] = local_gets
+
+    workers = [Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+
+    latency = LogHistogram.merged(histograms)
+    return dict(
+        config,
+        ops=ops,
+        ops_per_second=ops / elapsed,
+        p50_latency_seconds=latency.percentile(0.50) / 1e9,
+        p99_latency_seconds=latency.percentile(0.99) / 1e9,
+        hit_ratio=sum(hits) / sum(gets) if sum(gets) else 0.0,
+        peak_rss_bytes=_peak_rss_bytes()
+    )
+
+
+def _metadata() -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count()
+    }
+
+
+def compare(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Prints the relative change of every configuration present in both result files.
+
+    ----- Return -----
+    List[str]
+        Keys of configurations whose throughput dropped, or p99 latency rose, by more than 'threshold'.
+    """
+    previous = {config_key(result): result for result in baseline["results"]}
+    regressions = []
+    print(f"\nCompared against {baseline['meta'].get('commit')} ({baseline['meta'].get('timestamp')})")
+    for result in current["results"]:
+        key = config_key(result)
+        before = previous.get(key)
+        if before is None:
+            continue
+        throughput = result["ops_per_second"] / before["ops_per_second"] - 1
+        p99 = result["p99_latency_seconds"] / before["p99_latency_seconds"] - 1 if before["p99_latency_seconds"] else 0.0
+        regressed = throughput < -threshold or p99 > threshold
+        if regressed:
+            regressions.append(key)
+        print(f"{'!!' if regressed else '  '} {key:<70}{throughput:>+9.1%} ops/s{p99:>+9.1%} p99")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Macho benchmark suite")
+    parser.add_argument("--ops", type=int, default=20_000, help="Operations pr. configuration")
+    parser.add_argument("--seed", type=int, default=42, help="Workload seed")
+    parser.add_argument("--quick", action="store_true", help="Run a reduced matrix")
+    parser.add_argument("--suite", choices=("policies", "sharding"), default=None, help="Only run one suite")
+    parser.add_argument("--output", default=None, help="Results file (default: benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", default=None, help="Earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change reported as regression")
+    args = parser.parse_args()
+
+    configs = [config for config in build_matrix(args.quick) if args.suite in (None, config["suite"])]
+    meta = _metadata()
+    results = []
+
+    print(f"{'configuration':<72}{'ops/s':>10}{'p99 (us)':>10}{'hit ratio':>11}{'RSS (MB)':>10}")
+    for config in configs:
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            result = pool.submit(run_config, config, args.ops, args.seed).result()
+        results.append(result)
+        rss = f"{result['peak_rss_bytes'] / 2**20:.1f}" if result["peak_rss_bytes"] else "n/a"
+        print(
+            f"{config_key(config):<72}{result['ops_per_second']:>10.0f}"
+            f"{result['p99_latency_seconds'] * 1e6:>10.1f}{result['hit_ratio']:>11.3f}{rss:>10}"
+        )
+
+    report = {"meta": meta, "results": results}
+    output = args.output or os.path.join(RESULTS_DIR, f"{meta['commit'] or 'results'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+    print(f"\nResults written to {output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            regressions = compare(json.load(file), report, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} configuration(s) regressed by more than {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
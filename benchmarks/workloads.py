@@ -0,0 +1,79 @@
+# --------------- Imports ---------------
+
+from typing import List, Tuple
+from bisect import bisect_left
+from itertools import accumulate
+
+import random
+
+# --------------- Benchmark Workloads ---------------
+#
+# Every workload is a reproducible list of (op, key) tuples, where op is "get" or "add".
+# Replayed cache-aside style by the runner: a missed get() is followed by an add() of the same key.
+
+WORKLOADS = ("zipfian", "uniform", "scan", "churn")
+
+
+def zipfian(ops: int, keyspace: int, seed: int = 42, skew: float = 1.0) -> List[Tuple[str, int]]:
+    """
+    Reads drawn from a Zipf distribution: a small hot set receives most of the traffic.
+    """
+    rng = random.Random(seed)
+    cumulative = list(accumulate(1.0 / (rank ** skew) for rank in range(1, keyspace + 1)))
+    total = cumulative[-1]
+    return [("get", bisect_left(cumulative, rng.random() * total)) for _ in range(ops)]
+
+
+def uniform(ops: int, keyspace: int, seed: int = 42) -> List[Tuple[str, int]]:
+    """
+    Reads spread uniformly across the keyspace, hit ratio approaches cache size / keyspace.
+    """
+    rng = random.Random(seed)
+    return [("get", rng.randrange(keyspace)) for _ in range(ops)]
+
+
+def scan(ops: int, keyspace: int, seed: int = 42, hot_fraction: float = 0.1) -> List[Tuple[str, int]]:
+    """
+    Zipfian reads on a hot set, interrupted by sequential sweeps over the whole keyspace
+    (e.g. a batch job iterating every key), testing scan resistance.
+    """
+    hot_keys = max(1, int(keyspace * hot_fraction))
+    hot = zipfian(ops, hot_keys, seed=seed)
+    workload = []
+    position = 0
+    for index in range(ops):
+        if (index // hot_keys) % 4 == 3:        # Every fourth block of operations is a sweep
+            workload.append(("get", hot_keys + position % keyspace))
+            position += 1
+        else:
+            workload.append(hot[index])
+    return workload
+
+
+def churn(ops: int, keyspace: int, seed: int = 42, write_ratio: float = 0.5) -> List[Tuple[str, int]]:
+    """
+    Write-heavy traffic: half of the operations insert brand-new keys, the rest read recent keys.
+    """
+    rng = random.Random(seed)
+    workload = []
+    next_key = 0
+    for _ in range(ops):
+        if rng.random() < write_ratio or next_key == 0:
+            workload.append(("add", next_key))
+            next_key += 1
+        else:
+            window = min(next_key, keyspace)
+            workload.append(("get", next_key - 1 - rng.randrange(window)))
+    return workload
+
+
+def build_workload(name: str, ops: int, keyspace: int, seed: int = 42) -> List[Tuple[str, int]]:
+    if name == "zipfian":
+        return zipfian(ops, keyspace, seed=seed)
+    if name == "uniform":
+        return uniform(ops, keyspace, seed=seed)
+    if name == "scan":
+        return scan(ops, keyspace, seed=seed)
+    if name == "churn":
+        return churn(ops, keyspace, seed=seed)
+    raise ValueError(f"Workload {name} not supported")
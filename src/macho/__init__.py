@@ -1,7 +1,26 @@
 # --------------- Imports ---------------
 
-from .dashboard import launch_dashboard
-from .main import Cache
+from importlib import import_module
+
+# --------------- Lazy Submodules ---------------
+#
+# Public names are resolved on first access (PEP 562), so 'import macho' stays cheap and
+# the optional dashboard dependencies are only imported when the dashboard is actually used.
+
+_LAZY_IMPORTS = {
+    "Cache": ".main",
+    "launch_dashboard": ".dashboard"
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value         # Cache the attribute, later look-ups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # --------------- Package Manager ---------------
 
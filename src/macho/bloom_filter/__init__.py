@@ -1,9 +1,25 @@
 # --------------- Imports ---------------
 
-from .bloom import BloomFilter
+from .bloom import BLOOM_KINDS, BloomFilter, create_bloom_filter
+
+from importlib import import_module
+
+# --------------- Lazy Submodules ---------------
+
+_LAZY_IMPORTS = {
+    "BlockedBloomFilter": ".blocked",       # Requires the optional NumPy dependency
+    "ScalableBloomFilter": ".scalable"
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # --------------- Package Manager ---------------
 
-__all__ = ["BloomFilter"]
+__all__ = ["BLOOM_KINDS", "BloomFilter", "BlockedBloomFilter", "ScalableBloomFilter", "create_bloom_filter"]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
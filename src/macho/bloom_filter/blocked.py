@@ -0,0 +1,140 @@
+# --------------- Imports ---------------
+
+from macho.bloom_filter.bloom import BloomFilter, _BloomStats
+from macho.logging import get_logger
+
+from typing import Any, List
+from threading import Lock
+
+import math
+import mmh3
+
+try:
+    import numpy as np
+except ImportError:         # Optional dependency, only required by BlockedBloomFilter
+    np = None
+
+# --------------- Logging Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Blocked Bloom Filter ---------------
+
+BLOCK_BITS = 512                        # One 64-byte cache line
+BLOCK_WORDS = BLOCK_BITS // 64          # uint64 words pr. block
+MAX_HASH_COUNT = 10                     # 9-bit positions taken from the 96 hash bits left after block selection
+
+def blocked_false_positive_rate(block_count: int, items_count: int, hash_count: int) -> float:
+    """
+    Expected false positive rate of a blocked Bloom Filter.
+
+    Keys pr. block follow a Poisson distribution, so the rate is the standard Bloom Filter rate
+    of a single 512-bit block, averaged over the block loads.
+    """
+    load = items_count / block_count
+    probability = math.exp(-load)           # P(block holds 0 keys)
+    rate = 0.0
+    for keys in range(int(load + 10 * math.sqrt(load) + 10)):
+        rate += probability * (1 - (1 - 1 / BLOCK_BITS) ** (hash_count * keys)) ** hash_count
+        probability *= load / (keys + 1)
+    return rate
+
+class BlockedBloomFilter(_BloomStats):
+    """
+    A cache-line blocked Bloom Filter backed by a NumPy uint64 array.
+
+    Every key is hashed once: 32 bits of the hash select a 512-bit block, the remaining bits provide
+    all k bit positions inside that block. A membership check therefore reads a single block.
+
+    ----- Parameters -----
+    Items_count: int
+        Estimated number of items/values to store within the Bloom Filter.
+    Probability: float
+        Desired false positive probability rate (must be between 0.0 - 1.0).
+
+    ----- Exceptions -----
+    ImportError
+        Raised if NumPy is not installed (pip install 'macho[bloom]').
+
+    ----- Notes -----
+    - False Positives are possible, but not False Negatives.
+    - check() is lock-free: bits are only ever set, never cleared, so a concurrent reader can at worst
+      miss the bits of an add() still in progress. add() serializes writers with a lock.
+    - Confining a key's bits to one block raises the false positive rate above a standard Bloom Filter
+      of the same size, so the array is grown until blocked_false_positive_rate() meets 'probability'.
+    """
+
+    __slots__ = ("probability", "lock", "size", "block_count", "hash_count", "words")
+
+    lock_type = Lock
+
+    def __init__(self, items_count: int, probability: float):
+        if np is None:
+            raise ImportError("BlockedBloomFilter requires NumPy: pip install 'macho[bloom]'")
+
+        super().__init__()
+        items_count = max(items_count, 1)
+        self.probability = probability
+        self.lock = self.lock_type()
+        self.block_count = max(1, math.ceil(BloomFilter.get_size(items_count, probability) / BLOCK_BITS))
+        self.hash_count = self._optimal_hash_count(self.block_count, items_count)
+        while blocked_false_positive_rate(self.block_count, items_count, self.hash_count) > probability:
+            self.block_count = math.ceil(self.block_count * 1.02) + 1
+            self.hash_count = self._optimal_hash_count(self.block_count, items_count)
+        self.size = self.block_count * BLOCK_BITS
+        self.words = np.zeros(self.block_count * BLOCK_WORDS, dtype=np.uint64)
+        logger.debug(f"Blocked Bloom filter created with {self.block_count} blocks & {self.hash_count} hashes")
+
+    @staticmethod
+    def _optimal_hash_count(block_count: int, items_count: int) -> int:
+        k = round(block_count * BLOCK_BITS / items_count * math.log(2))
+        return min(max(k, 1), MAX_HASH_COUNT)
+
+    def _locate(self, item: Any):
+        """
+        Hashes the item into its block's word offset and the remaining (position) hash bits.
+        """
+        digest = mmh3.hash128(str(item), seed=42, signed=False)
+        return (digest & 0xFFFFFFFF) % self.block_count * BLOCK_WORDS, digest >> 32
+
+    def add(self, item: Any) -> None:
+        """
+        Add the desired item/value to the Bloom Filter.
+
+        ----- Parameters -----
+        Item: Any
+            The item/value to add to the filter. MUST be convertible to string.
+        """
+        offset, bits = self._locate(item)
+        masks = [0] * BLOCK_WORDS
+        for _ in range(self.hash_count):
+            masks[(bits & 0x1FF) >> 6] |= 1 << (bits & 63)
+            bits >>= 9
+        block = self.words[offset:offset + BLOCK_WORDS]     # View, updated in place
+        with self.lock:
+            np.bitwise_or(block, np.array(masks, dtype=np.uint64), out=block)
+
+    def check(self, item: Any) -> bool:
+        """
+        Check is the item/value possibly is present in the Bloom Filter, without taking a lock.
+
+        ----- Parameters -----
+        Item: Any
+            The item/value to check if exists in Filter. MUST be convertible to string.
+
+        ----- Return -----
+        Bool:
+            True - If the item/value is possibly present (Could be False Positive).
+            False - If the item/value is definitely NOT present in Filter.
+        """
+        offset, bits = self._locate(item)
+        words: List[int] = self.words[offset:offset + BLOCK_WORDS].tolist()      # Single block read
+        for _ in range(self.hash_count):
+            if not words[(bits & 0x1FF) >> 6] >> (bits & 63) & 1:
+                return False
+            bits >>= 9
+        return True
+
+    @property
+    def nbytes(self) -> int:
+        return self.words.nbytes
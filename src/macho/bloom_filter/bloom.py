@@ -6,16 +6,128 @@ import mmh3
 from macho.logging import get_logger
 
 from bitarray import bitarray
-from typing import Any
+from typing import Any, Dict
 from threading import RLock
+from pickle import PickleBuffer
 
 # --------------- Logging Setup ---------------
 
 logger = get_logger(__name__)
 
+# --------------- Bloom Filter Kinds ---------------
+
+BLOOM_KINDS = ("standard", "blocked", "scalable")
+
+def create_bloom_filter(kind: str, items_count: int, probability: float):
+    """
+    Creates a Bloom Filter of the given kind.
+
+    ----- Parameters -----
+    kind: str
+        'standard' (BloomFilter, bitarray), 'blocked' (BlockedBloomFilter, NumPy & lock-free checks)
+        or 'scalable' (ScalableBloomFilter, grows with the number of distinct keys).
+    Items_count: int
+        Estimated number of items/values to store within the Bloom Filter.
+    Probability: float
+        Desired false positive probability rate (must be between 0.0 - 1.0).
+    """
+    if kind == "standard":
+        return BloomFilter(items_count, probability)
+    if kind == "blocked":
+        from macho.bloom_filter.blocked import BlockedBloomFilter      # Imported on demand, NumPy is optional
+        return BlockedBloomFilter(items_count, probability)
+    if kind == "scalable":
+        from macho.bloom_filter.scalable import ScalableBloomFilter
+        return ScalableBloomFilter(items_count, probability)
+    raise ValueError(f"Bloom Filter kind {kind} not supported")
+
+# --------------- Realized False Positive Rate ---------------
+
+_TRACK_SAMPLE = 64          # 1 out of every 64 keys is tracked for the realized false positive rate
+
+def _fingerprint(key: Any) -> int:
+    return mmh3.hash64(str(key).encode("utf-8", "surrogatepass"), seed=7, signed=False)[0]
+
+class _BloomStats(object):
+    """
+    Outcome counters shared by every Bloom Filter kind, fed by the owning Cache from sampled get() calls.
+
+    A false positive is a passed check for a key that was never inserted, so the realized rate is
+    false positives / (false positives + rejected checks), i.e. the share of absent keys let through.
+    To tell those apart from keys that were inserted but have since been evicted or expired, the
+    fingerprints of a fixed 1 out of every _TRACK_SAMPLE keys are recorded on insert, and only checks
+    of those keys are counted. Passed checks that miss a previously inserted key are counted
+    separately as stale positives, and are left out of the realized rate.
+
+    ----- Notes -----
+    The tracked fingerprints grow by 8 bytes pr. _TRACK_SAMPLE distinct keys inserted.
+    """
+
+    __slots__ = ("rejected", "passed", "false_positives", "stale_positives", "tracked")
+
+    lock_type = RLock           # Lock each kind creates, recreated on unpickling
+
+    def __init__(self):
+        self.rejected = 0           # Checks answered 'definitely not present'
+        self.passed = 0             # Checks answered 'possibly present'
+        self.false_positives = 0    # Passed checks of keys never inserted
+        self.stale_positives = 0    # Passed checks of inserted keys since evicted or expired
+        self.tracked = set()        # Fingerprints of the sampled keys inserted so far
+
+    def record_insert(self, key: Any) -> None:
+        fingerprint = _fingerprint(key)
+        if fingerprint % _TRACK_SAMPLE == 0:
+            self.tracked.add(fingerprint)
+
+    def record_check(self, key: Any, passed: bool, hit: bool = False) -> None:
+        fingerprint = _fingerprint(key)
+        if fingerprint % _TRACK_SAMPLE:         # Key not tracked, its insert history is unknown
+            return
+        if not passed:
+            self.rejected += 1
+            return
+        self.passed += 1
+        if hit:
+            return
+        if fingerprint in self.tracked:
+            self.stale_positives += 1
+        else:
+            self.false_positives += 1
+
+    @property
+    def realized_fpr(self) -> float:
+        absent = self.false_positives + self.rejected
+        return self.false_positives / absent if absent else 0.0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {                            # Every slot except the lock, which is recreated on unpickling
+            name: getattr(self, name)
+            for klass in type(self).__mro__
+            for name in getattr(klass, "__slots__", ())
+            if name != "lock"
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.lock = self.lock_type()
+
+    @property
+    def bloom_metrics(self):
+        return {
+            "kind": type(self).__name__,
+            "target_fpr": self.probability,
+            "realized_fpr": self.realized_fpr,
+            "rejected": self.rejected,
+            "passed": self.passed,
+            "false_positives": self.false_positives,
+            "stale_positives": self.stale_positives,
+            "memory_bytes": self.nbytes
+        }
+
 # --------------- Bloom Filter Mechanism ---------------
 
-class BloomFilter(object):
+class BloomFilter(_BloomStats):
     """
     A thread-safe Bloom Filter implementation.
 
@@ -37,8 +149,9 @@ class BloomFilter(object):
     __slots__ = ("probability", "lock", "size", "hash_count", "bit_array")
 
     def __init__(self, items_count, probability):
+        super().__init__()
         self.probability = probability
-        self.lock = RLock()
+        self.lock = self.lock_type()
         self.size = self.get_size(items_count, probability)
         self.hash_count = self.get_hash_count(self.size, items_count)
         self.bit_array = bitarray(self.size)
@@ -99,6 +212,20 @@ class BloomFilter(object):
         """
         return mmh3.hash(item, seed)
 
+    @property
+    def nbytes(self) -> int:
+        return self.bit_array.nbytes
+
+    def __reduce_ex__(self, protocol):
+        """
+        Pickles the bit array as a raw buffer: out-of-band (zero-copy) with pickle protocol 5
+        and a buffer_callback, in-band bytes otherwise.
+        """
+        state = self.__getstate__()
+        del state["bit_array"]
+        bits = PickleBuffer(self.bit_array) if protocol >= 5 else self.bit_array.tobytes()
+        return (_rebuild_bloom_filter, (state, bits, self.bit_array.endian))
+
     @staticmethod
     def get_size(n, p):
         """
@@ -135,3 +262,14 @@ class BloomFilter(object):
         """
         k = (m/n) * math.log(2)
         return int(k)
+
+# --------------- Pickling Helpers ---------------
+
+def _rebuild_bloom_filter(state: Dict[str, Any], bits: Any, endian: str) -> BloomFilter:
+    bloom = BloomFilter.__new__(BloomFilter)
+    bloom.__setstate__(state)
+    buffer = memoryview(bits)
+    if buffer.readonly:                     # Out-of-band buffers may be handed back read-only
+        buffer = bytearray(buffer)
+    bloom.bit_array = bitarray(buffer=buffer, endian=endian)   # Padding bits past 'size' are never used
+    return bloom
@@ -0,0 +1,111 @@
+# --------------- Imports ---------------
+
+from macho.bloom_filter.bloom import BloomFilter, _BloomStats
+from macho.logging import get_logger
+
+from typing import Any, Dict, List
+from threading import Lock
+
+# --------------- Logging Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Scalable Bloom Filter ---------------
+
+class ScalableBloomFilter(_BloomStats):
+    """
+    A Bloom Filter that grows with the number of distinct items instead of degrading past its capacity.
+
+    Items are added to a series of Bloom Filters (stages). Once the newest stage holds its capacity,
+    a new stage is appended with 'growth' times the capacity and a 'tightening' times lower error rate.
+    The compounded false positive rate therefore stays below 'probability' however many stages exist.
+
+    ----- Parameters -----
+    Items_count: int
+        Capacity of the first stage.
+    Probability: float
+        Upper bound for the compounded false positive rate (must be between 0.0 - 1.0).
+    growth: int
+        Capacity multiplier pr. stage (Defaults to 2).
+    tightening: float
+        Error rate multiplier pr. stage, between 0.0 - 1.0 (Defaults to 0.5).
+
+    ----- Notes -----
+    - False Positives are possible, but not False Negatives.
+    - Memory grows with the number of distinct items ever added, the filter never forgets.
+    """
+
+    __slots__ = ("probability", "growth", "tightening", "lock", "stages", "capacities", "stage_count")
+
+    lock_type = Lock
+
+    def __init__(self, items_count: int, probability: float, growth: int = 2, tightening: float = 0.5):
+        if not isinstance(growth, int) or growth < 1:
+            raise ValueError("Parameter 'growth' must be a positive integer")
+        if not 0.00 < tightening < 1.00:
+            raise ValueError("Parameter 'tightening' must be between 0.00 - 1.00")
+
+        super().__init__()
+        self.probability = probability
+        self.growth = growth
+        self.tightening = tightening
+        self.lock = self.lock_type()
+        self.stages: List[BloomFilter] = []
+        self.capacities: List[int] = []
+        self.stage_count = 0                # Items added to the newest stage
+        self._add_stage(max(items_count, 1))
+
+    def _add_stage(self, capacity: int) -> None:
+        # Stage i uses p * (1 - r) * r^i, the geometric series sums to at most p
+        stage_probability = self.probability * (1 - self.tightening) * self.tightening ** len(self.stages)
+        self.stages.append(BloomFilter(capacity, stage_probability))
+        self.capacities.append(capacity)
+        self.stage_count = 0
+        logger.debug(f"Scalable Bloom filter grew to {len(self.stages)} stages")
+
+    def add(self, item: Any) -> None:
+        """
+        Add the desired item/value to the newest stage, unless it is (possibly) present already.
+
+        ----- Parameters -----
+        Item: Any
+            The item/value to add to the filter. MUST be convertible to string.
+        """
+        item = str(item)                    # Stages hash bytes-like items only, any cache key is accepted
+        with self.lock:
+            if self.check(item):            # Keeps the stage counts to distinct items
+                return
+            if self.stage_count >= self.capacities[-1]:
+                self._add_stage(self.capacities[-1] * self.growth)
+            self.stages[-1].add(item)
+            self.stage_count += 1
+
+    def check(self, item: Any) -> bool:
+        """
+        Check is the item/value possibly is present in any of the stages.
+
+        ----- Parameters -----
+        Item: Any
+            The item/value to check if exists in Filter. MUST be convertible to string.
+
+        ----- Return -----
+        Bool:
+            True - If the item/value is possibly present (Could be False Positive).
+            False - If the item/value is definitely NOT present in Filter.
+        """
+        item = str(item)
+        for stage in reversed(self.stages):         # Recent items are most likely in the newest stage
+            if stage.check(item):
+                return True
+        return False
+
+    @property
+    def nbytes(self) -> int:
+        return sum(stage.nbytes for stage in self.stages)
+
+    @property
+    def bloom_metrics(self) -> Dict[str, Any]:
+        metrics = super().bloom_metrics
+        metrics["stages"] = len(self.stages)
+        metrics["capacity"] = sum(self.capacities)
+        return metrics
@@ -0,0 +1,9 @@
+# --------------- Imports ---------------
+
+from .clock import CLOCK_KINDS, PRECISE_CLOCK, Clock, PreciseClock, CoarseClock, ManualClock, create_clock
+
+# --------------- Package Manager ---------------
+
+__all__ = ["CLOCK_KINDS", "PRECISE_CLOCK", "Clock", "PreciseClock", "CoarseClock", "ManualClock", "create_clock"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
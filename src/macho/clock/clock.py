@@ -0,0 +1,138 @@
+# --------------- Imports ---------------
+
+from itertools import repeat
+from threading import Event, Thread
+from typing import Any, Callable, Tuple, Union
+
+import time
+import weakref
+
+# --------------- Clocks ---------------
+#
+# Every clock exposes now(), returning seconds on a monotonic scale. Shards store expiry, creation
+# and access times on that scale, so every component comparing against them must share one clock.
+
+CLOCK_KINDS = ("precise", "coarse")
+
+class PreciseClock():
+    """
+    Reads time.monotonic() on every call, the default clock.
+    """
+
+    __slots__ = ()
+
+    kind = "precise"
+    now = staticmethod(time.monotonic)
+
+    def close(self) -> None:
+        pass
+
+    def __repr__(self):
+        return "<PreciseClock()>"
+
+class CoarseClock():
+    """
+    Serves a timestamp refreshed every 'resolution' seconds by a daemon ticker thread.
+
+    now() returns a cached float through a C-level callable, so reading it costs less than
+    time.monotonic(). Times lag real time by up to 'resolution', so entries may expire that
+    much late. The ticker stops on close(), or once the clock is garbage collected.
+
+    ----- Parameters -----
+    resolution: float
+        Seconds between timestamp refreshes (Defaults to 0.005).
+    """
+
+    __slots__ = ("resolution", "now", "stopped", "thread", "__weakref__")
+
+    kind = "coarse"
+
+    def __init__(self, resolution: float = 0.005):
+        if not isinstance(resolution, float):
+            raise TypeError("Parameter 'resolution' must be of type: float")
+        if not resolution > 0:
+            raise ValueError("Resolution value must be positive")
+
+        self.resolution = resolution
+        self.now: Callable[[], float] = repeat(time.monotonic()).__next__
+        self.stopped = Event()
+        self.thread = Thread(
+            target=_tick, args=(weakref.ref(self), self.stopped, resolution), name="macho-clock", daemon=True
+        )
+        self.thread.start()
+
+    def close(self) -> None:
+        self.stopped.set()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (CoarseClock, (self.resolution,))        # The copy runs its own ticker
+
+    def __repr__(self):
+        return f"<CoarseClock(resolution={self.resolution})>"
+
+def _tick(clock_ref: "weakref.ref[CoarseClock]", stopped: Event, resolution: float) -> None:
+    while not stopped.wait(resolution):
+        clock = clock_ref()
+        if clock is None:
+            return
+        clock.now = repeat(time.monotonic()).__next__      # Swapping the callable is a single atomic store
+        del clock
+
+class ManualClock():
+    """
+    A virtual clock only moved by advance() or set(), for deterministic tests and simulations.
+
+    ----- Parameters -----
+    start: float
+        Initial time, portrayed in seconds (Defaults to 0.0).
+    """
+
+    __slots__ = ("time",)
+
+    kind = "manual"
+
+    def __init__(self, start: float = 0.0):
+        if not isinstance(start, float):
+            raise TypeError("Parameter 'start' must be of type: float")
+
+        self.time = start
+
+    def now(self) -> float:
+        return self.time
+
+    def advance(self, seconds: float) -> float:
+        """
+        Moves the clock forward by 'seconds', returning the new time.
+        """
+        if seconds < 0:
+            raise ValueError("A monotonic clock cannot move backwards")
+        self.time += seconds
+        return self.time
+
+    def set(self, time: float) -> None:
+        if time < self.time:
+            raise ValueError("A monotonic clock cannot move backwards")
+        self.time = time
+
+    def close(self) -> None:
+        pass
+
+    def __repr__(self):
+        return f"<ManualClock(time={self.time})>"
+
+Clock = Union[PreciseClock, CoarseClock, ManualClock]
+
+PRECISE_CLOCK = PreciseClock()      # Stateless, shared by every cache using the default clock
+
+def create_clock(kind: Union[str, Clock], resolution: float = 0.005) -> Clock:
+    """
+    Returns the clock for 'kind': 'precise', 'coarse' (ticking every 'resolution' seconds)
+    or an existing clock instance, returned as-is (e.g. a ManualClock).
+    """
+    if isinstance(kind, (PreciseClock, CoarseClock, ManualClock)):
+        return kind
+    if kind == "coarse":
+        return CoarseClock(resolution)
+    if kind == "precise":
+        return PRECISE_CLOCK
+    raise ValueError(f"Clock must be one of: {', '.join(CLOCK_KINDS)} or a clock instance")
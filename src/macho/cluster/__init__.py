@@ -0,0 +1,10 @@
+# --------------- Imports ---------------
+
+from .ring import HashRing
+from .client import ClusterClient, ConnectionPool, parse_node
+
+# --------------- Package Manager ---------------
+
+__all__ = ["HashRing", "ClusterClient", "ConnectionPool", "parse_node"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
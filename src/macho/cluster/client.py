@@ -0,0 +1,383 @@
+# --------------- Imports ---------------
+
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Connection
+from threading import Lock
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from macho.cluster.ring import HashRing
+from macho.errors import ClusterException
+from macho.logging import get_logger
+
+import time
+
+# --------------- Logger Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Node Addresses ---------------
+
+def parse_node(node: Union[str, Tuple[str, int]]) -> Tuple[str, Tuple[str, int]]:
+    """
+    Returns the node's ring name ('host:port') and socket address from either form.
+    """
+    if isinstance(node, tuple):
+        host, port = node
+    elif isinstance(node, str) and ":" in node:
+        host, port = node.rsplit(":", 1)
+    else:
+        raise ValueError(f"Node {node!r} must be 'host:port' or a (host, port) tuple")
+    return f"{host}:{int(port)}", (host, int(port))
+
+# --------------- Connection Pool ---------------
+
+class ConnectionPool():
+    """
+    Keeps up to 'size' idle, authenticated connections to a single server open for reuse.
+
+    ----- Parameters -----
+    address: Tuple[str, int]
+        The server's (host, port).
+    authkey: bytes
+        Shared secret, every connection is authenticated with an HMAC challenge.
+    size: int
+        Maximum number of idle connections kept, extra connections are closed on release (Defaults to 4).
+    """
+
+    __slots__ = ("address", "authkey", "size", "idle", "lock", "opened")
+
+    def __init__(self, address: Tuple[str, int], authkey: bytes, size: int = 4):
+        self.address = address
+        self.authkey = authkey
+        self.size = size
+        self.idle: List[Connection] = []
+        self.lock = Lock()
+        self.opened = 0
+
+    def acquire(self) -> Tuple[Connection, bool]:
+        """
+        Returns an idle connection, or a new one if none is idle, and whether it was reused.
+        """
+        with self.lock:
+            if self.idle:
+                return self.idle.pop(), True
+        return self.connect()
+
+    def connect(self) -> Tuple[Connection, bool]:
+        connection = Client(self.address, family="AF_INET", authkey=self.authkey)
+        with self.lock:
+            self.opened += 1
+        return connection, False
+
+    def release(self, connection: Connection) -> None:
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self.lock:
+            idle, self.idle = self.idle, []
+        for connection in idle:
+            connection.close()
+
+    def __repr__(self):
+        return f"<ConnectionPool(address={self.address}, idle={len(self.idle)}, opened={self.opened})>"
+
+# --------------- Cluster Client ---------------
+
+class ClusterClient():
+    """
+    Client-side partitioning across several 'macho.server' nodes.
+
+    Keys are mapped onto the nodes by a consistent-hash ring. add_many() & get_many() group their keys
+    by owner and send a single batch pr. node, writing every batch before reading any response, so a
+    request costs one round-trip to the slowest node instead of one pr. key. With 'replicas' above 1
+    every key is written to that many distinct nodes. Reads go to the primary owner, keys it cannot
+    answer (node down, or restarted & empty) are read from the next replica, and found values are
+    written back to the owners that missed them (read-repair).
+
+    ----- Parameters -----
+    nodes: Sequence[Union[str, Tuple[str, int]]]
+        Server addresses, as 'host:port' or (host, port).
+    authkey: bytes
+        Shared secret of the servers.
+    replicas: int
+        Distinct nodes holding every key, capped at the node count (Defaults to 1).
+    vnodes: int
+        Ring points pr. node (Defaults to 128).
+    pool_size: int
+        Idle connections kept open pr. node (Defaults to 4).
+    timeout: float
+        Seconds to wait for a node's response before treating it as down (Defaults to 5.0).
+    retry_interval: float
+        Seconds a failed node is skipped before it is tried again (Defaults to 1.0).
+
+    ----- Exceptions -----
+    TypeError
+        Raised if authkey is not bytes.
+    ValueError
+        Raised if no nodes are given or numerical values are out of range.
+
+    ----- Notes -----
+    Requests & values are pickled. The authkey keeps unauthenticated peers out, but servers should
+    only listen on trusted networks.
+    """
+
+    __slots__ = (
+        "ring",
+        "addresses",
+        "authkey",
+        "replicas",
+        "pools",
+        "timeout",
+        "retry_interval",
+        "down",
+        "lock",
+        "requests",
+        "failovers",
+        "repairs",
+        "errors"
+    )
+
+    def __init__(
+            self,
+            nodes: Sequence[Union[str, Tuple[str, int]]],
+            authkey: bytes,
+            replicas: int = 1,
+            vnodes: int = 128,
+            pool_size: int = 4,
+            timeout: float = 5.0,
+            retry_interval: float = 1.0
+        ):
+        if not nodes:
+            raise ValueError("Parameter 'nodes' must hold at least one node")
+        if not isinstance(authkey, bytes):
+            raise TypeError("Parameter 'authkey' must be of type: bytes")
+        if not isinstance(replicas, int) or replicas <= 0:
+            raise ValueError("Parameter 'replicas' must be a positive integer")
+        if not isinstance(pool_size, int) or pool_size <= 0:
+            raise ValueError("Parameter 'pool_size' must be a positive integer")
+        if not timeout > 0:
+            raise ValueError("Timeout value must be positive")
+        if retry_interval < 0:
+            raise ValueError("Retry interval value must not be negative")
+
+        self.addresses: Dict[str, Tuple[str, int]] = dict(parse_node(node) for node in nodes)
+        self.ring = HashRing(list(self.addresses), vnodes)
+        self.authkey = authkey
+        self.replicas = min(replicas, len(self.addresses))
+        self.pools = {name: ConnectionPool(address, authkey, pool_size) for name, address in self.addresses.items()}
+        self.timeout = timeout
+        self.retry_interval = retry_interval
+        self.down: Dict[str, float] = {}        # Node -> monotonic time it may be tried again
+        self.lock = Lock()
+        self.requests = 0
+        self.failovers = 0
+        self.repairs = 0
+        self.errors = 0
+
+    # ----- Transport -----
+
+    def _available(self, node: str) -> bool:
+        retry_at = self.down.get(node)
+        return retry_at is None or time.monotonic() >= retry_at
+
+    def _mark_down(self, node: str, error: BaseException) -> None:
+        with self.lock:
+            self.errors += 1
+            self.down[node] = time.monotonic() + self.retry_interval
+        logger.warning(f"Cluster node {node} failed: {error!r}")
+
+    def _call_many(self, batches: Dict[str, Tuple[str, Any]]) -> Dict[str, Any]:
+        """
+        Sends one (command, payload) request to every node, then collects the responses.
+
+        ----- Return -----
+        Dict[str, Any]:
+            Result pr. node that answered, nodes that are down or failed are left out.
+
+        ----- Exceptions -----
+        ClusterException
+            Raised if a node rejected the authkey or answered with an error, once every response was read.
+        """
+        sent: List[Tuple[str, Tuple[str, Any], Connection, bool]] = []
+        rejected: List[str] = []
+        for node, request in batches.items():
+            if self._available(node):
+                try:
+                    connection = self._send(node, request)
+                except AuthenticationError as error:
+                    rejected.append(f"{node}: {error}")
+                    continue
+                if connection is not None:
+                    sent.append((node, request) + connection)
+
+        results: Dict[str, Any] = {}
+        for node, request, connection, reused in sent:
+            response = self._receive(node, request, connection, reused)
+            if response is None:
+                continue
+            status, result = response
+            if status == "ok":
+                results[node] = result
+            else:
+                rejected.append(f"{node}: {result}")
+        if rejected:            # Raised after the loop, so no pooled connection is left holding a response
+            raise ClusterException(f"Request rejected by {'; '.join(rejected)}")
+        return results
+
+    def _send(self, node: str, request: Tuple[str, Any], fresh: bool = False) -> Optional[Tuple[Connection, bool]]:
+        pool = self.pools[node]
+        try:
+            connection, reused = pool.connect() if fresh else pool.acquire()
+        except (OSError, EOFError) as error:
+            self._mark_down(node, error)
+            return None
+        try:
+            connection.send(request)
+        except (OSError, EOFError, ValueError) as error:
+            connection.close()
+            if reused:          # Pooled connections go stale once the server restarts, retry on a new one
+                pool.close()
+                return self._send(node, request, fresh=True)
+            self._mark_down(node, error)
+            return None
+        return connection, reused
+
+    def _receive(self, node: str, request: Tuple[str, Any], connection: Connection, reused: bool) -> Optional[Tuple[str, Any]]:
+        try:
+            if not connection.poll(self.timeout):
+                raise TimeoutError(f"No response within {self.timeout}s")
+            response = connection.recv()
+        except (OSError, EOFError) as error:
+            connection.close()
+            if reused and not isinstance(error, TimeoutError):      # Requests are idempotent, resending is safe
+                self.pools[node].close()
+                sent = self._send(node, request, fresh=True)
+                return None if sent is None else self._receive(node, request, *sent)
+            self._mark_down(node, error)
+            return None
+        self.pools[node].release(connection)
+        with self.lock:
+            self.requests += 1
+            self.down.pop(node, None)
+        return response
+
+    # ----- Cache operations -----
+
+    def add(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> None:
+        self.add_many([(key, value)], cost, size)
+
+    def add_many(self, items: Union[Dict[Any, Any], Iterable[Tuple[Any, Any]]], cost: float = 1.0, size: int = 0) -> None:
+        """
+        Writes every key-value pair to its 'replicas' owners, in one batch pr. node.
+
+        ----- Exceptions -----
+        ClusterException
+            Raised if none of a key's owners could be written to.
+        """
+        pairs = list(items.items()) if isinstance(items, dict) else list(items)
+        batches: Dict[str, List[Tuple[Any, Any, float, int]]] = {}
+        owners: List[List[str]] = []
+        for key, value in pairs:
+            key_owners = self.ring.owners(key, self.replicas)
+            owners.append(key_owners)
+            for node in key_owners:
+                batches.setdefault(node, []).append((key, value, cost, size))
+
+        written = self._call_many({node: ("add", batch) for node, batch in batches.items()})
+        for (key, _), key_owners in zip(pairs, owners):
+            if not any(node in written for node in key_owners):
+                raise ClusterException(f"No owner of key {key!r} is reachable: {', '.join(key_owners)}")
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self.get_many([key]).get(key, default)
+
+    def get_many(self, keys: Iterable[Any]) -> Dict[Any, Any]:
+        """
+        Reads the keys from their owners, in one batch pr. node and replica rank.
+
+        ----- Return -----
+        Dict[Any, Any]:
+            The values found, keys missing on every reachable owner are left out.
+        """
+        pending = {key: self.ring.owners(key, self.replicas) for key in dict.fromkeys(keys)}
+        found: Dict[Any, Any] = {}
+        missed: Dict[Any, List[str]] = {key: [] for key in pending}     # Live owners that did not hold the key
+
+        for rank in range(self.replicas):
+            batches: Dict[str, List[Any]] = {}
+            for key, key_owners in pending.items():
+                if rank < len(key_owners):
+                    batches.setdefault(key_owners[rank], []).append(key)
+            if not batches:
+                break
+            results = self._call_many({node: ("get", batch) for node, batch in batches.items()})
+            for node, batch in batches.items():
+                answer = results.get(node)
+                for key in batch:
+                    if answer is not None and key in answer:
+                        found[key] = answer[key]
+                        del pending[key]
+                    elif answer is not None:
+                        missed[key].append(node)
+            if rank + 1 < self.replicas and pending:
+                with self.lock:
+                    self.failovers += len(pending)
+
+        self._repair(found, missed)
+        return found
+
+    def _repair(self, found: Dict[Any, Any], missed: Dict[Any, List[str]]) -> None:
+        batches: Dict[str, List[Tuple[Any, Any, float, int]]] = {}
+        for key, value in found.items():
+            for node in missed[key]:
+                batches.setdefault(node, []).append((key, value, 1.0, 0))
+        if batches:
+            self._call_many({node: ("add", batch) for node, batch in batches.items()})
+            with self.lock:
+                self.repairs += sum(len(batch) for batch in batches.values())
+
+    def clear(self) -> None:
+        self._call_many({node: ("clear", None) for node in self.addresses})
+
+    def ping(self) -> Dict[str, Any]:
+        """
+        Returns the info of every reachable node.
+        """
+        return self._call_many({node: ("ping", None) for node in self.addresses})
+
+    def node_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns Cache.get_metrics() of every reachable node.
+        """
+        return self._call_many({node: ("metrics", None) for node in self.addresses})
+
+    @property
+    def cluster_metrics(self) -> Dict[str, Any]:
+        return {
+            "nodes": list(self.addresses),
+            "replicas": self.replicas,
+            "down": [node for node in self.addresses if not self._available(node)],
+            "ownership": {node: round(share, 4) for node, share in self.ring.distribution().items()},
+            "requests": self.requests,
+            "failovers": self.failovers,
+            "repairs": self.repairs,
+            "errors": self.errors,
+            "connections_opened": {node: pool.opened for node, pool in self.pools.items()}
+        }
+
+    def close(self) -> None:
+        for pool in self.pools.values():
+            pool.close()
+
+    def __enter__(self) -> "ClusterClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f"<ClusterClient(nodes={len(self.addresses)}, replicas={self.replicas})>"
@@ -0,0 +1,87 @@
+# --------------- Imports ---------------
+
+from bisect import bisect_right
+from typing import Any, Dict, List, Sequence
+
+from macho.trace import hash_key
+
+# --------------- Consistent-hash Ring ---------------
+
+class HashRing():
+    """
+    Consistent-hash ring mapping keys onto cluster nodes.
+
+    Every node is placed on the 64-bit ring at 'vnodes' points. A key belongs to the first node found
+    clockwise from its own hash, and its replicas to the next distinct nodes. Adding or removing a node
+    therefore only moves the keys of the ring slices it gains or loses, about 1 / nodes of the keys.
+
+    ----- Parameters -----
+    nodes: Sequence[str]
+        Node names, e.g. '127.0.0.1:7001'.
+    vnodes: int
+        Points pr. node, more points spread keys more evenly (Defaults to 128).
+
+    ----- Notes -----
+    Keys are hashed like trace records (hash_key() of str(key)), so every client agrees on the owners.
+    """
+
+    __slots__ = ("vnodes", "nodes", "points", "owners_at")
+
+    def __init__(self, nodes: Sequence[str], vnodes: int = 128):
+        if not isinstance(vnodes, int) or vnodes <= 0:
+            raise ValueError("Parameter 'vnodes' must be a positive integer")
+        self.vnodes = vnodes
+        self.nodes: List[str] = []
+        self.points: List[int] = []         # Sorted ring positions
+        self.owners_at: List[str] = []      # Node owning each position
+        for node in nodes:
+            self.add_node(node)
+
+    def _rebuild(self) -> None:
+        ring = sorted((hash_key(f"{node}#{index}"), node) for node in self.nodes for index in range(self.vnodes))
+        self.points = [point for point, _ in ring]
+        self.owners_at = [node for _, node in ring]
+
+    def add_node(self, node: str) -> None:
+        if node in self.nodes:
+            raise ValueError(f"Node {node} is already part of the ring")
+        self.nodes.append(node)
+        self._rebuild()
+
+    def remove_node(self, node: str) -> None:
+        self.nodes.remove(node)
+        self._rebuild()
+
+    def owners(self, key: Any, count: int = 1) -> List[str]:
+        """
+        Returns the 'count' distinct nodes responsible for the key, primary first.
+        """
+        if not self.nodes:
+            raise ValueError("The ring holds no nodes")
+        count = min(count, len(self.nodes))
+        index = bisect_right(self.points, hash_key(key))
+        owners: List[str] = []
+        for offset in range(len(self.points)):
+            node = self.owners_at[(index + offset) % len(self.points)]
+            if node not in owners:
+                owners.append(node)
+                if len(owners) == count:
+                    break
+        return owners
+
+    def distribution(self) -> Dict[str, float]:
+        """
+        Share of the ring owned by every node (primary ownership).
+        """
+        shares = dict.fromkeys(self.nodes, 0.0)
+        span = float(1 << 64)
+        for index, point in enumerate(self.points):
+            previous = self.points[index - 1] if index else self.points[-1] - (1 << 64)
+            shares[self.owners_at[index]] += (point - previous) / span
+        return shares
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def __repr__(self):
+        return f"<HashRing(nodes={len(self.nodes)}, vnodes={self.vnodes})>"
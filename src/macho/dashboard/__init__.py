@@ -1,9 +1,41 @@
 # --------------- Imports ---------------
 
-from .launcher import JSON_DATA_PATH, load_from_json, launch_dashboard, save_to_memory
+from importlib import import_module
+
+# --------------- Lazy Submodules ---------------
+
+_LAZY_IMPORTS = {
+    "JSON_DATA_PATH": ".launcher",
+    "load_from_json": ".launcher",
+    "launch_dashboard": ".launcher",
+    "save_to_memory": ".launcher",
+    "STREAM_DATA_PATH": ".stream",
+    "MetricsStreamer": ".stream",
+    "MetricsStreamReader": ".stream",
+    "is_live_mode": ".stream"
+}
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 # --------------- Package Manager ---------------
 
-__all__ = ["JSON_DATA_PATH", "load_from_json", "launch_dashboard", "save_to_memory"]
+__all__ = [
+    "JSON_DATA_PATH",
+    "load_from_json",
+    "launch_dashboard",
+    "save_to_memory",
+    "STREAM_DATA_PATH",
+    "MetricsStreamer",
+    "MetricsStreamReader",
+    "is_live_mode"
+]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
@@ -2,13 +2,13 @@
 
 from macho.logging import get_logger
 from macho.main import Cache
+from macho.dashboard.stream import MetricsStreamer
 
 from typing import Dict, Any, Union, List
 
-import streamlit.web.cli as stcli
-
 import json
 import os
+import subprocess
 import tempfile
 import sys
 
@@ -42,19 +42,61 @@ def save_to_memory(data: Union[Dict, List[Dict]]) -> None:
     with open(JSON_DATA_PATH, "w", encoding='utf-8') as file:
         json.dump(data, file, ensure_ascii=False, indent=2)
 
-def launch_dashboard(cache: Cache) -> None:
+def launch_dashboard(cache: Cache, live: bool = False, interval: float = 1.0) -> Union[None, MetricsStreamer]:
+    """
+    Launches the Streamlit metrics dashboard for the given cache.
+
+    ----- Parameters -----
+    cache: Cache
+        The cache-object to visualise.
+    live: bool
+        If False, the current metrics are dumped once and Streamlit takes over the process.
+        If True, metric deltas are streamed to a ring file of this launch (a new temporary file, passed
+        to the dashboard through $MACHO_CACHE_STREAM_PATH) while Streamlit runs in a subprocess, and the
+        call returns so the application can keep using the cache (Defaults to False).
+    interval: float
+        Seconds between streamed records and dashboard refreshes in live mode (Defaults to 1.0).
+
+    ----- Return -----
+    Union[None, MetricsStreamer]
+        The running streamer in live mode, stop() also terminates the dashboard & removes the stream file.
+
+    ----- Exceptions -----
+    ImportError
+        Raised if the 'dashboard' extra (streamlit, pandas, plotly) is not installed.
+    """
     if not isinstance(cache, Cache):
         raise TypeError(f"Paramter 'cache' must be of Type: Cache, not {type(cache)}")
-    
-    macho_cache_metrics = cache.metrics
-    
-    save_to_memory(macho_cache_metrics)
+
+    try:
+        import streamlit.web.cli as stcli       # Imported on demand, the dashboard is an optional extra
+    except ImportError as e:
+        raise ImportError("The Macho dashboard requires the optional extra: pip install 'macho[dashboard]'") from e
 
     # Runs the Streamlit server from a subprocess
     script_path = os.path.abspath(__file__)
     dsh_dir = os.path.dirname(script_path)
     final_path = os.path.join(dsh_dir, "dashboard.py")
 
+    if live:
+        # Every launch streams to its own file, concurrent processes & dashboards never share one
+        file_descriptor, stream_path = tempfile.mkstemp(prefix="macho_cache_stream_", suffix=".jsonl")
+        os.close(file_descriptor)
+        streamer = MetricsStreamer(cache, path=stream_path, interval=interval).start()
+        env = dict(
+            os.environ,
+            MACHO_DASHBOARD_LIVE="1",
+            MACHO_DASHBOARD_INTERVAL=str(interval),
+            MACHO_CACHE_STREAM_PATH=stream_path
+        )
+        logger.debug(f"Launching live Streamlit dashboard from path {final_path}")
+        streamer.process = subprocess.Popen([sys.executable, "-m", "streamlit", "run", final_path], env=env)
+        return streamer
+    
+    macho_cache_metrics = cache.metrics
+    
+    save_to_memory(macho_cache_metrics)
+
     logger.debug(f"Launching Streamlit dashboard from path {final_path}")
 
     sys.argv = ["streamlit", "run", final_path]
@@ -1,82 +1,108 @@
 # --------------- Imports ---------------
 
-from macho.dashboard import load_from_json
+from macho.dashboard import load_from_json, is_live_mode, MetricsStreamReader
 
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+import os
+
 # --------------- Requests Metrics ---------------
 
 st.title("Cache Requests Data 📚")
 st.divider()
 st.subheader("Metrics & Data visualisation regarding total requests made towards the Cache.")
 
-# Access stored cache in Session State
-try:
-    if "macho_metrics" not in st.session_state:
-        st.session_state["macho_metrics"] = load_from_json()
-
-    macho_cache_metrics = st.session_state["macho_metrics"]
-except Exception as e:
-    st.error(f"Failed ot load cache {e}")
-    st.stop()
-
-if macho_cache_metrics is None:
-    st.error("No metrics found in current session state")
-elif not isinstance(macho_cache_metrics, (dict, list)):
-    st.error("The obejct currently in Session State is not a valid Cache-object")
-else:
-    if isinstance(macho_cache_metrics, list):
-        st.subheader("Shared Cache Metrics")
-
-        shard_df = pd.DataFrame([
-            {
-                "Shard": index,
-                "Hit Ratio": shard["hit_ratio"],
-                "Hits": shard["hits"],
-                "Misses": shard["misses"],
-                "Evictions": shard["evictions"]
-            }
-            for index, shard in enumerate(macho_cache_metrics)
-        ])
-
-        st.plotly_chart(px.bar(
-            shard_df,
-            x="Shard",
-            y=["Hits", "Misses", "Evictions"],
-            barmode="group",
-            title="Cache activity pr. Caching System"
-        ))
-
-        st.plotly_chart(px.line(
-            shard_df,
-            x="Shard",
-            y="Hit Ratio",
-            title="Hit ratio pr. second"
-        ))
-
+def render_requests(macho_cache_metrics):
+    if macho_cache_metrics is None:
+        st.error("No metrics found in current session state")
+    elif not isinstance(macho_cache_metrics, (dict, list)):
+        st.error("The obejct currently in Session State is not a valid Cache-object")
     else:
-        st.subheader("Single Cache Metrics")
-
-        single_df = pd.DataFrame([{
-            "Hits": macho_cache_metrics["hits"],
-            "Misses": macho_cache_metrics["misses"],
-            "Evictions": macho_cache_metrics["evictions"],
-            "Hit Ratio": macho_cache_metrics["hit_ratio"]
-        }])
-
-        st.plotly_chart(px.bar(
-            single_df.melt(var_name="Metric", value_name="Value"),
-            x="Metric",
-            y="Value",
-            title="Single Cachen Operations"
-        ))
-
-
-
-
-
-
+        if isinstance(macho_cache_metrics, list):
+            st.subheader("Shared Cache Metrics")
+
+            shard_df = pd.DataFrame([
+                {
+                    "Shard": index,
+                    "Hit Ratio": shard["hit_ratio"],
+                    "Hits": shard["hits"],
+                    "Misses": shard["misses"],
+                    "Evictions": shard["evictions"]
+                }
+                for index, shard in enumerate(macho_cache_metrics)
+            ])
+
+            st.plotly_chart(px.bar(
+                shard_df,
+                x="Shard",
+                y=["Hits", "Misses", "Evictions"],
+                barmode="group",
+                title="Cache activity pr. Caching System"
+            ))
+
+            st.plotly_chart(px.line(
+                shard_df,
+                x="Shard",
+                y="Hit Ratio",
+                title="Hit ratio pr. second"
+            ))
+
+        else:
+            st.subheader("Single Cache Metrics")
+
+            single_df = pd.DataFrame([{
+                "Hits": macho_cache_metrics["hits"],
+                "Misses": macho_cache_metrics["misses"],
+                "Evictions": macho_cache_metrics["evictions"],
+                "Hit Ratio": macho_cache_metrics["hit_ratio"]
+            }])
+
+            st.plotly_chart(px.bar(
+                single_df.melt(var_name="Metric", value_name="Value"),
+                x="Metric",
+                y="Value",
+                title="Single Cachen Operations"
+            ))
+
+def render_history(history):     # Requests pr. streamed interval, only available in live mode
+    if not history:
+        return
+    history_df = pd.DataFrame(list(history))
+    history_df["Time"] = pd.to_datetime(history_df["time"], unit="s")
+    st.plotly_chart(px.line(
+        history_df.rename(columns={"hits": "Hits", "misses": "Misses", "evictions": "Evictions"}),
+        x="Time",
+        y=["Hits", "Misses", "Evictions"],
+        title="Cache activity pr. interval"
+    ))
+
+# Live mode polls the metric stream and only applies new deltas, otherwise the static dump is loaded once
+if is_live_mode():
+    @st.fragment(run_every=float(os.environ.get("MACHO_DASHBOARD_INTERVAL", "1.0")))
+    def live_requests():
+        if "macho_stream" not in st.session_state:
+            st.session_state["macho_stream"] = MetricsStreamReader()
+        reader = st.session_state["macho_stream"]
+        reader.poll()
+        if not reader.shards:
+            st.info(f"Waiting for metrics stream at {reader.path}")
+            return
+        st.caption(f"Live - record #{reader.sequence}")
+        render_history(reader.history)
+        render_requests(reader.metrics())
+
+    live_requests()
+else:
+    # Access stored cache in Session State
+    try:
+        if "macho_metrics" not in st.session_state:
+            st.session_state["macho_metrics"] = load_from_json()
 
+        macho_cache_metrics = st.session_state["macho_metrics"]
+    except Exception as e:
+        st.error(f"Failed ot load cache {e}")
+        st.stop()
 
+    render_requests(macho_cache_metrics)
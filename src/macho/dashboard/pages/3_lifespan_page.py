@@ -1,6 +1,6 @@
 # --------------- Imports ---------------
 
-from macho.dashboard import load_from_json
+from macho.dashboard import load_from_json, is_live_mode, MetricsStreamReader
 
 from macho.errors import MetricsLifespanException
 
@@ -8,149 +8,197 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+import os
+
 # --------------- Lifespan Metrics ---------------
 
 st.title("Entry Lifespan Data ⌛")
 st.divider()
 st.subheader("Metrics & Data visualisation regarding individual and overall lifespan of caching entries.")
 
-# Access stored cache in Session State
-try:
-    if "macho_metrics" not in st.session_state:
-        st.session_state["macho_metrics"] = load_from_json()
-
-    macho_cache_metrics = st.session_state["macho_metrics"]
-except Exception as e:
-    st.error(f"Failed ot load cache {e}")
-    st.stop()
-
-# Manage Streamlit tabs
-tabs = st.tabs(["📊 Summary", "📉 Histogram", "📦 Box Plot"])
-
-if macho_cache_metrics is None:
-    st.error("No metrics found in current session state")
-elif not isinstance(macho_cache_metrics, (dict, list)):
-    st.error("The object currently in Session State is not a valid Cache-object")
-else:
-    if isinstance(macho_cache_metrics, list): # Shared Cache
-
-        try:
-            lifespan_data = [shard["lifespan_metrics"] for shard in macho_cache_metrics]
-            all_lifespans = [
-                {"Shard": i, "Lifespan": val}
-                for i, shard in enumerate(lifespan_data)
-                for val in shard["all_lifespans"]
-            ]
-        except MetricsLifespanException as e:
-            st.error(f"No lifespan data currently available {e}")
-        else:
-            shard_df = pd.DataFrame([
-                {
-                    "Shard": index,
-                    "Max": data["max"],
-                    "Min": data["min"],
-                    "Count": data["count"],
-                    "Total": data["total"],
-                    "Average": data["average"],
-                    "Median": data["median"]
-                }
-                for index, data in enumerate(lifespan_data)
-            ])
-
-            with tabs[0]:
-                st.subheader("Summary of Lifespan Metrics")
-                st.dataframe(shard_df)
-                st.plotly_chart(px.bar(
-                    shard_df.melt(id_vars="Shard", var_name="Metric", value_name="Value"),
-                    x="Shard",
-                    y="Value",
-                    color="Metric",
-                    barmode="group",
-                    title="Lifespan Metrics pr. Shard"
-                ))
-
-                with st.expander("View Raw Summary Table"):
+SUMMARY_COLUMNS = {"max": "Max", "min": "Min", "count": "Count", "total": "Total", "average": "Average", "median": "Median"}
+
+def bucket_frame(buckets, **columns) -> pd.DataFrame:
+    """
+    Turns [low, high, count] histogram buckets into one row pr. bucket, placed at the bucket midpoint.
+    """
+    return pd.DataFrame([
+        {**columns, "Lifespan": (low + high) / 2, "Entries": count}
+        for low, high, count in buckets
+    ], columns=[*columns, "Lifespan", "Entries"])
+
+def lifecycle_frame(lifecycle, **columns) -> pd.DataFrame:
+    """
+    One row pr. lifecycle distribution (lifespan, idle time, time-to-first-hit & hits pr. entry).
+    """
+    return pd.DataFrame([
+        {**columns, "Distribution": name.replace("_", " ").capitalize(), **{
+            label.capitalize(): lifecycle[name][label] for label in ("count", "mean", "p50", "p90", "p99", "max")
+        }}
+        for name in ("lifespan", "idle_time", "time_to_first_hit", "hits_per_entry")
+    ])
+
+def removal_frame(lifecycle, **columns) -> pd.DataFrame:
+    return pd.DataFrame([
+        {**columns, "Removed by": "Capacity (evicted)", "Entries": lifecycle["evicted"]},
+        {**columns, "Removed by": "TTL (expired)", "Entries": lifecycle["expired"]}
+    ])
+
+def render_lifespan(macho_cache_metrics):
+    # Manage Streamlit tabs
+    tabs = st.tabs(["📊 Summary", "📉 Histogram", "⏳ Lifecycle"])
+
+    if macho_cache_metrics is None:
+        st.error("No metrics found in current session state")
+    elif not isinstance(macho_cache_metrics, (dict, list)):
+        st.error("The object currently in Session State is not a valid Cache-object")
+    else:
+        if isinstance(macho_cache_metrics, list): # Shared Cache
+
+            try:
+                lifespan_data = [shard["lifespan_metrics"] for shard in macho_cache_metrics]
+                lifecycle_data = [shard["lifecycle"] for shard in macho_cache_metrics]
+            except (KeyError, MetricsLifespanException) as e:
+                st.error(f"No lifespan data currently available {e}")
+            else:
+                shard_df = pd.DataFrame([
+                    {"Shard": index, **{label: data[key] for key, label in SUMMARY_COLUMNS.items()}}
+                    for index, data in enumerate(lifespan_data)
+                ])
+
+                with tabs[0]:
+                    st.subheader("Summary of Lifespan Metrics")
                     st.dataframe(shard_df)
+                    st.plotly_chart(px.bar(
+                        shard_df.melt(id_vars="Shard", var_name="Metric", value_name="Value"),
+                        x="Shard",
+                        y="Value",
+                        color="Metric",
+                        barmode="group",
+                        title="Lifespan Metrics pr. Shard"
+                    ))
 
-            with tabs[1]:
-                st.subheader("Distribution of Lifespan Metrics")
-                lfsp_data = pd.DataFrame(all_lifespans)
-                st.dataframe(lfsp_data)
-                bins = st.slider("Number of bins", min_value=10, max_value=100, value=30)
-                st.plotly_chart(px.histogram(
-                    lfsp_data,
-                    x="Lifespan",
-                    color="Shard",
-                    nbins=bins,
-                    barmode="overlay",
-                    opacity=0.6,
-                    title="Entry Lifespan Distribution pr. shard"
-                ))
-
-                if st.checkbox("Show Raw Lifespan Data"):
-                    st.dataframe(lfsp_data)
-
-            with tabs[2]:
-                st.subheader("Box Plot pr. Shard")
-                st.plotly_chart(px.box(
-                    lfsp_data,
-                    x="Shard",
-                    y="Lifespan",
-                    points="outliers",
-                    title="Lifespan Spread pr. Shard"
-                ))
+                    with st.expander("View Raw Summary Table"):
+                        st.dataframe(shard_df)
+
+                with tabs[1]:
+                    st.subheader("Distribution of Lifespan Metrics")
+                    lfsp_data = pd.concat(
+                        [bucket_frame(data["buckets"], Shard=index) for index, data in enumerate(lifespan_data)],
+                        ignore_index=True
+                    )
+                    if not lfsp_data.empty:
+                        st.plotly_chart(px.bar(
+                            lfsp_data,
+                            x="Lifespan",
+                            y="Entries",
+                            color="Shard",
+                            log_x=True,
+                            opacity=0.6,
+                            title="Entry Lifespan Distribution pr. shard",
+                            labels={"Lifespan": "Lifespan (s)"}
+                        ))
+
+                    if st.checkbox("Show Raw Lifespan Data"):
+                        st.dataframe(lfsp_data)
+
+                with tabs[2]:
+                    st.subheader("Entry Lifecycle pr. Shard")
+                    st.plotly_chart(px.bar(
+                        pd.concat(
+                            [removal_frame(data, Shard=index) for index, data in enumerate(lifecycle_data)],
+                            ignore_index=True
+                        ),
+                        x="Shard",
+                        y="Entries",
+                        color="Removed by",
+                        barmode="stack",
+                        title="Capacity vs. TTL removals pr. Shard"
+                    ))
+                    st.dataframe(pd.concat(
+                        [lifecycle_frame(data, Shard=index) for index, data in enumerate(lifecycle_data)],
+                        ignore_index=True
+                    ))
     
-    else: # Individual Cache
-        st.subheader("Single Cache Lifespan Metrics")
-
-        try:
-            lifespan_data = macho_cache_metrics["lifespan_metrics"]
-            entry_lifespans = lifespan_data["all_lifespans"]
-        except MetricsLifespanException as e:
-            st.error(f"No lifespan data currently available {e}")
-        else:
-            lifespan_df = pd.DataFrame([
-                {"Metric": k.capitalize(), "Value": v}
-                for k, v in lifespan_data.items()
-            ])
-
-            with tabs[0]:
-                st.subheader("Summary of Lifespan Metrics")
-                st.dataframe(lifespan_df)
-                st.plotly_chart(px.bar(
-                    lifespan_df,
-                    x="Metric",
-                    y="Value",
-                    title="Lifespan Metrics"
-                ))
-
-                with st.expander("View Raw Summary Data"):
+        else: # Individual Cache
+            st.subheader("Single Cache Lifespan Metrics")
+
+            try:
+                lifespan_data = macho_cache_metrics["lifespan_metrics"]
+                lifecycle_data = macho_cache_metrics["lifecycle"]
+            except (KeyError, MetricsLifespanException) as e:
+                st.error(f"No lifespan data currently available {e}")
+            else:
+                lifespan_df = pd.DataFrame([
+                    {"Metric": label, "Value": lifespan_data[key]}
+                    for key, label in SUMMARY_COLUMNS.items()
+                ])
+
+                with tabs[0]:
+                    st.subheader("Summary of Lifespan Metrics")
                     st.dataframe(lifespan_df)
-
-            with tabs[1]:
-                st.subheader("Distribution of Entry Lifespans")
-                new_df = pd.DataFrame(entry_lifespans, columns=["Lifespan"])
-                bins = st.slider("Number of bins", min_value=10, max_value=100, value=30)
-                if entry_lifespans:
-                    st.plotly_chart(px.histogram(
-                        new_df,
-                        x="Lifespan",
-                        nbins=bins,
-                        title="Entry Lifespan Distribution",
-                        labels={"Value": "Lifespan(s)"},
-                        opacity=0.7
+                    st.plotly_chart(px.bar(
+                        lifespan_df,
+                        x="Metric",
+                        y="Value",
+                        title="Lifespan Metrics"
                     ))
 
-                    if st.checkbox("Show Raw Lifespan Data"):
-                        st.dataframe(new_df)
-
-            with tabs[2]:
-                st.subheader("Box Plot of Lifespans")
-                if entry_lifespans:
-                    df = pd.DataFrame({"Lifespan": entry_lifespans})
-                    st.plotly_chart(px.box(
-                        df, 
-                        y="Lifespan",
-                        points="outliers",
-                        title="Lifespan Spread"
+                    with st.expander("View Raw Summary Data"):
+                        st.dataframe(lifespan_df)
+
+                with tabs[1]:
+                    st.subheader("Distribution of Entry Lifespans")
+                    new_df = bucket_frame(lifespan_data["buckets"])
+                    if not new_df.empty:
+                        st.plotly_chart(px.bar(
+                            new_df,
+                            x="Lifespan",
+                            y="Entries",
+                            log_x=True,
+                            title="Entry Lifespan Distribution",
+                            labels={"Lifespan": "Lifespan (s)"},
+                            opacity=0.7
+                        ))
+
+                        if st.checkbox("Show Raw Lifespan Data"):
+                            st.dataframe(new_df)
+
+                with tabs[2]:
+                    st.subheader("Entry Lifecycle")
+                    st.plotly_chart(px.pie(
+                        removal_frame(lifecycle_data),
+                        names="Removed by",
+                        values="Entries",
+                        title="Capacity vs. TTL removals"
                     ))
+                    st.metric("Entries removed without a single hit", lifecycle_data["never_hit"])
+                    st.dataframe(lifecycle_frame(lifecycle_data))
+
+# Live mode polls the metric stream and only applies new deltas, otherwise the static dump is loaded once
+if is_live_mode():
+    @st.fragment(run_every=float(os.environ.get("MACHO_DASHBOARD_INTERVAL", "1.0")))
+    def live_lifespan():
+        if "macho_stream" not in st.session_state:
+            st.session_state["macho_stream"] = MetricsStreamReader()
+        reader = st.session_state["macho_stream"]
+        reader.poll()
+        if not reader.shards:
+            st.info(f"Waiting for metrics stream at {reader.path}")
+            return
+        st.caption(f"Live - record #{reader.sequence}")
+        render_lifespan(reader.metrics())
+
+    live_lifespan()
+else:
+    # Access stored cache in Session State
+    try:
+        if "macho_metrics" not in st.session_state:
+            st.session_state["macho_metrics"] = load_from_json()
+
+        macho_cache_metrics = st.session_state["macho_metrics"]
+    except Exception as e:
+        st.error(f"Failed ot load cache {e}")
+        st.stop()
+
+    render_lifespan(macho_cache_metrics)
@@ -1,6 +1,6 @@
 # --------------- Imports ---------------
 
-from macho.dashboard import load_from_json
+from macho.dashboard import load_from_json, is_live_mode, MetricsStreamReader
 
 from macho.errors import MetricsLatencyException
 
@@ -8,157 +8,214 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 
+import os
+
 # --------------- Latency Metrics ---------------
 
 st.title("Function Latency Data ⏱️")
 st.divider()
 st.subheader("Metrics & Data visualisation of the time it takes to perform individual function calls.")
 
-# Access stored cache in Session State
-try:
-    if "macho_metrics" not in st.session_state:
-        st.session_state["macho_metrics"] = load_from_json()
-
-    macho_cache_metrics = st.session_state["macho_metrics"]
-except Exception as e:
-    st.error(f"Failed ot load cache {e}")
-    st.stop()
-
-# Manage Streamlit Tabs
-tabs = st.tabs(["📉 Line Charts", "📊 Histograms", "📦 Box Plots"])
-
-if macho_cache_metrics is None:
-    st.error("No metrics found in current session state")
-elif not isinstance(macho_cache_metrics, (dict, list)):
-    st.error("The object currently in Session State is not a valid Cache-object")
-else:
-    if isinstance(macho_cache_metrics, list): # shared cache
-
-        try:
-            shared_latency_data = [shard["latencies"] for shard in macho_cache_metrics]
-            all_shared_latencies = [
-                {"Shard": index, "Type": "Get", "Latency": get_l}
-                for index, shard in enumerate(shared_latency_data)
-                for get_l in shard["get_latency"]
-            ] + [
-                {"Shard": index, "Type": "Add", "Latency": add_l}
-                for index, shard in enumerate(shared_latency_data)
-                for add_l in shard["add_latency"]
-            ]
-        except MetricsLatencyException as e:
-            st.error("No Latency Data currently available")
-        else:
-            shard_latency_df = pd.DataFrame([
-                {
-                    "Shard": index,
-                    "Avg. Add Latency": data["add_latency_seconds"],
-                    "Max Add Latency": data["max_add_latency"],
-                    "Min Add Latency": data["min_add_latency"],
-                    "Avg. Get Latency": data["get_latency_seconds"],
-                    "Max Get Latency": data["max_get_latency"],
-                    "Min Get Latency": data["min_get_latency"]
-                }
-                for index, data in enumerate(shared_latency_data)
-            ])
-
-            with tabs[0]:
-                st.subheader("Line Charts for Cache Latency")
-                st.dataframe(shard_latency_df)
-                st.plotly_chart(px.line(
-                    shard_latency_df.melt(id_vars="Shard", var_name="Metric", value_name="Latency(s)"),
-                    x="Metric",
-                    y="Latency(s)",
-                    color="Metric",
-                    markers=True,
-                    title="Latency Metrics per Shard",
-                    template="plotly"
-                ))
-
-                with st.expander("View Raw Summary Data"):
+LATENCY_TYPES = {"add": "Add", "get": "Get (Hit)", "miss": "Get (Miss)"}
+PERCENTILE_LABELS = ["p50", "p90", "p99", "p999"]
+
+def summary_rows(latency_data, shard=None):     # One row pr. method with average, min, max & percentiles
+    rows = []
+    for label, name in LATENCY_TYPES.items():
+        row = {} if shard is None else {"Shard": shard}
+        row.update({
+            "Type": name,
+            "Count": latency_data.get(f"{label}_count", 0),
+            "Avg. Latency": latency_data.get(f"{label}_latency_seconds", 0.0),
+            "Min Latency": latency_data.get(f"min_{label}_latency", 0.0),
+            "Max Latency": latency_data.get(f"max_{label}_latency", 0.0)
+        })
+        for percentile in PERCENTILE_LABELS:
+            row[percentile] = latency_data.get(f"{percentile}_{label}_latency", 0.0)
+        rows.append(row)
+    return rows
+
+def bucket_rows(latency_data, shard=None):      # Histogram buckets stored as [low, high, count]
+    rows = []
+    for label, name in LATENCY_TYPES.items():
+        for low, high, count in latency_data.get(f"{label}_latency", []):
+            row = {} if shard is None else {"Shard": shard}
+            row.update({"Type": name, "Latency": (low + high) / 2, "Count": count})
+            rows.append(row)
+    return rows
+
+def render_latency(macho_cache_metrics):
+    # Manage Streamlit Tabs
+    tabs = st.tabs(["📉 Line Charts", "📊 Histograms", "📦 Percentiles"])
+
+    if macho_cache_metrics is None:
+        st.error("No metrics found in current session state")
+    elif not isinstance(macho_cache_metrics, (dict, list)):
+        st.error("The object currently in Session State is not a valid Cache-object")
+    else:
+        if isinstance(macho_cache_metrics, list): # shared cache
+
+            try:
+                shared_latency_data = [shard["latencies"] for shard in macho_cache_metrics]
+            except (KeyError, MetricsLatencyException) as e:
+                st.error(f"No Latency Data currently available {e}")
+            else:
+                shard_latency_df = pd.DataFrame([
+                    row
+                    for index, data in enumerate(shared_latency_data)
+                    for row in summary_rows(data, shard=index)
+                ])
+                hist_latency_data = pd.DataFrame([
+                    row
+                    for index, data in enumerate(shared_latency_data)
+                    for row in bucket_rows(data, shard=index)
+                ])
+
+                with tabs[0]:
+                    st.subheader("Line Charts for Cache Latency")
                     st.dataframe(shard_latency_df)
+                    st.plotly_chart(px.line(
+                        shard_latency_df.melt(
+                            id_vars=["Shard", "Type"],
+                            value_vars=["Avg. Latency", "Min Latency", "Max Latency"],
+                            var_name="Metric",
+                            value_name="Latency(s)"
+                        ),
+                        x="Shard",
+                        y="Latency(s)",
+                        color="Type",
+                        line_dash="Metric",
+                        markers=True,
+                        title="Latency Metrics per Shard",
+                        template="plotly"
+                    ))
 
-            with tabs[1]:
-                st.subheader("Histograms for Cache Latencies")
-                hist_latency_data = pd.DataFrame(all_shared_latencies)
-                st.dataframe(hist_latency_data)
-
-                shared_bins = st.slider(label="Number of bins", min_value=10, max_value=100, value=30)
-
-                st.plotly_chart(px.histogram(
-                    hist_latency_data,
-                    x="Latency",
-                    color="Type",
-                    nbins=shared_bins,
-                    barmode="overlay",
-                    opacity=0.6,
-                    title="Method Latency Distribution per Shard"
-                ))
-
-                if st.checkbox("Show Raw Latency Data"):
-                    st.dataframe(all_shared_latencies)
-
-            with tabs[2]:
-                st.subheader("Box Plot per shard")
-                st.plotly_chart(px.box(
-                    all_shared_latencies,
-                    x="Shard",
-                    y="Latency",
-                    points="outliers",
-                    title="Latency Spread per Shard"
-                ))
-    else: # Single Cache
-        st.subheader("Single Cache Latency Metrics")
-
-        try:
-            single_latency_data = macho_cache_metrics["latencies"]
-            all_single_latencies = macho_cache_metrics["get_latency"] + macho_cache_metrics["add_latency"]
-        except MetricsLatencyException as e:
-            st.error(f"No latency data currently available {e}")
-        else:
-            latency_df = pd.DataFrame([
-                {"Metric": key.capitalize(), "Value": value}
-                for key, value in single_latency_data.items() 
-            ])
-
-            with tabs[0]:
-                st.subheader("Line Charts for Cache Latency")
-                st.dataframe(latency_df)
-                st.plotly_chart(px.line(
-                    latency_df,
-                    x="Metric",
-                    y="Value",
-                    title="Latency Metrics"
-                ))
-
-                with st.expander("View Raw Latency Data"):
+                    with st.expander("View Raw Summary Data"):
+                        st.dataframe(shard_latency_df)
+
+                with tabs[1]:
+                    st.subheader("Histograms for Cache Latencies")
+                    if not hist_latency_data.empty:
+                        st.plotly_chart(px.histogram(
+                            hist_latency_data,
+                            x="Latency",
+                            y="Count",
+                            histfunc="sum",
+                            color="Type",
+                            log_x=True,
+                            barmode="overlay",
+                            opacity=0.6,
+                            title="Method Latency Distribution per Shard"
+                        ))
+
+                        if st.checkbox("Show Raw Latency Buckets"):
+                            st.dataframe(hist_latency_data)
+
+                with tabs[2]:
+                    st.subheader("Latency Percentiles per shard")
+                    st.plotly_chart(px.bar(
+                        shard_latency_df.melt(
+                            id_vars=["Shard", "Type"],
+                            value_vars=PERCENTILE_LABELS,
+                            var_name="Percentile",
+                            value_name="Latency(s)"
+                        ),
+                        x="Shard",
+                        y="Latency(s)",
+                        color="Percentile",
+                        facet_col="Type",
+                        barmode="group",
+                        title="Latency Percentiles per Shard"
+                    ))
+        else: # Single Cache
+            st.subheader("Single Cache Latency Metrics")
+
+            try:
+                single_latency_data = macho_cache_metrics["latencies"]
+            except (KeyError, MetricsLatencyException) as e:
+                st.error(f"No latency data currently available {e}")
+            else:
+                latency_df = pd.DataFrame(summary_rows(single_latency_data))
+                all_entry_latency_data = pd.DataFrame(bucket_rows(single_latency_data))
+
+                with tabs[0]:
+                    st.subheader("Line Charts for Cache Latency")
                     st.dataframe(latency_df)
+                    st.plotly_chart(px.line(
+                        latency_df.melt(
+                            id_vars="Type",
+                            value_vars=["Avg. Latency", "Min Latency", "Max Latency"],
+                            var_name="Metric",
+                            value_name="Value"
+                        ),
+                        x="Metric",
+                        y="Value",
+                        color="Type",
+                        markers=True,
+                        title="Latency Metrics"
+                    ))
 
-            with tabs[1]:
-                st.subheader("Histograms for Cache Latencies")
-                all_entry_latency_data = pd.DataFrame(all_single_latencies, columns=["Latency"])
+                    with st.expander("View Raw Latency Data"):
+                        st.dataframe(latency_df)
+
+                with tabs[1]:
+                    st.subheader("Histograms for Cache Latencies")
+                    if not all_entry_latency_data.empty:
+                        st.plotly_chart(px.histogram(
+                            all_entry_latency_data,
+                            x="Latency",
+                            y="Count",
+                            histfunc="sum",
+                            color="Type",
+                            log_x=True,
+                            title="Entry Latency Distribution",
+                            labels={"Latency": "Latency(s)"},
+                            opacity=0.7
+                        ))
+
+                        if st.checkbox("Show Raw Latency Buckets"):
+                            st.dataframe(all_entry_latency_data)
+
+                with tabs[2]:
+                    st.subheader("Latency Percentiles for Single Cache")
+                    st.plotly_chart(px.bar(
+                        latency_df.melt(
+                            id_vars="Type",
+                            value_vars=PERCENTILE_LABELS,
+                            var_name="Percentile",
+                            value_name="Latency(s)"
+                        ),
+                        x="Percentile",
+                        y="Latency(s)",
+                        color="Type",
+                        barmode="group",
+                        title="Latency Percentiles"
+                    ))
 
-                single_bins = st.slider(label="Number of bins", min_value=10, max_value=100, value=30)
+# Live mode polls the metric stream and only applies new deltas, otherwise the static dump is loaded once
+if is_live_mode():
+    @st.fragment(run_every=float(os.environ.get("MACHO_DASHBOARD_INTERVAL", "1.0")))
+    def live_latency():
+        if "macho_stream" not in st.session_state:
+            st.session_state["macho_stream"] = MetricsStreamReader()
+        reader = st.session_state["macho_stream"]
+        reader.poll()
+        if not reader.shards:
+            st.info(f"Waiting for metrics stream at {reader.path}")
+            return
+        st.caption(f"Live - record #{reader.sequence}")
+        render_latency(reader.metrics())
+
+    live_latency()
+else:
+    # Access stored cache in Session State
+    try:
+        if "macho_metrics" not in st.session_state:
+            st.session_state["macho_metrics"] = load_from_json()
 
-                if all_single_latencies:
-                    st.plotly_chart(px.histogram(
-                        all_entry_latency_data,
-                        x="Latency",
-                        nbins=single_bins,
-                        title="Entry Latency Distribution",
-                        labels={"Value": "Latency(s)"},
-                        opacity=0.7
-                    ))
+        macho_cache_metrics = st.session_state["macho_metrics"]
+    except Exception as e:
+        st.error(f"Failed ot load cache {e}")
+        st.stop()
 
-                    if st.checkbox("Show Raw Latency Data"):
-                        st.dataframe(all_entry_latency_data)
-
-            with tabs[2]:
-                st.subheader("Box Plot for Single Cache")
-                if all_single_latencies:
-                    df = pd.DataFrame({"Latency": all_single_latencies})
-                    st.plotly_chart(px.box(
-                        df,
-                        y="Latency",
-                        points="outliers",
-                        title="Latency Spread"
-                    ))
\ No newline at end of file
+    render_latency(macho_cache_metrics)
@@ -0,0 +1,293 @@
+# --------------- Imports ---------------
+
+from macho.logging import get_logger
+from macho.metrics import LogHistogram
+from macho.models import BaseCache
+
+from typing import Any, Dict, List, Optional
+from collections import deque
+from threading import Event, Thread
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+
+# --------------- Logging setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Stream Data Path ---------------
+
+STREAM_DATA_PATH = os.environ.get(
+    "MACHO_CACHE_STREAM_PATH",
+    os.path.join(tempfile.gettempdir(), "macho_cache_stream.jsonl")
+)
+
+_COUNTERS = ("hits", "misses", "evictions", "expirations")
+_GAUGES = ("current_size", "max_size", "ttl", "memory_bytes")
+_HISTOGRAMS = ("latencies", "lifecycle")       # Groups of histograms streamed as changed buckets
+
+
+def is_live_mode() -> bool:
+    """
+    True if the dashboard was launched with launch_dashboard(cache, live=True).
+    """
+    return os.environ.get("MACHO_DASHBOARD_LIVE") == "1"
+
+
+def _histogram_delta(current: LogHistogram, previous: Optional[LogHistogram]) -> Dict[str, Any]:
+    if previous is None:
+        changed = [[index, amount] for index, amount in enumerate(current.counts) if amount]
+        total = current.total
+    else:
+        changed = [
+            [index, amount - before]
+            for index, (amount, before) in enumerate(zip(current.counts, previous.counts))
+            if amount != before
+        ]
+        total = current.total - previous.total
+    return {"buckets": changed, "total": total, "min": current.min, "max": current.max}
+
+# --------------- Stream Writer ---------------
+
+class MetricsStreamer():
+    """
+    Appends compact metric deltas of a running cache to a size-bounded JSON-lines ring file.
+
+    Every record holds counter deltas, current gauges and the changed latency & lifecycle histogram
+    buckets of each shard, read from lock-free shard snapshots. Once the file exceeds 'max_bytes' it is
+    atomically replaced by a new file starting with a full keyframe, so readers can always
+    reconstruct the complete state from the current file alone.
+
+    ----- Parameters -----
+    cache: Cache
+        The cache-object to stream metrics from.
+    path: str
+        Destination ring file (Defaults to STREAM_DATA_PATH).
+    interval: float
+        Seconds between records (Defaults to 1.0).
+    max_bytes: int
+        Size at which the ring file is rotated (Defaults to 1 MB).
+    """
+
+    __slots__ = (
+        "cache", "path", "interval", "max_bytes", "previous", "sequence", "written", "stop_event", "thread", "process"
+    )
+
+    def __init__(self, cache, path: str = STREAM_DATA_PATH, interval: float = 1.0, max_bytes: int = 1_000_000):
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("Parameter 'interval' must be a positive number")
+        if not isinstance(max_bytes, int) or max_bytes <= 0:
+            raise ValueError("Parameter 'max_bytes' must be a positive integer")
+
+        self.cache = cache
+        self.path = path
+        self.interval = float(interval)
+        self.max_bytes = max_bytes
+        self.previous: Optional[List[Dict[str, Any]]] = None
+        self.sequence = 0
+        self.written = 0
+        self.stop_event = Event()
+        self.thread: Optional[Thread] = None
+        self.process: Optional[subprocess.Popen] = None    # Dashboard started by launch_dashboard(), stopped with the stream
+
+    def _record(self, snapshots: List[Dict[str, Any]], keyframe: bool) -> Dict[str, Any]:
+        shards = []
+        for index, snapshot in enumerate(snapshots):
+            before = None if keyframe else self.previous[index]
+            shard = {name: snapshot[name] - (before[name] if before else 0) for name in _COUNTERS}
+            shard.update({name: snapshot[name] for name in _GAUGES})
+            for group in _HISTOGRAMS:
+                shard[group] = {
+                    label: _histogram_delta(histogram, before[group][label] if before else None)
+                    for label, histogram in snapshot[group].items()
+                }
+            shards.append(shard)
+
+        self.sequence += 1
+        return {
+            "seq": self.sequence,
+            "time": time.time(),
+            "kind": "full" if keyframe else "delta",
+            "shards": shards
+        }
+
+    def flush(self) -> None:
+        """
+        Writes a single record (a keyframe for the first record and after every rotation).
+        """
+        snapshots = [shard.snapshot() for shard in self.cache.shards]
+        keyframe = self.previous is None or self.written >= self.max_bytes
+        line = json.dumps(self._record(snapshots, keyframe), separators=(",", ":")) + "\n"
+        payload = line.encode("utf-8")
+
+        if keyframe:        # Replace the ring file atomically, readers notice the new inode
+            directory = os.path.dirname(os.path.abspath(self.path))
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, prefix=".macho_stream_")
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(payload)
+            os.replace(tmp_path, self.path)
+            self.written = len(payload)
+        else:
+            with open(self.path, "ab") as file:
+                file.write(payload)
+            self.written += len(payload)
+
+        self.previous = snapshots
+
+    def _run(self) -> None:
+        while not self.stop_event.wait(self.interval):
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Failed to stream cache metrics to {self.path}: {e}")
+
+    def start(self) -> "MetricsStreamer":
+        if self.thread is not None:
+            return self
+        self.stop_event.clear()
+        self.flush()
+        self.thread = Thread(target=self._run, name="macho-metrics-stream", daemon=True)
+        self.thread.start()
+        logger.info(f"Streaming cache metrics to {self.path} every {self.interval}s")
+        return self
+
+    def stop(self) -> None:
+        """
+        Stops streaming. A dashboard started by launch_dashboard() is terminated, and its stream file removed.
+        """
+        if self.thread is not None:
+            self.stop_event.set()
+            self.thread.join()
+            self.thread = None
+        if self.process is not None:
+            process, self.process = self.process, None
+            process.terminate()
+            try:
+                process.wait(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+# --------------- Stream Reader ---------------
+
+class MetricsStreamReader():
+    """
+    Incrementally follows a ring file written by MetricsStreamer.
+
+    Each poll() only parses the records appended since the previous call, and folds them into
+    running per-shard totals and histograms. metrics() returns the same structure as Cache.metrics,
+    so dashboard pages can render live and static data alike.
+
+    ----- Parameters -----
+    path: Optional[str]
+        The ring file to follow (Defaults to $MACHO_CACHE_STREAM_PATH, set by launch_dashboard(), else STREAM_DATA_PATH).
+    history: int
+        Number of records kept for time-series charts (Defaults to 600).
+    """
+
+    __slots__ = ("path", "inode", "offset", "shards", "history", "sequence")
+
+    def __init__(self, path: Optional[str] = None, history: int = 600):
+        self.path = path if path is not None else os.environ.get("MACHO_CACHE_STREAM_PATH", STREAM_DATA_PATH)
+        self.inode = None
+        self.offset = 0
+        self.shards: List[Dict[str, Any]] = []
+        self.history = deque(maxlen=history)
+        self.sequence = 0
+
+    @staticmethod
+    def _empty_shard() -> Dict[str, Any]:
+        shard = {name: 0 for name in _COUNTERS + _GAUGES}
+        shard["latencies"] = {label: LogHistogram() for label in ("add", "get", "miss")}
+        shard["lifecycle"] = {label: LogHistogram() for label in ("lifespan", "idle", "hits", "first_hit")}
+        return shard
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        if record["kind"] == "full":
+            self.shards = [self._empty_shard() for _ in record["shards"]]
+
+        point = {"time": record["time"], "hits": 0, "misses": 0, "evictions": 0}
+        for shard, delta in zip(self.shards, record["shards"]):
+            for name in _COUNTERS:
+                shard[name] += delta.get(name, 0)
+                if name in point:
+                    point[name] += delta.get(name, 0)
+            for name in _GAUGES:
+                shard[name] = delta.get(name, shard[name])
+            for group in _HISTOGRAMS:
+                for label, change in delta.get(group, {}).items():
+                    histogram = shard[group].setdefault(label, LogHistogram())
+                    for index, amount in change["buckets"]:
+                        histogram.counts[index] += amount
+                        histogram.count += amount
+                    histogram.total += change["total"]
+                    histogram.min = change["min"]
+                    histogram.max = change["max"]
+
+        if record["kind"] == "delta":
+            self.history.append(point)
+        self.sequence = record["seq"]
+
+    def poll(self) -> int:
+        """
+        Reads and applies every complete record appended since the previous poll.
+
+        ----- Return -----
+        Int:
+            The number of records applied.
+        """
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return 0
+
+        if stat.st_ino != self.inode or stat.st_size < self.offset:   # Ring file was rotated
+            self.inode = stat.st_ino
+            self.offset = 0
+
+        applied = 0
+        with open(self.path, "rb") as file:
+            file.seek(self.offset)
+            for line in file:
+                if not line.endswith(b"\n"):    # Record still being written
+                    break
+                self.offset += len(line)
+                self._apply(json.loads(line))
+                applied += 1
+        return applied
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """
+        Returns the current per-shard metrics in the same layout as Cache.metrics (for sharded caches).
+        """
+        metrics = []
+        for shard in self.shards:
+            total = shard["hits"] + shard["misses"]
+            metrics.append({
+                "current_size": shard["current_size"],
+                "max_size": shard["max_size"],
+                "ttl": shard["ttl"],
+                "hits": shard["hits"],
+                "misses": shard["misses"],
+                "total_requests": total,
+                "hit_ratio": round(shard["hits"] / total, 2) if total else 0.00,
+                "evictions": shard["evictions"],
+                "memory_size": shard["memory_bytes"],
+                "lifespan_metrics": BaseCache.summarize_lifespan(shard["lifecycle"]["lifespan"]),
+                "lifecycle": BaseCache.summarize_lifecycle(shard["lifecycle"], shard["evictions"], shard["expirations"]),
+                "latencies": BaseCache.summarize_latencies(shard["latencies"])
+            })
+        return metrics
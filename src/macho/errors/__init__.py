@@ -1,9 +1,9 @@
 # --------------- Imports ---------------
 
-from .exceptions import BloomFilterException, MetricsLifespanException, MetricsLatencyException, ShardException
+from .exceptions import BloomFilterException, MetricsLifespanException, MetricsLatencyException, ShardException, ClusterException
 
 # --------------- Package Manager ---------------
 
-__all__ = ["BloomFilterException", "MetricsLifespanException", "MetricsLatencyException", "ShardException"]
+__all__ = ["BloomFilterException", "MetricsLifespanException", "MetricsLatencyException", "ShardException", "ClusterException"]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
@@ -32,4 +32,11 @@ class MetricsLifespanException(Exception):
     Error raised when cache's 'lifespan' list is without values.
     """
     def __init__(self, message: str = "No data related to cache's lifespan is currently available"):
+        super().__init__(message)
+
+class ClusterException(Exception):
+    """
+    Error raised when no node responsible for a key could serve a cluster request.
+    """
+    def __init__(self, message: str = "No node responsible for the request is reachable"):
         super().__init__(message)
\ No newline at end of file
@@ -0,0 +1,9 @@
+# --------------- Imports ---------------
+
+from .openmetrics import CONTENT_TYPE, render_openmetrics, write_textfile, OpenMetricsServer
+
+# --------------- Package Manager ---------------
+
+__all__ = ["CONTENT_TYPE", "render_openmetrics", "write_textfile", "OpenMetricsServer"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
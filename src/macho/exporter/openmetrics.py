@@ -0,0 +1,239 @@
+# --------------- Imports ---------------
+
+from macho.logging import get_logger
+from macho.main import Cache
+from macho.metrics import LogHistogram
+from macho.metrics.histogram import SUB_BUCKET_COUNT
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from threading import Thread
+
+import os
+import tempfile
+
+# --------------- Logging Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- OpenMetrics Rendering ---------------
+
+CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_COUNTERS = (      # (snapshot key, metric name, help text)
+    ("hits", "hits", "Cache lookups that found a live entry."),
+    ("misses", "misses", "Cache lookups that found no live entry."),
+    ("evictions", "evictions", "Entries removed by the eviction strategy or TTL expiry.")
+)
+
+_GAUGES = (        # (snapshot key, metric name, unit, help text)
+    ("current_size", "entries", "", "Entries currently stored."),
+    ("max_size", "capacity", "", "Maximum number of entries."),
+    ("memory_bytes", "memory_bytes", "bytes", "Approximate shallow size of stored keys, entries and values.")
+)
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    pairs = []
+    for name, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{escaped}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _cumulative_buckets(histogram: LogHistogram) -> List[Tuple[int, int]]:
+    """
+    Folds the fine log-buckets into cumulative counts at power-of-two boundaries (in ns),
+    keeping the exposed bucket set small and stable between scrapes.
+    """
+    buckets = histogram.buckets()
+    if not buckets:
+        return []
+
+    result = []
+    cumulative = 0
+    index = 0
+    boundary = SUB_BUCKET_COUNT
+    while True:
+        while index < len(buckets) and buckets[index][1] <= boundary:     # 'le' is less-than-or-equal
+            cumulative += buckets[index][2]
+            index += 1
+        result.append((boundary, cumulative))
+        if index == len(buckets):
+            break
+        boundary <<= 1
+    return result
+
+
+def render_openmetrics(cache: Cache, prefix: str = "macho") -> str:
+    """
+    Renders hits, misses, evictions, size, bytes and latency histograms of every shard
+    in the OpenMetrics text format.
+
+    Metrics are read from lock-free shard snapshots, so rendering never blocks add()/get()
+    callers regardless of how many entries the cache holds.
+
+    ----- Parameters -----
+    cache: Cache
+        The cache-object to export.
+    prefix: str
+        Prefix for every metric name (Defaults to 'macho').
+
+    ----- Return -----
+    Str:
+        The exposition, terminated by '# EOF'.
+    """
+    if not isinstance(cache, Cache):
+        raise TypeError(f"Parameter 'cache' must be of Type: Cache, not {type(cache)}")
+
+    cache.flush_l1_hits()
+    snapshots = [shard.snapshot() for shard in cache.shards]
+    lines = []
+
+    for key, name, help_text in _COUNTERS:
+        metric = f"{prefix}_{name}"
+        lines.append(f"# TYPE {metric} counter")
+        lines.append(f"# HELP {metric} {help_text}")
+        for index, snapshot in enumerate(snapshots):
+            lines.append(f"{metric}_total{_format_labels({'shard': index})} {snapshot[key]}")
+
+    for key, name, unit, help_text in _GAUGES:
+        metric = f"{prefix}_{name}"
+        lines.append(f"# TYPE {metric} gauge")
+        if unit:
+            lines.append(f"# UNIT {metric} {unit}")
+        lines.append(f"# HELP {metric} {help_text}")
+        for index, snapshot in enumerate(snapshots):
+            lines.append(f"{metric}{_format_labels({'shard': index})} {snapshot[key]}")
+
+    metric = f"{prefix}_operation_latency_seconds"
+    lines.append(f"# TYPE {metric} histogram")
+    lines.append(f"# UNIT {metric} seconds")
+    lines.append(f"# HELP {metric} Latency of add() calls, get() hits and get() misses.")
+    for index, snapshot in enumerate(snapshots):
+        for operation, histogram in snapshot["latencies"].items():
+            labels = {"shard": index, "operation": operation}
+            for boundary, cumulative in _cumulative_buckets(histogram):
+                bucket_labels = _format_labels(dict(labels, le=repr(boundary / 1e9)))
+                lines.append(f"{metric}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{metric}_bucket{_format_labels(dict(labels, le='+Inf'))} {histogram.count}")
+            lines.append(f"{metric}_count{_format_labels(labels)} {histogram.count}")
+            lines.append(f"{metric}_sum{_format_labels(labels)} {histogram.total / 1e9!r}")
+
+    lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(cache: Cache, path: str, prefix: str = "macho") -> None:
+    """
+    Atomically writes the OpenMetrics exposition to a file (e.g. for node_exporter's textfile collector).
+
+    ----- Parameters -----
+    cache: Cache
+        The cache-object to export.
+    path: str
+        Destination file, replaced atomically so readers never observe a partial file.
+    prefix: str
+        Prefix for every metric name (Defaults to 'macho').
+    """
+    payload = render_openmetrics(cache, prefix=prefix)
+    directory = os.path.dirname(os.path.abspath(path))
+
+    file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, prefix=".macho_metrics_")
+    try:
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            file.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+# --------------- HTTP Exporter ---------------
+
+class OpenMetricsServer():
+    """
+    Serves the OpenMetrics exposition of a cache from a lightweight background HTTP thread.
+
+    ----- Parameters -----
+    cache: Cache
+        The cache-object to export.
+    host: str
+        Interface to bind (Defaults to '127.0.0.1').
+    port: int
+        Port to bind, 0 picks a free port (Defaults to 9464).
+    prefix: str
+        Prefix for every metric name (Defaults to 'macho').
+
+    ----- Notes -----
+    - Scrapes are answered on '/metrics' (and '/').
+    - The server threads are daemons, call stop() for a clean shutdown.
+    """
+
+    __slots__ = ("cache", "host", "port", "prefix", "server", "thread")
+
+    def __init__(self, cache: Cache, host: str = "127.0.0.1", port: int = 9464, prefix: str = "macho"):
+        if not isinstance(cache, Cache):
+            raise TypeError(f"Parameter 'cache' must be of Type: Cache, not {type(cache)}")
+        if not isinstance(port, int):
+            raise TypeError("Parameter 'port' must be of type: int")
+
+        self.cache = cache
+        self.host = host
+        self.port = port
+        self.prefix = prefix
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[Thread] = None
+
+    def _handler(self) -> type:
+        exporter = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                payload = render_openmetrics(exporter.cache, prefix=exporter.prefix).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logger.debug(f"OpenMetrics exporter: {format % args}")
+
+        return MetricsHandler
+
+    def start(self) -> "OpenMetricsServer":
+        if self.server is not None:
+            return self
+        self.server = ThreadingHTTPServer((self.host, self.port), self._handler())
+        self.server.daemon_threads = True
+        self.port = self.server.server_address[1]
+        self.thread = Thread(target=self.server.serve_forever, name="macho-openmetrics", daemon=True)
+        self.thread.start()
+        logger.info(f"OpenMetrics exporter listening on http://{self.host}:{self.port}/metrics")
+        return self
+
+    def stop(self) -> None:
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.server = None
+        self.thread = None
+        logger.info("OpenMetrics exporter stopped")
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+    def __repr__(self):
+        return f"<OpenMetricsServer(url={self.url}, running={self.server is not None})>"
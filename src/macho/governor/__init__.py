@@ -0,0 +1,9 @@
+# --------------- Imports ---------------
+
+from .governor import CgroupMemoryReader, MemoryGovernor
+
+# --------------- Package Manager ---------------
+
+__all__ = ["CgroupMemoryReader", "MemoryGovernor"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
@@ -0,0 +1,284 @@
+# --------------- Imports ---------------
+
+from threading import Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from macho.logging import get_logger
+
+import os
+import weakref
+
+# --------------- Logger Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Memory Readings ---------------
+
+_CGROUP_ROOT = "/sys/fs/cgroup"
+_SYSTEM_PSI = "/proc/pressure/memory"
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path) as file:
+            return file.read()
+    except OSError:
+        return None
+
+class CgroupMemoryReader():
+    """
+    Reads the memory usage & limit of the process' cgroup (v2) and its memory pressure (PSI).
+
+    The cgroup is resolved from the '0::' line of /proc/self/cgroup. Pressure is read from the cgroup's
+    own memory.pressure file if present, else from the system-wide /proc/pressure/memory.
+
+    ----- Parameters -----
+    cgroup_path: Optional[str]
+        Directory holding memory.current & memory.max (Defaults to the process' own cgroup).
+    psi_path: Optional[str]
+        PSI file to read (Defaults to the cgroup's memory.pressure, falling back to /proc/pressure/memory).
+
+    ----- Notes -----
+    Values that cannot be read (cgroup v1, no PSI support, non-Linux) are reported as None.
+    An unlimited cgroup ('max') reports a limit of None.
+    """
+
+    __slots__ = ("cgroup_path", "psi_path")
+
+    def __init__(self, cgroup_path: Optional[str] = None, psi_path: Optional[str] = None):
+        self.cgroup_path = cgroup_path if cgroup_path is not None else self._own_cgroup()
+        if psi_path is None:
+            cgroup_psi = os.path.join(self.cgroup_path, "memory.pressure")
+            psi_path = cgroup_psi if os.path.exists(cgroup_psi) else _SYSTEM_PSI
+        self.psi_path = psi_path
+
+    @staticmethod
+    def _own_cgroup() -> str:
+        for line in (_read_text("/proc/self/cgroup") or "").splitlines():
+            if line.startswith("0::"):          # The unified (v2) hierarchy
+                relative = line[3:].strip().lstrip("/")
+                return os.path.join(_CGROUP_ROOT, relative) if relative else _CGROUP_ROOT
+        return _CGROUP_ROOT
+
+    def _read_bytes(self, name: str) -> Optional[int]:
+        text = _read_text(os.path.join(self.cgroup_path, name))
+        if text is None or text.strip() == "max":
+            return None
+        try:
+            return int(text)
+        except ValueError:
+            return None
+
+    def _read_psi(self) -> Optional[float]:
+        for line in (_read_text(self.psi_path) or "").splitlines():
+            if line.startswith("some "):            # Share of time at least one task stalled on memory
+                fields = dict(field.split("=", 1) for field in line.split()[1:])
+                return float(fields["avg10"])
+        return None
+
+    def read(self) -> Dict[str, Optional[float]]:
+        return {
+            "memory_current": self._read_bytes("memory.current"),
+            "memory_max": self._read_bytes("memory.max"),
+            "psi_some_avg10": self._read_psi()
+        }
+
+    def __repr__(self):
+        return f"<CgroupMemoryReader(cgroup_path={self.cgroup_path}, psi_path={self.psi_path})>"
+
+# --------------- Memory Governor ---------------
+
+class MemoryGovernor():
+    """
+    Shrinks the shards while memory is under pressure, and grows them back once it eases.
+
+    Every 'interval' seconds a reading is taken. Pressure is high once memory.current reaches
+    'high_watermark' of memory.max, or the PSI 'some avg10' stall percentage reaches 'psi_threshold'.
+    Each high reading evicts 'shrink_fraction' of every shard's entries through its eviction strategy
+    and lowers its capacity to match, never below 'min_ratio' of the configured capacity. Once usage
+    is back under 'low_watermark' and PSI under half the threshold, every reading restores one step
+    of capacity, so a single quiet reading cannot bring back the whole working set at once.
+
+    ----- Parameters -----
+    shards: List[Any]
+        The shards to govern.
+    capacities: List[int]
+        Configured capacity pr. shard, restored once pressure falls.
+    interval: float
+        Seconds between readings, 0 disables the background thread, poll() is then called by hand (Defaults to 1.0).
+    high_watermark: float
+        memory.current / memory.max ratio at which shrinking starts (Defaults to 0.9).
+    low_watermark: float
+        Ratio under which capacity is restored (Defaults to 0.8).
+    psi_threshold: float
+        PSI 'some avg10' percentage at which shrinking starts (Defaults to 10.0).
+    shrink_fraction: float
+        Share of every shard's entries evicted pr. high reading (Defaults to 0.1).
+    min_ratio: float
+        Lowest capacity a shard is shrunk to, relative to its configured capacity (Defaults to 0.1).
+    reader: Optional[Any]
+        Object whose read() returns 'memory_current', 'memory_max' & 'psi_some_avg10' (Defaults to CgroupMemoryReader()).
+    on_resize: Optional[Callable[[], None]]
+        Called after every shrink or restore, outside the governor's lock, e.g. to deliver the removal
+        notifications of the entries evicted (Defaults to None).
+    """
+
+    __slots__ = (
+        "shards",
+        "capacities",
+        "interval",
+        "high_watermark",
+        "low_watermark",
+        "psi_threshold",
+        "shrink_fraction",
+        "min_ratio",
+        "reader",
+        "on_resize",
+        "lock",
+        "capacity_ratio",
+        "last_reading",
+        "last_action",
+        "shrinks",
+        "restores",
+        "evicted",
+        "errors",
+        "stopped",
+        "thread",
+        "__weakref__"
+    )
+
+    def __init__(
+            self,
+            shards: List[Any],
+            capacities: List[int],
+            interval: float = 1.0,
+            high_watermark: float = 0.9,
+            low_watermark: float = 0.8,
+            psi_threshold: float = 10.0,
+            shrink_fraction: float = 0.1,
+            min_ratio: float = 0.1,
+            reader: Optional[Any] = None,
+            on_resize: Optional[Callable[[], None]] = None
+        ):
+        if not isinstance(interval, (int, float)) or interval < 0:
+            raise ValueError("Parameter 'interval' must be a non-negative number")
+        if not 0.00 < low_watermark <= high_watermark <= 1.00:
+            raise ValueError("Watermarks must satisfy 0.00 < low_watermark <= high_watermark <= 1.00")
+        if not psi_threshold > 0:
+            raise ValueError("Parameter 'psi_threshold' must be positive")
+        if not 0.00 < shrink_fraction < 1.00:
+            raise ValueError("Parameter 'shrink_fraction' must be between 0.00 - 1.00")
+        if not 0.00 < min_ratio <= 1.00:
+            raise ValueError("Parameter 'min_ratio' must be between 0.00 - 1.00")
+
+        self.shards = shards
+        self.capacities = capacities
+        self.interval = interval
+        self.high_watermark = high_watermark
+        self.low_watermark = low_watermark
+        self.psi_threshold = psi_threshold
+        self.shrink_fraction = shrink_fraction
+        self.min_ratio = min_ratio
+        self.reader = reader if reader is not None else CgroupMemoryReader()
+        self.on_resize = on_resize
+        self.lock = Lock()
+        self.capacity_ratio = 1.0
+        self.last_reading: Dict[str, Optional[float]] = {}
+        self.last_action: Optional[str] = None
+        self.shrinks = 0
+        self.restores = 0
+        self.evicted = 0
+        self.errors = 0
+        self.stopped = Event()
+        self.thread: Optional[Thread] = None
+        if interval:
+            self.thread = Thread(
+                target=_govern, args=(weakref.ref(self), self.stopped, interval), name="macho-governor", daemon=True
+            )
+            self.thread.start()
+
+    def _pressure(self, reading: Dict[str, Optional[float]]) -> Tuple[bool, bool]:
+        current, limit, psi = reading["memory_current"], reading["memory_max"], reading["psi_some_avg10"]
+        usage = current / limit if current is not None and limit else None
+        high = (usage is not None and usage >= self.high_watermark) or (psi is not None and psi >= self.psi_threshold)
+        low = (usage is None or usage < self.low_watermark) and (psi is None or psi < self.psi_threshold / 2)
+        return high, low
+
+    def poll(self) -> Optional[str]:
+        """
+        Takes a reading and shrinks or restores the shards if needed.
+
+        ----- Return -----
+        Optional[str]:
+            'shrink', 'restore' or None if capacity was left unchanged.
+        """
+        with self.lock:
+            reading = self.reader.read()
+            self.last_reading = reading
+            high, low = self._pressure(reading)
+            if high and self.capacity_ratio > self.min_ratio:
+                self.capacity_ratio = max(self.min_ratio, self.capacity_ratio * (1 - self.shrink_fraction))
+                self._shrink()
+                self.shrinks += 1
+                action = "shrink"
+            elif low and self.capacity_ratio < 1.0:
+                ratio = self.capacity_ratio / (1 - self.shrink_fraction)
+                self.capacity_ratio = 1.0 if ratio > 0.999 else ratio
+                self._restore()
+                self.restores += 1
+                action = "restore"
+            else:
+                return None
+            self.last_action = action
+            logger.info(f"Memory governor {action}: capacity at {self.capacity_ratio:.0%}, reading {reading}")
+        if self.on_resize is not None:
+            self.on_resize()
+        return action
+
+    def _shrink(self) -> None:
+        for shard, capacity in zip(self.shards, self.capacities):
+            floor = max(1, int(capacity * self.min_ratio))
+            target = min(int(capacity * self.capacity_ratio), int(len(shard) * (1 - self.shrink_fraction)))
+            self.evicted += shard.resize(max(floor, target))       # Evicts through the shard's own strategy
+
+    def _restore(self) -> None:
+        for shard, capacity in zip(self.shards, self.capacities):
+            shard.resize(max(1, int(capacity * self.capacity_ratio)))
+
+    def close(self) -> None:
+        """
+        Stops the background thread, shrunk shards keep their current capacity.
+        """
+        self.stopped.set()
+
+    @property
+    def governor_metrics(self) -> Dict[str, Any]:
+        reading = self.last_reading
+        current, limit = reading.get("memory_current"), reading.get("memory_max")
+        return {
+            "capacity_ratio": round(self.capacity_ratio, 3),
+            "capacities": [shard.max_cache_size for shard in self.shards],
+            "memory_current": current,
+            "memory_max": limit,
+            "memory_usage": round(current / limit, 3) if current is not None and limit else None,
+            "psi_some_avg10": reading.get("psi_some_avg10"),
+            "last_action": self.last_action,
+            "shrinks": self.shrinks,
+            "restores": self.restores,
+            "evicted": self.evicted,
+            "errors": self.errors
+        }
+
+    def __repr__(self):
+        return f"<MemoryGovernor(shards={len(self.shards)}, capacity_ratio={self.capacity_ratio:.2f})>"
+
+def _govern(governor_ref: "weakref.ref[MemoryGovernor]", stopped: Event, interval: float) -> None:
+    while not stopped.wait(interval):
+        governor = governor_ref()
+        if governor is None:
+            return
+        try:
+            governor.poll()
+        except Exception:
+            governor.errors += 1
+            logger.exception("Memory governor poll failed")
+        del governor
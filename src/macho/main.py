@@ -1,18 +1,34 @@
 # --------------- Imports ---------------
 
-from typing import List, Union, Any, Optional, Dict
+from typing import List, Union, Any, Optional, Dict, Callable, Iterator, Tuple
 
-from macho.models import BaseCache
-from macho.utility import create_cache, hash_value
-from macho.bloom_filter import BloomFilter
+from macho.models import BaseCache, NegativeCache, RemovalDispatcher, L1Cache, L1_MISS, HotKeyReplicas, HOT_MISS, InternStore, INSTRUMENTATION_LEVELS
+from macho.utility import create_cache, hash_value, split_capacity
+from macho.bloom_filter import BLOOM_KINDS, create_bloom_filter
+from macho.clock import CLOCK_KINDS, Clock, PreciseClock, CoarseClock, ManualClock, create_clock
+from macho.governor import MemoryGovernor
+from macho.metrics import LogHistogram
+from macho.store import WRITE_MODES, StoreWriter, create_store_writer
+from macho.trace import OP_ADD, OP_GET, TraceRecorder
+from macho.tuning import AutoTuner, MissRatioEstimator
+from macho.utility.utils import check_cache_list
 from macho.logging import get_logger
 
+from contextlib import nullcontext
+from functools import partial
+
+import threading
+import weakref
+
 # --------------- Logger Setup ---------------
 
 logger = get_logger(__name__)
 
 # --------------- Main Application ---------------
 
+_ABSENT = object()      # Default passed to the shards, tells a miss apart from a cached None
+_PICKLE_FLUSH_TIMEOUT = 5.0     # Seconds pickling waits for queued write-behind writes to reach the store
+
 class Cache():
     """
     A shared in-memory optional Bloom filter support and configurable Eviction Strategies.
@@ -29,13 +45,85 @@ class Cache():
     shard_count: int
         The number of shards the caching system shares (Defaults to 1).
     strategy: str
-        The strategy used to evict/delete expired cache entries (Defaults to 'lru').
+        The strategy used to evict/delete expired cache entries: 'lru', 'fifo', 'random', 'slru', '2q'
+        or 'gdsf' (cost-aware, uses the 'cost' & 'size' passed to add()). Defaults to 'lru'.
     bloom: bool
         Activates the addition of a Bloom Filter for probabilistic membership checking (Defaults to False).
     probability: float
         The probability that the Bloom Filter produces a false positive
         (Bloom Filter must be active to function, and value must be between 0.0 - 1.0). 
         Defaults to 0.0.
+    bloom_kind: str
+        The Bloom Filter implementation: 'standard' (bitarray), 'blocked' (cache-line blocked,
+        lock-free checks, requires NumPy) or 'scalable' (adds stages as distinct keys accumulate).
+        Defaults to 'standard'.
+    instrumentation: str
+        Per-operation metrics recorded by the shards: 'off' (nothing), 'counters' (hits & misses),
+        'sampled' (counters, timing a random 1 out of every 'sample_rate' calls) or 'full' (Defaults to 'full').
+    sample_rate: int
+        Only used by 'sampled' instrumentation, times 1 out of every N add() & get() calls on average (Defaults to 100).
+    negative_cache_size: int
+        Maximum number of keys remembered as missing by add_negative(), split across shards.
+        0 disables negative caching (Defaults to 0).
+    negative_ttl: float
+        Default time-to-live for negative entries, portrayed in seconds (Defaults to 60.0).
+    l1_size: int
+        Records kept in a lock-free, thread-local L1 in front of the shards, 0 disables it (Defaults to 0).
+        A record is only served while its shard saw no add, eviction or expiry since it was read. L1 hits are
+        folded back into their shard's hit counters, recency & admission frequencies in batches pr. thread.
+    hot_keys: int
+        Number of heaviest-hitting keys tracked on the get() path (Space-Saving top-K), 0 disables
+        hot-key detection & replication (Defaults to 0).
+    hot_key_replicas: int
+        Read-only copies kept pr. hot key, every thread reads its own copy without locking (Defaults to 4).
+    hot_key_threshold: float
+        Share of the sampled reads a key needs to be replicated, between 0.0 - 1.0 (Defaults to 0.01).
+    admission: bool
+        Puts a TinyLFU admission filter in front of the eviction strategy: a new key only displaces the
+        strategy's victim if its estimated recent access frequency is higher (Defaults to False).
+    clock: Union[str, Clock]
+        Time source of every TTL & lifecycle time: 'precise' (time.monotonic() on every read), 'coarse'
+        (a ticker thread refreshes a shared timestamp every 'clock_resolution' seconds, entries may expire
+        that much late) or a clock instance, e.g. a ManualClock for deterministic tests (Defaults to 'precise').
+    clock_resolution: float
+        Only used by 'coarse', seconds between timestamp refreshes (Defaults to 0.005).
+    intern_values: bool
+        Keeps a single shared copy of byte-identical bytes/str values cached under different keys. Values are
+        keyed by their 128-bit MurmurHash3 digest and refcounted, until no entry refers to them (Defaults to False).
+    memory_governor: bool
+        Shrinks every shard through its eviction strategy while the cgroup (v2) nears its memory limit or
+        memory pressure (PSI) is high, restoring capacity once it eases (Defaults to False).
+    governor_options: Optional[Dict[str, Any]]
+        Extra keyword arguments for the MemoryGovernor, e.g. {'high_watermark': 0.9, 'shrink_fraction': 0.1}
+        (Defaults to None).
+    estimate_mrc: bool
+        Estimates the miss-ratio curve of every eviction strategy at several cache sizes, from ghost caches
+        replaying a hash-sampled (SHARDS) share of the keys in a background thread (Defaults to False).
+    mrc_options: Optional[Dict[str, Any]]
+        Extra keyword arguments for the MissRatioEstimator, e.g. {'sample_rate': 0.01, 'size_factors': (0.5, 1.0, 2.0)}
+        (Defaults to None).
+    auto_tune: bool
+        Switches eviction strategy or resizes the cache at runtime once the estimated miss-ratio curve shows
+        a hit ratio gain of at least the tuner's threshold, implies 'estimate_mrc' (Defaults to False).
+    auto_tune_options: Optional[Dict[str, Any]]
+        Extra keyword arguments for the AutoTuner, e.g. {'threshold': 0.02, 'max_size': 10_000} (Defaults to None).
+    policy_options: Optional[Dict[str, Any]]
+        Extra keyword arguments for the eviction strategy's shards, e.g. {'protected_ratio': 0.8} for 'slru'
+        or {'in_ratio': 0.25, 'out_ratio': 0.5} for '2q' (Defaults to None).
+    loader: Optional[Callable[[Any], Any]]
+        Called with the key on a cache miss, returns the value from the backing store or None if the key
+        does not exist there. Loaded values are cached, missing keys are marked negative if enabled (Defaults to None).
+    writer: Optional[Callable[[Dict[Any, Any]], None]]
+        Persists a batch of key-value pairs to the backing store, called for every add() (Defaults to None).
+    write_mode: str
+        'through' (writer() is called before add() returns) or 'behind' (writes are queued, coalesced pr. key
+        and flushed in batches by a worker thread). Defaults to 'through'.
+    write_queue_size: int
+        Only used by 'behind', maximum number of distinct unflushed keys before add() blocks (Defaults to 1024).
+    flush_interval: float
+        Only used by 'behind', seconds a write may wait to be batched with others (Defaults to 0.1).
+    flush_batch_size: int
+        Only used by 'behind', maximum number of key-value pairs pr. writer() call (Defaults to 256).
 
     ----- Exceptions -----
     TypeError:
@@ -43,7 +131,45 @@ class Cache():
     ValueError:
         Raised if numerical data types are outside their desired range.
     """
-    __slots__ = ("max_cache_size", "ttl", "shard_count", "strategy", "bloom", "probability", "bloom_filter", "cache")
+    __slots__ = (
+        "max_cache_size",
+        "ttl",
+        "shard_count",
+        "strategy",
+        "bloom",
+        "probability",
+        "bloom_kind",
+        "instrumentation",
+        "sample_rate",
+        "policy_options",
+        "admission",
+        "l1_size",
+        "l1_local",
+        "l1_caches",
+        "hot_keys",
+        "clock",
+        "owns_clock",
+        "intern_store",
+        "memory_governor",
+        "governor_options",
+        "governor",
+        "estimate_mrc",
+        "mrc_options",
+        "auto_tune",
+        "auto_tune_options",
+        "estimator",
+        "bloom_filter",
+        "bloom_tick",
+        "negative_cache_size",
+        "negative_ttl",
+        "negative_cache",
+        "loader",
+        "store_writer",
+        "removal_dispatcher",
+        "cache",
+        "tracer",
+        "__weakref__"
+    )
 
     def __init__(
             self, 
@@ -52,7 +178,33 @@ class Cache():
             shard_count: int = 1,
             strategy: str = "lru",
             bloom: bool = False,
-            probability: float = 0.5
+            probability: float = 0.5,
+            bloom_kind: str = "standard",
+            instrumentation: str = "full",
+            sample_rate: int = 100,
+            negative_cache_size: int = 0,
+            negative_ttl: float = 60.0,
+            admission: bool = False,
+            l1_size: int = 0,
+            hot_keys: int = 0,
+            hot_key_replicas: int = 4,
+            hot_key_threshold: float = 0.01,
+            clock: Union[str, Clock] = "precise",
+            clock_resolution: float = 0.005,
+            intern_values: bool = False,
+            memory_governor: bool = False,
+            governor_options: Optional[Dict[str, Any]] = None,
+            estimate_mrc: bool = False,
+            mrc_options: Optional[Dict[str, Any]] = None,
+            auto_tune: bool = False,
+            auto_tune_options: Optional[Dict[str, Any]] = None,
+            policy_options: Optional[Dict[str, Any]] = None,
+            loader: Optional[Callable[[Any], Any]] = None,
+            writer: Optional[Callable[[Dict[Any, Any]], None]] = None,
+            write_mode: str = "through",
+            write_queue_size: int = 1024,
+            flush_interval: float = 0.1,
+            flush_batch_size: int = 256
         ):
 
         if not isinstance(max_cache_size, int):
@@ -71,6 +223,76 @@ class Cache():
             raise TypeError("Parameter 'probability' must be of type: float")
         if not 0.00 < probability < 1.00:
             raise ValueError("Probability value must be between 0.00 - 1.00")
+        if not isinstance(bloom_kind, str):
+            raise TypeError("Parameter 'bloom_kind' must be of type: str")
+        if bloom_kind not in BLOOM_KINDS:
+            raise ValueError(f"Bloom Filter kind must be one of: {', '.join(BLOOM_KINDS)}")
+        if not isinstance(instrumentation, str):
+            raise TypeError("Parameter 'instrumentation' must be of type: str")
+        if instrumentation not in INSTRUMENTATION_LEVELS:
+            raise ValueError(f"Instrumentation level must be one of: {', '.join(INSTRUMENTATION_LEVELS)}")
+        if not isinstance(sample_rate, int):
+            raise TypeError("Parameter 'sample_rate' must be of type: int")
+        if not sample_rate > 0:
+            raise ValueError("Sample rate value must be positive")
+        if not isinstance(negative_cache_size, int):
+            raise TypeError("Parameter 'negative_cache_size' must be of type: int")
+        if negative_cache_size < 0:
+            raise ValueError("Negative cache size value must not be negative")
+        if not isinstance(negative_ttl, float):
+            raise TypeError("Parameter 'negative_ttl' must be of type: float")
+        if not negative_ttl > 0:
+            raise ValueError("Negative ttl value must be positive")
+        if not isinstance(l1_size, int):
+            raise TypeError("Parameter 'l1_size' must be of type: int")
+        if l1_size < 0:
+            raise ValueError("L1 size value must not be negative")
+        if not isinstance(hot_keys, int):
+            raise TypeError("Parameter 'hot_keys' must be of type: int")
+        if hot_keys < 0:
+            raise ValueError("Hot keys value must not be negative")
+        if not isinstance(hot_key_replicas, int):
+            raise TypeError("Parameter 'hot_key_replicas' must be of type: int")
+        if not hot_key_replicas > 0:
+            raise ValueError("Hot key replicas value must be positive")
+        if not isinstance(hot_key_threshold, float):
+            raise TypeError("Parameter 'hot_key_threshold' must be of type: float")
+        if not 0.00 < hot_key_threshold < 1.00:
+            raise ValueError("Hot key threshold value must be between 0.00 - 1.00")
+        if not isinstance(clock, (str, PreciseClock, CoarseClock, ManualClock)):
+            raise TypeError("Parameter 'clock' must be of type: str or a clock instance")
+        if isinstance(clock, str) and clock not in CLOCK_KINDS:
+            raise ValueError(f"Clock must be one of: {', '.join(CLOCK_KINDS)}")
+        if not isinstance(clock_resolution, float):
+            raise TypeError("Parameter 'clock_resolution' must be of type: float")
+        if not clock_resolution > 0:
+            raise ValueError("Clock resolution value must be positive")
+        if not isinstance(intern_values, bool):
+            raise TypeError("Parameter 'intern_values' must be of type: bool")
+        if not isinstance(memory_governor, bool):
+            raise TypeError("Parameter 'memory_governor' must be of type: bool")
+        if governor_options is not None and not isinstance(governor_options, dict):
+            raise TypeError("Parameter 'governor_options' must be of type: dict")
+        if not isinstance(estimate_mrc, bool):
+            raise TypeError("Parameter 'estimate_mrc' must be of type: bool")
+        if mrc_options is not None and not isinstance(mrc_options, dict):
+            raise TypeError("Parameter 'mrc_options' must be of type: dict")
+        if not isinstance(auto_tune, bool):
+            raise TypeError("Parameter 'auto_tune' must be of type: bool")
+        if auto_tune_options is not None and not isinstance(auto_tune_options, dict):
+            raise TypeError("Parameter 'auto_tune_options' must be of type: dict")
+        if not isinstance(admission, bool):
+            raise TypeError("Parameter 'admission' must be of type: bool")
+        if policy_options is not None and not isinstance(policy_options, dict):
+            raise TypeError("Parameter 'policy_options' must be of type: dict")
+        if loader is not None and not callable(loader):
+            raise TypeError("Parameter 'loader' must be callable")
+        if writer is not None and not callable(writer):
+            raise TypeError("Parameter 'writer' must be callable")
+        if not isinstance(write_mode, str):
+            raise TypeError("Parameter 'write_mode' must be of type: str")
+        if write_mode not in WRITE_MODES:
+            raise ValueError(f"Write mode must be one of: {', '.join(WRITE_MODES)}")
 
         self.max_cache_size = max_cache_size
         self.ttl = ttl
@@ -78,75 +300,311 @@ class Cache():
         self.strategy = strategy
         self.bloom = bloom
         self.probability = probability
+        self.bloom_kind = bloom_kind
+        self.instrumentation = instrumentation
+        self.sample_rate = sample_rate if instrumentation == "sampled" else 1
+        self.policy_options = dict(policy_options or {})
+        self.admission = admission
+        self.l1_size = l1_size
+        self.l1_local = threading.local()
+        self.l1_caches: "weakref.WeakSet[L1Cache]" = weakref.WeakSet()
+        self.clock = create_clock(clock, clock_resolution)      # Shared by the shards & everything comparing their times
+        self.owns_clock = isinstance(clock, str)                # Clock instances passed in may be shared by other caches
+        self.intern_store: Optional[InternStore] = InternStore() if intern_values else None
+        if hot_keys:
+            self.hot_keys: Optional[HotKeyReplicas] = HotKeyReplicas(
+                hot_keys, hot_key_replicas, hot_key_threshold, shard_count, clock=self.clock
+            )
+        else:
+            self.hot_keys = None
 
         if self.bloom and self.shard_count > 1:
             shard_sizes = self._get_shard_size()
-            self.bloom_filter = [BloomFilter(size, self.probability) for size in shard_sizes]
+            self.bloom_filter = [
+                create_bloom_filter(self.bloom_kind, size, self.probability) for size in shard_sizes
+            ]
         elif self.bloom and self.shard_count == 1:
-            self.bloom_filter = BloomFilter(self.max_cache_size, self.probability)
+            self.bloom_filter = create_bloom_filter(self.bloom_kind, self.max_cache_size, self.probability)
         else:
             self.bloom_filter = None
 
+        self.bloom_tick = 0
+        self.negative_cache_size = negative_cache_size
+        self.negative_ttl = negative_ttl
+        if negative_cache_size:     # One negative cache pr. shard, consulted before the shard itself
+            self.negative_cache = [
+                NegativeCache(max(size, 1), negative_ttl, self.clock)
+                for size in split_capacity(negative_cache_size, self.shard_count)
+            ]
+        else:
+            self.negative_cache = None
         self.cache = self._create_caches()
+        self.tracer: Optional[TraceRecorder] = None
+        self.loader = loader
+        if writer is not None:
+            self.store_writer: Optional[StoreWriter] = create_store_writer(
+                write_mode, writer, write_queue_size, flush_interval, flush_batch_size
+            )
+            self._attach_store_writer()
+        else:
+            self.store_writer = None
+        self.removal_dispatcher: Optional[RemovalDispatcher] = None
+        self.memory_governor = memory_governor
+        self.governor_options = dict(governor_options or {})
+        self.governor = self._create_governor()
+        self.estimate_mrc = estimate_mrc or auto_tune
+        self.mrc_options = dict(mrc_options or {})
+        self.auto_tune = auto_tune
+        self.auto_tune_options = dict(auto_tune_options or {})
+        self.estimator = self._create_estimator()
 
         logger.info(f"Cache object {repr(self)} successfully initialized")
 
-    def add(self, key: Any, entry: Any) -> None:
+    def add(self, key: Any, entry: Any, cost: float = 1.0, size: int = 0) -> None:
         """
         Adds new key-value pair to the current cache.
 
         If sharding is enabled, the key is allocated to the correct shard based on it's hashed value.
         If Bloom filter is enabled, the key is stored in the filter's bit arry for future existence checks.
+        If a writer is set, the pair is written through to (or queued for) the backing store first.
 
         ----- Parameters -----
         key: Any
             The identifying key for the cache entry.
         value: Any
             The item/value stored under the associated key.
+        cost: float
+            What recomputing the value costs (e.g. seconds), summed into 'saved_cost' by every hit
+            and weighed by the 'gdsf' strategy (Defaults to 1.0).
+        size: int
+            Size of the value as weighed by the 'gdsf' strategy, 0 uses its shallow memory size (Defaults to 0).
+
+        ----- Exceptions -----
+        TypeError
+            Raised if cost is not a number or size is not an integer.
+        ValueError
+            Raised if cost or size is negative.
         """
+        if not isinstance(cost, (int, float)):
+            raise TypeError("Parameter 'cost' must be of type: float")
+        if cost < 0:
+            raise ValueError("Cost value must not be negative")
+        if not isinstance(size, int):
+            raise TypeError("Parameter 'size' must be of type: int")
+        if size < 0:
+            raise ValueError("Size value must not be negative")
+        if self.tracer is not None:
+            self.tracer.record(OP_ADD, key)
+        if self.estimator is not None:
+            self.estimator.record(OP_ADD, key, cost, size)
+        if self.store_writer is not None:
+            self.store_writer.write(key, entry)         # Write-through raises before anything is cached
+        num = hash_value(key, self.shard_count) if self.shard_count > 1 else 0
+        self._put(key, entry, num, cost, size)
+        if self.removal_dispatcher is not None:
+            self._dispatch_removals(self.shards[num])
+        logger.debug(f"Cache entry: {entry} with key: {key} added to cache.")
+
+    def _put(self, key: Any, entry: Any, num: int, cost: float = 1.0, size: int = 0) -> None:
+        if self.negative_cache is not None:
+            self.negative_cache[num].discard(key)      # The key exists now
         if self.shard_count > 1:
-            num = hash_value(key, self.shard_count)
             if self.bloom_filter:
                 self.bloom_filter[num].add(key)
-            self.cache[num].add(key=key, value=entry)
+                if self.instrumentation != "off":
+                    self.bloom_filter[num].record_insert(key)
+            self.cache[num].add(key, entry, cost, size)
         else:
             if self.bloom_filter:
                 self.bloom_filter.add(key)
-            self.cache.add(key=key, value=entry)
-        logger.debug(f"Cache entry: {entry} with key: {key} added to cache.")
+                if self.instrumentation != "off":
+                    self.bloom_filter.record_insert(key)
+            self.cache.add(key, entry, cost, size)
+        if self.hot_keys is not None:
+            self.hot_keys.invalidate(key)       # After the shard write, a racing replica install sees the new epoch
 
-    def get(self, key: Any) -> Optional[Any]:
+    def get(self, key: Any, default: Any = None) -> Optional[Any]:
         """
         Retrieves the value associated with the given key from the caching system.
 
         If sharding is enabled, the item/value gets retrieved from the appropriate shard.
+        If negative caching is enabled, keys marked missing by add_negative() are answered before the shard.
         If Bloom Filter is enabled, the caching system initially checksfor its existence in the BloomFilter
         bitarry, before making unnecceasry calls.
+        If a loader is set, misses are read from the backing store and cached.
+        If 'l1_size' is set, hot keys are answered from the calling thread's L1 without taking any lock.
+        If 'hot_keys' is set, detected heavy hitters are answered from the calling thread's replica.
 
         ----- Parameters -----
         key: Any
             The key-value associated with the given object.
+        default: Any
+            Returned if the key is not found, expired or known to be missing (Defaults to None).
+            Pass a sentinel to tell a miss apart from a cached None.
 
         ----- Return -----
         Optional[Any]
-            The value associated with the object or None if not found or expired.
+            The value associated with the object or 'default' if not found or expired.
 
         ----- Exceptions -----
         BloomFilterException
             Raised if the Bloom Filter determines that the key is not present in the cache.
         """
+        if self.tracer is not None:
+            self.tracer.record(OP_GET, key)
+        if self.estimator is not None:
+            self.estimator.record(OP_GET, key)
+        if self.l1_size:
+            return self._get_through_l1(key, default)
+        return self._get(key, default)
+
+    def _get_through_l1(self, key: Any, default: Any) -> Any:
+        """
+        Answers from the calling thread's L1 while the key's shard is unchanged, else reads the shard
+        and keeps a copy tagged with the shard's write epoch.
+        """
+        l1 = getattr(self.l1_local, "cache", None)
+        if l1 is None:
+            l1 = self._create_l1()
+        value = l1.lookup(key)
+        if value is not L1_MISS:
+            return value
+
+        shard = self.cache[hash_value(key, self.shard_count)] if self.shard_count > 1 else self.cache
+        epoch = shard.epoch         # Read before the lookup, a write racing it leaves the copy stale, never wrong
+        value = self._get(key, _ABSENT)
+        if value is _ABSENT:
+            return default
+        entry = shard.cache.get(key)
+        if entry is not None:
+            l1.store(key, value, shard, epoch, entry.expiry)
+            if shard.successor is not None:     # Migrated meanwhile, the retired shard's epoch never changes again
+                del l1.entries[key]
+        return value
+
+    def _create_l1(self) -> L1Cache:
+        l1 = L1Cache(self.l1_size)
+        self.l1_local.cache = l1
+        self.l1_caches.add(l1)          # Weakly referenced, metrics of finished threads disappear with them
+        return l1
+
+    def _get(self, key: Any, default: Any) -> Any:
+        if self.hot_keys is None:
+            return self._get_from_shard(key, default)
+        return self._get_replicated(key, default)
+
+    def _get_replicated(self, key: Any, default: Any) -> Any:
+        """
+        Samples the read for hot-key detection and answers hot keys from the calling thread's replica.
+        Sampled reads of hot keys always go to the shard, keeping its recency & frequency data current.
+        """
+        hot_keys = self.hot_keys
+        sampled = hot_keys.should_sample()
+        if sampled:
+            hot_keys.record(key, hash_value(key, self.shard_count) if self.shard_count > 1 else 0)
+        if key not in hot_keys.hot:
+            return self._get_from_shard(key, default)
+        if not sampled:
+            value = hot_keys.read(key)
+            if value is not HOT_MISS:
+                return value
+
+        shard = self.cache[hash_value(key, self.shard_count)] if self.shard_count > 1 else self.cache
+        epoch = shard.epoch         # Read before the lookup, as for the L1
+        value = self._get_from_shard(key, _ABSENT)
+        if value is _ABSENT:
+            hot_keys.invalidate(key)
+            return default
+        entry = shard.cache.get(key)
+        if entry is not None:
+            hot_keys.install(key, value, entry.expiry)
+            if shard.epoch != epoch:        # Written meanwhile, the copy might predate the write's invalidation
+                hot_keys.invalidate(key)
+        return value
+
+    def _get_from_shard(self, key: Any, default: Any) -> Any:
         if self.shard_count > 1:
             num = hash_value(key, self.shard_count)
-            if self.bloom_filter and not self.bloom_filter[num].check(key):
-                logger.debug(f"Bloom filter indicates that {key} is not present in shard {num}")
-                return None
-            return self.cache[num].get(key)
+            shard = self.cache[num]
+            bloom = self.bloom_filter[num] if self.bloom_filter else None
         else:
-            if self.bloom_filter and not self.bloom_filter.check(key):
-                logger.debug(f"Bloom filter indicates that {key} is not present in cache")
-                return None
-            logger.debug(f"Cache entry {key} successfully retreived")
-            return self.cache.get(key)
+            num = 0
+            shard = self.cache
+            bloom = self.bloom_filter
+
+        if self.negative_cache is not None and self.negative_cache[num].contains(key):
+            return default
+
+        if bloom is None:
+            if self.loader is None and self.removal_dispatcher is None:
+                return shard.get(key, default)
+            value = shard.get(key, _ABSENT)
+            if value is _ABSENT and self.loader is not None:
+                value = self._load(key, num)
+            if self.removal_dispatcher is not None:
+                self._dispatch_removals(shard)
+            return default if value is _ABSENT else value
+
+        passed = bloom.check(key)
+        value = shard.get(key, _ABSENT) if passed else _ABSENT
+        if self.instrumentation != "off":       # Sample Bloom Filter outcomes for the realized false positive rate
+            self.bloom_tick += 1
+            if self.bloom_tick >= self.sample_rate:
+                self.bloom_tick = 0
+                bloom.record_check(key, passed, hit=value is not _ABSENT)
+        if not passed:
+            logger.debug(f"Bloom filter indicates that {key} is not present in cache")
+        if value is _ABSENT and self.loader is not None:
+            value = self._load(key, num)
+        if self.removal_dispatcher is not None:
+            self._dispatch_removals(shard)
+        return default if value is _ABSENT else value
+
+    def _load(self, key: Any, num: int) -> Any:
+        """
+        Reads a missed key through the loader, serving unflushed write-behind values first.
+        Returns _ABSENT if the key does not exist in the backing store.
+        """
+        value = _ABSENT
+        if self.store_writer is not None:
+            value = self.store_writer.pending(key, _ABSENT)
+        if value is _ABSENT:
+            value = self.loader(key)
+            if value is None:
+                if self.negative_cache is not None:
+                    self.negative_cache[num].add(key)
+                return _ABSENT
+        self._put(key, value, num)
+        return value
+
+    def add_negative(self, key: Any, ttl: Optional[float] = None) -> None:
+        """
+        Remembers that the key does not exist in the origin, so get() answers it without touching the shard.
+        The mark is dropped once the key is add()-ed, or after 'ttl' seconds (Defaults to 'negative_ttl').
+
+        ----- Exceptions -----
+        ValueError
+            Raised if negative caching is disabled (negative_cache_size=0).
+        """
+        if self.negative_cache is None:
+            raise ValueError("Negative caching is disabled, set 'negative_cache_size' to enable it")
+        num = hash_value(key, self.shard_count) if self.shard_count > 1 else 0
+        self.negative_cache[num].add(key, ttl)
+        if self.l1_size:
+            shard = self.shards[num]
+            with shard.lock:
+                shard.epoch += 1        # After the mark, so L1 copies read before it are served no more
+        if self.hot_keys is not None:
+            self.hot_keys.invalidate(key)
+
+    def is_negative(self, key: Any) -> bool:
+        """
+        Returns True if the key is currently marked as missing by add_negative().
+        """
+        if self.negative_cache is None:
+            return False
+        num = hash_value(key, self.shard_count) if self.shard_count > 1 else 0
+        return self.negative_cache[num].contains(key)
         
     def clear(self) -> None:
         if isinstance(self.cache, list):
@@ -154,18 +612,254 @@ class Cache():
                 shard.clear()
         else:
             self.cache.clear()
+        if self.negative_cache is not None:
+            for negative in self.negative_cache:
+                negative.clear()
+        if self.hot_keys is not None:
+            self.hot_keys.clear()
+        self._dispatch_all_removals()
         logger.info("Cache successfully cleared!")
 
-    def _get_shard_size(self) -> List[int]:
-        base = self.max_cache_size // self.shard_count
-        remainder = self.max_cache_size % self.shard_count
-        shards = []
+    def resize(self, max_cache_size: int) -> int:
+        """
+        Changes the total capacity at runtime, split across the shards like at creation. Shrinking evicts
+        entries chosen by the eviction strategy. A memory governor keeps its current capacity ratio.
+
+        ----- Parameters -----
+        max_cache_size: int
+            The new maximum number of items/values across shards.
+
+        ----- Return -----
+        Int:
+            Number of entries evicted.
+
+        ----- Exceptions -----
+        ValueError
+            Raised if max_cache_size is not an integer of at least 'shard_count'.
+
+        ----- Notes -----
+        Bloom Filters keep the size they were created with, growing past it raises their false positive rate.
+        """
+        if not isinstance(max_cache_size, int) or max_cache_size < self.shard_count:
+            raise ValueError("Parameter 'max_cache_size' must be an integer of at least 'shard_count'")
+        capacities = split_capacity(max_cache_size, self.shard_count)
+        with self.governor.lock if self.governor is not None else nullcontext():
+            ratio = 1.0
+            if self.governor is not None:
+                self.governor.capacities = capacities
+                ratio = self.governor.capacity_ratio
+            evicted = sum(
+                shard.resize(max(1, int(capacity * ratio))) for shard, capacity in zip(self.shards, capacities)
+            )
+            self.max_cache_size = max_cache_size
+        self._dispatch_all_removals()
+        logger.info(f"Cache resized to {max_cache_size} entries, {evicted} evicted")
+        return evicted
+
+    def switch_strategy(self, strategy: str, policy_options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Switches the eviction strategy at runtime, keeping every entry with its value, times & hits.
+
+        Every shard is migrated in turn into a shard of the new strategy (see BaseCache.migrate()). Callers
+        holding the old shard are forwarded to the new one, so no read or write is lost during the switch.
+
+        ----- Parameters -----
+        strategy: str
+            The new eviction strategy, one of the strategies in cache_list.
+        policy_options: Optional[Dict[str, Any]]
+            Extra keyword arguments for the new strategy's shards, the old strategy's options are dropped (Defaults to None).
+
+        ----- Exceptions -----
+        TypeError
+            Raised if strategy is not a string or policy_options is not a dict.
+        ValueError
+            Raised if the strategy is not supported.
+        """
+        cache_class = check_cache_list(strategy)
+        if policy_options is not None and not isinstance(policy_options, dict):
+            raise TypeError("Parameter 'policy_options' must be of type: dict")
+        options = dict(policy_options or {})
+        with self.governor.lock if self.governor is not None else nullcontext():
+            if self.shard_count > 1:
+                for num, shard in enumerate(self.cache):
+                    self.cache[num] = shard.migrate(cache_class, **options)     # The governor shares this list
+            else:
+                self.cache = self.cache.migrate(cache_class, **options)
+                if self.governor is not None:
+                    self.governor.shards = self.shards
+            previous, self.strategy = self.strategy, strategy.casefold()
+            self.policy_options = options
+        logger.info(f"Eviction strategy switched from {previous} to {self.strategy}")
+
+    def on_removal(self, callback: Callable[[Any, Any, str], None]) -> Callable[[Any, Any, str], None]:
+        """
+        Registers a listener called with (key, value, cause) for every entry leaving the cache.
+        Cause is one of 'evicted', 'expired', 'replaced' or 'cleared'. Usable as a decorator.
+
+        Shards only buffer notifications while their lock is held. The buffers are delivered in batches
+        by a separate executor thread, so slow listeners never extend lock hold time.
+
+        ----- Parameters -----
+        callback: Callable[[Any, Any, str], None]
+            The listener. Exceptions it raises are logged and counted, never propagated.
+
+        ----- Return -----
+        Callable:
+            The callback itself.
+
+        ----- Exceptions -----
+        TypeError
+            Raised if the callback is not callable.
+        """
+        if not callable(callback):
+            raise TypeError("Parameter 'callback' must be callable")
+        if self.removal_dispatcher is None:
+            self.removal_dispatcher = RemovalDispatcher()
+            for shard in self.shards:
+                with shard.lock:
+                    shard.removal_buffer = []
+        self.removal_dispatcher.add_listener(callback)
+        return callback
+
+    def _dispatch_removals(self, shard: BaseCache) -> None:
+        removals = shard.take_removals()
+        if removals:
+            self.removal_dispatcher.dispatch(removals)
+
+    def _dispatch_all_removals(self) -> None:
+        """
+        Delivers the buffered removals of every shard, after operations evicting from shards nobody may touch again.
+        """
+        if self.removal_dispatcher is not None:
+            for shard in self.shards:
+                self._dispatch_removals(shard)
+
+    def scan(self, cursor: int = 0, count: int = 100) -> Tuple[int, List[Tuple[Any, Any]]]:
+        """
+        Returns a bounded chunk of live (key, value) pairs, walking the shards one after the other.
+
+        Every shard lock is only held for a single chunk, never across calls, so iterating a large cache
+        does not block writers. Every entry present from the first to the last call is returned at least
+        once. Entries added, replaced or removed during the walk may be returned once, twice or not at all.
 
-        for i in range(self.shard_count):
-            size = base + (1 if i < remainder else 0)
-            shards.append(size)
+        ----- Parameters -----
+        cursor: int
+            The cursor returned by the previous call, 0 to start a new walk (Defaults to 0).
+        count: int
+            Maximum number of pairs returned, and of slots examined, pr. call (Defaults to 100).
+
+        ----- Return -----
+        Tuple[int, List[Tuple[Any, Any]]]:
+            The cursor for the next call (0 once every shard was walked) and the pairs found.
+
+        ----- Exceptions -----
+        ValueError
+            Raised if cursor is negative or count is not positive.
+        """
+        if not isinstance(cursor, int) or cursor < 0:
+            raise ValueError("Parameter 'cursor' must be a non-negative integer")
+        if not isinstance(count, int) or count <= 0:
+            raise ValueError("Parameter 'count' must be a positive integer")
+
+        shards = self.shards
+        slot, shard_index = divmod(cursor, self.shard_count)      # Cursor = slot * shard_count + shard index
+        items: List[Tuple[Any, Any]] = []
+        while shard_index < self.shard_count and len(items) < count:
+            slot, chunk = shards[shard_index].scan(slot, count - len(items))
+            items.extend(chunk)
+            if slot == 0:
+                shard_index += 1
+        if shard_index >= self.shard_count:
+            return 0, items
+        return slot * self.shard_count + shard_index, items
+
+    def iter_snapshot(self) -> Iterator[Tuple[Any, Any]]:
+        """
+        Yields the live (key, value) pairs shard by shard, copying each shard's keys in one short
+        critical section instead of holding its lock while the caller consumes the entries.
+        """
+        for shard in self.shards:
+            yield from shard.iter_snapshot()
+
+    def start_trace(self, path: str, buffer_records: int = 4096) -> TraceRecorder:
+        """
+        Starts recording every add() & get() call (hashed key, op type, timestamp) into a binary trace,
+        which can be replayed offline with 'python -m macho.simulate'.
+
+        ----- Parameters -----
+        path: str
+            Destination trace file (overwritten).
+        buffer_records: int
+            Number of records buffered in memory before writing to disk (Defaults to 4096).
+        """
+        self.stop_trace()
+        self.tracer = TraceRecorder(path, buffer_records=buffer_records)
+        logger.info(f"Access trace recording started at {path}")
+        return self.tracer
+
+    def stop_trace(self) -> None:
+        """
+        Stops the active trace recording (if any) and flushes it to disk.
+        """
+        tracer, self.tracer = self.tracer, None
+        if tracer is not None:
+            tracer.close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until every queued write-behind write has been persisted by the writer.
+
+        ----- Return -----
+        Bool:
+            True if all writes were flushed, False if 'timeout' seconds passed first.
+        """
+        if self.store_writer is None:
+            return True
+        return self.store_writer.flush(timeout)
+
+    def close(self) -> None:
+        """
+        Flushes & stops the write-behind worker, delivers pending removal notifications,
+        stops the memory governor, the miss-ratio curve estimator and the active trace recording (if any).
+        A coarse clock's ticker is stopped too, unless the clock instance was passed in by the caller.
+        """
+        if self.governor is not None:
+            self.governor.close()
+        if self.estimator is not None:
+            self.estimator.close()
+        if self.store_writer is not None:
+            self.store_writer.close()
+        if self.removal_dispatcher is not None:
+            dispatcher, self.removal_dispatcher = self.removal_dispatcher, None
+            for shard in self.shards:
+                dispatcher.dispatch(shard.take_removals())
+                shard.removal_buffer = None
+            dispatcher.close()
+        self.stop_trace()
+        if self.owns_clock:
+            self.clock.close()
+
+    def _create_estimator(self) -> Optional[MissRatioEstimator]:
+        if not self.estimate_mrc:
+            return None
+        estimator = MissRatioEstimator(self.max_cache_size, self.strategy, self.policy_options, **self.mrc_options)
+        if self.auto_tune:
+            estimator.tuner = AutoTuner(self, **self.auto_tune_options)
+        return estimator
+
+    def _create_governor(self) -> Optional[MemoryGovernor]:
+        if not self.memory_governor:
+            return None
+        capacities = self._get_shard_size() if self.shard_count > 1 else [self.max_cache_size]
+        on_resize = partial(_dispatch_after_resize, weakref.ref(self))      # Weak, the governor never keeps its cache alive
+        return MemoryGovernor(self.shards, capacities, on_resize=on_resize, **self.governor_options)
+
+    def _attach_store_writer(self) -> None:
+        for shard in self.shards:           # Evicting a dirty key flushes it, instead of waiting out the interval
+            shard.evict_listener = self.store_writer.on_evict
 
-        return shards
+    def _get_shard_size(self) -> List[int]:
+        return split_capacity(self.max_cache_size, self.shard_count)
     
     def _create_caches(self) -> Union[BaseCache, List[BaseCache]]:
         if self.shard_count == 1:
@@ -178,9 +872,19 @@ class Cache():
             ttl=self.ttl,
             shards=self.shard_count,
             policy=self.strategy,
-            shards_capacity=shard_size
+            shards_capacity=shard_size,
+            instrumentation=self.instrumentation,
+            sample_rate=self.sample_rate,
+            policy_options=self.policy_options,
+            admission=self.admission,
+            clock=self.clock,
+            interning=self.intern_store
         )
     
+    @property
+    def shards(self) -> List[BaseCache]:
+        return self.cache if isinstance(self.cache, list) else [self.cache]
+
     @property
     def current_size(self):
         if isinstance(self.cache, list):
@@ -201,6 +905,17 @@ class Cache():
             return [shard.latencies for shard in self.cache]
         else:
             return self.cache.latencies
+
+    @property
+    def merged_latencies(self):
+        if isinstance(self.cache, list):     # Shard histograms share one layout, merging is O(buckets)
+            histograms = {
+                label: LogHistogram.merged(shard.latency_histograms[label] for shard in self.cache)
+                for label in self.cache[0].latency_histograms
+            }
+            return BaseCache.summarize_latencies(histograms)
+        else:
+            return self.cache.latencies
     
     @property
     def metric_lifespan(self):
@@ -208,35 +923,208 @@ class Cache():
             return [shard.metric_lifespan for shard in self.cache]
         else:
             return self.cache.metric_lifespan
+
+    @property
+    def lifecycle(self) -> Dict[str, Any]:
+        """
+        Entry lifecycle summaries merged across shards: lifespan, idle time & time-to-first-hit
+        (seconds), hits pr. entry, and how many entries capacity vs. expiry removed.
+        """
+        shards = self.shards
+        histograms = {          # Shard histograms share one layout, merging is O(buckets)
+            label: LogHistogram.merged(shard.lifecycle_histograms[label] for shard in shards)
+            for label in shards[0].lifecycle_histograms
+        }
+        return BaseCache.summarize_lifecycle(
+            histograms,
+            sum(shard.evictions for shard in shards),
+            sum(shard.expirations for shard in shards)
+        )
     
+    @property
+    def saved_cost(self) -> float:
+        """
+        Recompute cost saved by shard hits, the sum of the hit entries' 'cost'.
+        """
+        return sum(shard.saved_cost for shard in self.shards)
+
+    @property
+    def miss_ratio_curve(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        The estimated miss ratio of every eviction strategy pr. cache size, as [{'size', 'miss_ratio'}].
+
+        ----- Exceptions -----
+        ValueError
+            Raised if estimation is disabled (estimate_mrc=False).
+        """
+        if self.estimator is None:
+            raise ValueError("Miss-ratio curve estimation is disabled, set 'estimate_mrc' to enable it")
+        return self.estimator.curve
+
+    @property
+    def bloom_filters(self) -> List[Any]:
+        if self.bloom_filter is None:
+            return []
+        return self.bloom_filter if isinstance(self.bloom_filter, list) else [self.bloom_filter]
+
+    @property
+    def realized_fpr(self) -> float:
+        false_positives = sum(bloom.false_positives for bloom in self.bloom_filters)
+        absent = false_positives + sum(bloom.rejected for bloom in self.bloom_filters)
+        return false_positives / absent if absent else 0.0
+
+    def flush_l1_hits(self) -> None:
+        """
+        Folds the calling thread's buffered L1 hits back into the shards. Other threads fold theirs
+        every HIT_BATCH hits, so shard hit counters may lag by up to that many hits pr. thread.
+        """
+        l1 = getattr(self.l1_local, "cache", None)
+        if l1 is not None and l1.pending:
+            l1.flush_hits()
+
     @property
     def metrics(self): 
+        self.flush_l1_hits()
         if isinstance(self.cache, list):
-            return [shard.metrics for shard in self.cache]
+            shard_metrics = [shard.metrics for shard in self.cache]
         else:
-            return self.cache.metrics
+            shard_metrics = [self.cache.metrics]
+
+        for metrics, bloom in zip(shard_metrics, self.bloom_filters):     # Bloom Filters are created pr. shard
+            metrics["bloom"] = bloom.bloom_metrics
+        for metrics, negative in zip(shard_metrics, self.negative_cache or []):
+            metrics["negative"] = negative.negative_metrics
+        if self.store_writer is not None:
+            store_metrics = self.store_writer.store_metrics
+            for metrics in shard_metrics:       # One writer is shared by every shard
+                metrics["store"] = store_metrics
+        if self.l1_size:
+            l1_metrics = self.l1_metrics
+            for metrics in shard_metrics:       # L1s are pr. thread, spanning every shard
+                metrics["l1"] = l1_metrics
+        if self.hot_keys is not None:
+            hot_key_metrics = self.hot_keys.hot_key_metrics
+            for metrics, requests in zip(shard_metrics, hot_key_metrics["shard_requests"]):
+                metrics["hot_keys"] = hot_key_metrics
+                metrics["sampled_requests"] = requests
+        if self.intern_store is not None:
+            intern_metrics = self.intern_store.intern_metrics
+            for metrics in shard_metrics:       # One store is shared by every shard
+                metrics["interning"] = intern_metrics
+        if self.governor is not None:
+            governor_metrics = self.governor.governor_metrics
+            for metrics in shard_metrics:       # One governor resizes every shard
+                metrics["memory_pressure"] = governor_metrics
+        if self.estimator is not None:
+            estimator_metrics = self.estimator.estimator_metrics
+            for metrics in shard_metrics:       # Ghosts replay the whole cache's sampled keys
+                metrics["mrc"] = estimator_metrics
+
+        return shard_metrics if isinstance(self.cache, list) else shard_metrics[0]
         
+    @property
+    def l1_metrics(self) -> Dict[str, Any]:
+        threads = [l1.l1_metrics for l1 in list(self.l1_caches)]
+        hits = sum(thread["hits"] for thread in threads)
+        total = hits + sum(thread["misses"] for thread in threads)
+        return {
+            "size": self.l1_size,
+            "hits": hits,
+            "hit_ratio": round(hits / total, 2) if total else 0.00,
+            "threads": threads
+        }
+
     def get_metrics(self):
+        self.flush_l1_hits()
         return {
             "max_cache_size": self.max_cache_size,
             "current_size": self.current_size,
+            "saved_cost": self.saved_cost,
             "ttl": self.ttl,
             "shard_count": self.shard_count,
             "bloom": self.bloom,
-            "probability": self.probability
+            "probability": self.probability,
+            "bloom_kind": self.bloom_kind,
+            "realized_fpr": self.realized_fpr,
+            "negative_cache_size": self.negative_cache_size,
+            "negative_hits": sum(negative.hits for negative in self.negative_cache or []),
+            "instrumentation": self.instrumentation,
+            "sample_rate": self.sample_rate,
+            "strategy": self.strategy,
+            "policy_options": self.policy_options,
+            "auto_tune_actions": (
+                self.estimator.tuner.actions if self.estimator is not None and self.estimator.tuner is not None else 0
+            ),
+            "admission": self.admission,
+            "clock": self.clock.kind,
+            "capacity_ratio": self.governor.capacity_ratio if self.governor is not None else 1.0,
+            "dedup_ratio": self.intern_store.intern_metrics["dedup_ratio"] if self.intern_store is not None else None,
+            "bytes_saved": self.intern_store.bytes_saved if self.intern_store is not None else 0,
+            "l1_size": self.l1_size,
+            "l1_hit_ratio": self.l1_metrics["hit_ratio"],
+            "hot_keys": self.hot_keys.hot_key_metrics["hot_keys"] if self.hot_keys is not None else [],
+            "shard_skew": self.hot_keys.shard_skew if self.hot_keys is not None else None,
+            "admissions": sum(shard.admission.admissions for shard in self.shards if shard.admission is not None),
+            "rejections": sum(shard.admission.rejections for shard in self.shards if shard.admission is not None),
+            "write_mode": self.store_writer.mode if self.store_writer is not None else None,
+            "removals": (
+                self.removal_dispatcher.removal_metrics if self.removal_dispatcher is not None else None
+            )
         }
     
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Shards, Bloom Filters & negative caches pickle themselves. An active trace is not carried over.
+        Queued write-behind writes are flushed first, for at most '_PICKLE_FLUSH_TIMEOUT' seconds. Writes the
+        store did not acknowledge by then are pickled with the copy, whose own worker thread flushes them.
+        Removal listeners are not carried over, the copy starts its own memory governor & miss-ratio curve estimator.
+        """
+        if self.store_writer is not None and not self.store_writer.flush(_PICKLE_FLUSH_TIMEOUT):
+            logger.warning(
+                f"Backing store did not acknowledge {self.store_writer.queue_depth} queued writes within "
+                f"{_PICKLE_FLUSH_TIMEOUT}s, pickling them unflushed"
+            )
+        return {
+            name: getattr(self, name) for name in self.__slots__
+            if name not in ("tracer", "removal_dispatcher", "l1_local", "l1_caches", "governor", "estimator", "__weakref__")
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.tracer = None
+        self.removal_dispatcher = None
+        self.owns_clock = True              # Clocks unpickle as new instances, private to the copy
+        self.l1_local = threading.local()
+        self.l1_caches = weakref.WeakSet()
+        self.governor = self._create_governor()
+        self.estimator = self._create_estimator()
+        if self.store_writer is not None:
+            self._attach_store_writer()
+
     def __len__(self):
         return self.current_size
+
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return self.iter_snapshot()
     
     def __contains__(self, key: Any) -> bool:
-        return self.get(key) is not None
+        return self.get(key, _ABSENT) is not _ABSENT
     
     def __getitem__(self, key: Any) -> Any:
-        value = self.get(key)
-        if value is None:
+        value = self.get(key, _ABSENT)
+        if value is _ABSENT:
             raise KeyError(f"{key} not found!")
         return value
 
     def __repr__(self):
-        return (f"<Cache(size={self.max_cache_size}, ttl={self.ttl}, eviction strategy={self.strategy})>")
\ No newline at end of file
+        return (f"<Cache(size={self.max_cache_size}, ttl={self.ttl}, eviction strategy={self.strategy})>")
+
+def _dispatch_after_resize(cache_ref: "weakref.ref[Cache]") -> None:
+    """
+    Called by the memory governor after resizing the shards, delivers the removal notifications of
+    the entries it evicted, which idle shards would otherwise hold back until their next add() or get().
+    """
+    cache = cache_ref()
+    if cache is not None:
+        cache._dispatch_all_removals()
\ No newline at end of file
@@ -0,0 +1,10 @@
+# --------------- Imports ---------------
+
+from .histogram import LogHistogram
+from .topk import SpaceSaving
+
+# --------------- Package Manager ---------------
+
+__all__ = ["LogHistogram", "SpaceSaving"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
@@ -0,0 +1,183 @@
+# --------------- Imports ---------------
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+# --------------- Bucket Layout ---------------
+
+SUB_BUCKET_BITS = 4                                 # 16 linear sub-buckets pr. power of two (~6% relative error)
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+MAX_VALUE_BITS = 42                                 # Values above 2^42 (~73 minutes in ns) are clamped
+MAX_VALUE = (1 << MAX_VALUE_BITS) - 1
+BUCKET_COUNT = (MAX_VALUE_BITS - SUB_BUCKET_BITS + 1) * SUB_BUCKET_COUNT
+
+PERCENTILES = (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("p999", 0.999))
+
+
+def _bucket_bounds(index: int) -> Tuple[int, int]:
+    if index < SUB_BUCKET_COUNT:
+        return index, index
+    shift = (index >> SUB_BUCKET_BITS) - 1
+    mantissa = (index & (SUB_BUCKET_COUNT - 1)) + SUB_BUCKET_COUNT
+    return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+# --------------- Log-bucketed Histogram ---------------
+
+class LogHistogram():
+    """
+    A fixed-memory, log-bucketed histogram for non-negative integer samples (HDR-style).
+
+    Every power of two is split into 16 linear sub-buckets, so recorded values keep a relative
+    precision of roughly 6% regardless of magnitude, while memory stays constant for the lifetime
+    of the histogram. Histograms with the same layout can be merged in O(buckets).
+
+    ----- Notes -----
+    - Values are expected as integers (e.g. nanoseconds from time.perf_counter_ns()).
+    - Negative values are recorded as 0, values above 2^42 are clamped.
+    - Not thread-safe on its own, callers record samples under their own lock.
+    """
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        """
+        Records a single sample.
+
+        ----- Parameters -----
+        value: int
+            The sample to record (e.g. a latency in nanoseconds).
+        """
+        if value < 0:
+            value = 0
+        elif value > MAX_VALUE:
+            value = MAX_VALUE
+
+        if value < SUB_BUCKET_COUNT:
+            index = value
+        else:
+            shift = value.bit_length() - SUB_BUCKET_BITS - 1
+            index = ((shift + 1) << SUB_BUCKET_BITS) + (value >> shift) - SUB_BUCKET_COUNT
+        self.counts[index] += 1
+
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: "LogHistogram") -> "LogHistogram":
+        """
+        Adds every sample of another histogram into the current one, in O(buckets).
+
+        ----- Parameters -----
+        other: LogHistogram
+            The histogram to merge into the current one.
+
+        ----- Return -----
+        LogHistogram:
+            The current (updated) histogram, to allow chaining.
+        """
+        if not other.count:
+            return self
+        counts = self.counts
+        for index, amount in enumerate(other.counts):
+            if amount:
+                counts[index] += amount
+        self.min = other.min if not self.count else min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+        return self
+
+    @classmethod
+    def merged(cls, histograms: Iterable["LogHistogram"]) -> "LogHistogram":
+        result = cls()
+        for histogram in histograms:
+            result.merge(histogram)
+        return result
+
+    def copy(self) -> "LogHistogram":
+        """
+        Returns an independent copy, safe to take while another thread records samples.
+        """
+        clone = LogHistogram.__new__(LogHistogram)
+        clone.counts = list(self.counts)
+        clone.count = sum(clone.counts)         # A record() racing the copy may have bumped a bucket, not yet 'count'
+        clone.total = self.total
+        clone.min = self.min
+        clone.max = self.max
+        return clone
+
+    def reset(self) -> None:
+        self.counts = [0] * BUCKET_COUNT
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def percentile(self, quantile: float) -> int:
+        """
+        Estimates the value at the given quantile.
+
+        ----- Parameters -----
+        quantile: float
+            The desired quantile, between 0.0 - 1.0 (e.g. 0.99 for p99).
+
+        ----- Return -----
+        Int:
+            The midpoint of the bucket holding the quantile, clipped to the recorded min/max
+            (0 if the histogram is empty).
+        """
+        if not self.count:
+            return 0
+        target = max(1, int(quantile * self.count + 0.5))
+        seen = 0
+        for index, amount in enumerate(self.counts):
+            if amount:
+                seen += amount
+                if seen >= target:
+                    low, high = _bucket_bounds(index)
+                    return min(max((low + high) // 2, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def buckets(self) -> List[Tuple[int, int, int]]:
+        """
+        Returns every non-empty bucket as a (lowest value, highest value, count) tuple.
+        """
+        return [
+            _bucket_bounds(index) + (amount,)
+            for index, amount in enumerate(self.counts)
+            if amount
+        ]
+
+    def summary(self, scale: float = 1.0) -> Dict[str, Any]:
+        """
+        Summarizes the histogram, dividing every value by the given scale
+        (e.g. 1e9 to convert nanoseconds into seconds).
+        """
+        summary = {
+            "count": self.count,
+            "mean": self.mean / scale,
+            "min": self.min / scale,
+            "max": self.max / scale
+        }
+        for label, quantile in PERCENTILES:
+            summary[label] = self.percentile(quantile) / scale
+        return summary
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self):
+        return f"<LogHistogram(count={self.count}, min={self.min}, max={self.max})>"
@@ -0,0 +1,100 @@
+# --------------- Imports ---------------
+
+from typing import Any, Dict, List, Tuple
+
+# --------------- Space-Saving Top-K ---------------
+
+class SpaceSaving():
+    """
+    Tracks the most frequent keys of a stream in fixed memory (Space-Saving algorithm).
+
+    At most 'capacity' counters are kept. A key without a counter takes over the smallest one,
+    inheriting its count as the key's maximum over-estimation ('error'). Any key occurring more
+    than total / capacity times is guaranteed to hold a counter.
+
+    ----- Parameters -----
+    capacity: int
+        Number of counters, i.e. the largest K that can be reported.
+
+    ----- Notes -----
+    The keys holding the smallest count are cached, so taking over a counter is amortized O(1)
+    instead of a scan over every counter. Not thread-safe, callers offer keys under their own lock.
+    """
+
+    __slots__ = ("capacity", "counters", "total", "smallest", "smallest_keys")
+
+    def __init__(self, capacity: int):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Parameter 'capacity' must be a positive integer")
+
+        self.capacity = capacity
+        self.counters: Dict[Any, List[int]] = {}       # Key -> [count, error]
+        self.total = 0
+        self.smallest = 0
+        self.smallest_keys: List[Any] = []
+
+    def offer(self, key: Any) -> None:
+        self.total += 1
+        counter = self.counters.get(key)
+        if counter is not None:
+            counter[0] += 1
+        elif len(self.counters) < self.capacity:
+            self.counters[key] = [1, 0]
+        else:
+            count = self._take_smallest()
+            self.counters[key] = [count + 1, count]
+
+    def _take_smallest(self) -> int:
+        counters, smallest = self.counters, self.smallest
+        while self.smallest_keys:       # Cached keys may have grown since, or been halved away
+            candidate = self.smallest_keys.pop()
+            counter = counters.get(candidate)
+            if counter is not None and counter[0] == smallest:
+                del counters[candidate]
+                return smallest
+        smallest = self.smallest = min(counter[0] for counter in counters.values())
+        self.smallest_keys = [candidate for candidate, counter in counters.items() if counter[0] == smallest]
+        del counters[self.smallest_keys.pop()]
+        return smallest
+
+    def guaranteed(self, key: Any) -> int:
+        """
+        Lower bound of the key's count (count - error), 0 if the key holds no counter.
+        """
+        counter = self.counters.get(key)
+        return counter[0] - counter[1] if counter is not None else 0
+
+    def top(self, count: int = 0) -> List[Tuple[Any, int, int]]:
+        """
+        Returns (key, count, error) tuples, most frequent first ('count' of them, 0 for all).
+        """
+        ranked = sorted(
+            ((key, counter[0], counter[1]) for key, counter in self.counters.items()),
+            key=lambda item: item[1],
+            reverse=True
+        )
+        return ranked[:count] if count else ranked
+
+    def halve(self) -> None:
+        """
+        Halves every count (and error), so past popularity fades instead of pinning keys forever.
+        """
+        for key in list(self.counters):
+            counter = self.counters[key]
+            counter[0] >>= 1
+            counter[1] >>= 1
+            if not counter[0]:
+                del self.counters[key]
+        self.total >>= 1
+        self.smallest_keys = []
+
+    def clear(self) -> None:
+        self.counters.clear()
+        self.total = 0
+        self.smallest_keys = []
+
+    def __len__(self) -> int:
+        return len(self.counters)
+
+    def __repr__(self):
+        return f"<SpaceSaving(capacity={self.capacity}, tracked={len(self.counters)}, total={self.total})>"
@@ -1,9 +1,36 @@
 # --------------- Imports ---------------
 
-from .models import LRUCache, FIFOCache, RandomCache, BaseCache, CacheEntry
+from .models import LRUCache, FIFOCache, RandomCache, SLRUCache, TwoQueueCache, GDSFCache, BaseCache, CacheEntry, INSTRUMENTATION_LEVELS, instrumented
+from .negative import NegativeCache
+from .removal import REMOVAL_CAUSES, RemovalDispatcher
+from .admission import CountMinSketch, TinyLFUAdmission
+from .local import L1_MISS, L1Cache
+from .hotkeys import HOT_MISS, HotKeyReplicas
+from .interning import InternStore
 
 # --------------- Package Manager ---------------
 
-__all__ = ["LRUCache", "FIFOCache", "RandomCache", "BaseCache", "CacheEntry"]
+__all__ = [
+    "LRUCache",
+    "FIFOCache",
+    "RandomCache",
+    "SLRUCache",
+    "TwoQueueCache",
+    "GDSFCache",
+    "BaseCache",
+    "CacheEntry",
+    "NegativeCache",
+    "RemovalDispatcher",
+    "REMOVAL_CAUSES",
+    "CountMinSketch",
+    "TinyLFUAdmission",
+    "L1Cache",
+    "L1_MISS",
+    "HotKeyReplicas",
+    "HOT_MISS",
+    "InternStore",
+    "INSTRUMENTATION_LEVELS",
+    "instrumented"
+]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
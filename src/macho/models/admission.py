@@ -0,0 +1,183 @@
+# --------------- Imports ---------------
+
+from typing import Any, Dict, Tuple
+
+import mmh3
+
+# --------------- Frequency Sketch ---------------
+
+MAX_COUNT = 15                                          # 4-bit saturating counters, as in TinyLFU
+_HALVE = bytes(count >> 1 for count in range(256))      # Translation table halving every counter at once
+
+def _next_power_of_two(value: int) -> int:
+    return 1 << max(value - 1, 1).bit_length()
+
+class CountMinSketch():
+    """
+    A Count-Min Sketch of saturating counters, estimating how often a key was recorded.
+
+    Every row is a bytearray indexed by a different combination of the key's two 64-bit hashes.
+    Increments use conservative update (only the row counters equal to the estimate grow),
+    which keeps over-estimation from colliding keys low.
+
+    ----- Parameters -----
+    width: int
+        Counters pr. row, rounded up to a power of two.
+    depth: int
+        Number of rows (Defaults to 4).
+    """
+
+    __slots__ = ("width", "mask", "depth", "rows")
+
+    def __init__(self, width: int, depth: int = 4):
+        self.width = _next_power_of_two(width)
+        self.mask = self.width - 1
+        self.depth = depth
+        self.rows = [bytearray(self.width) for _ in range(depth)]
+
+    def estimate(self, first: int, second: int) -> int:
+        mask = self.mask
+        return min(row[(first + index * second) & mask] for index, row in enumerate(self.rows))
+
+    def increment(self, first: int, second: int) -> None:
+        mask = self.mask
+        positions = [(first + index * second) & mask for index in range(self.depth)]
+        counts = [row[position] for row, position in zip(self.rows, positions)]
+        lowest = min(counts)
+        if lowest >= MAX_COUNT:
+            return
+        for row, position, count in zip(self.rows, positions, counts):
+            if count == lowest:
+                row[position] = count + 1
+
+    def halve(self) -> None:
+        self.rows = [row.translate(_HALVE) for row in self.rows]
+
+    @property
+    def nbytes(self) -> int:
+        return self.width * self.depth
+
+# --------------- TinyLFU Admission ---------------
+
+class TinyLFUAdmission():
+    """
+    Admission filter deciding whether a new key may displace the eviction strategy's victim (TinyLFU).
+
+    Every access to a shard is recorded. A key's first access only sets its bits in the doorkeeper,
+    a small Bloom Filter, so one-hit wonders never reach the Count-Min Sketch. Later accesses increment
+    the sketch. Once 'sample_size' accesses were recorded, every counter is halved and the doorkeeper
+    is cleared, so the estimates follow recent popularity instead of all-time counts.
+
+    ----- Parameters -----
+    capacity: int
+        Maximum number of entries in the owning cache/shard, sizes the sketch & doorkeeper.
+
+    ----- Notes -----
+    A candidate is admitted only if its estimated frequency is strictly higher than the victim's,
+    ties keep the entry already cached. Not thread-safe, the owning shard's lock must be held.
+    """
+
+    __slots__ = (
+        "capacity",
+        "sample_size",
+        "sketch",
+        "doorkeeper",
+        "doorkeeper_mask",
+        "additions",
+        "admissions",
+        "rejections",
+        "resets"
+    )
+
+    DOORKEEPER_HASHES = 3
+
+    def __init__(self, capacity: int):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Parameter 'capacity' must be a positive integer")
+
+        self.capacity = capacity
+        self.sample_size = 10 * capacity                        # Accesses recorded between agings
+        self.sketch = CountMinSketch(capacity)
+        doorkeeper_bits = _next_power_of_two(self.sample_size * 8)     # ~8 bits pr. key seen within a sample
+        self.doorkeeper = bytearray(doorkeeper_bits // 8)
+        self.doorkeeper_mask = doorkeeper_bits - 1
+        self.additions = 0
+        self.admissions = 0
+        self.rejections = 0
+        self.resets = 0
+
+    @staticmethod
+    def _hash(key: Any) -> Tuple[int, int]:
+        first, second = mmh3.hash64(str(key), seed=11, signed=False)
+        return first, second | 1            # An odd step reaches every counter of a power-of-two row
+
+    def _in_doorkeeper(self, first: int, second: int) -> bool:
+        doorkeeper, mask = self.doorkeeper, self.doorkeeper_mask
+        for index in range(1, self.DOORKEEPER_HASHES + 1):
+            bit = (second + index * first) & mask
+            if not doorkeeper[bit >> 3] & (1 << (bit & 7)):
+                return False
+        return True
+
+    def record(self, key: Any) -> None:
+        """
+        Records a single access to the key.
+        """
+        first, second = self._hash(key)
+        if self._in_doorkeeper(first, second):
+            self.sketch.increment(first, second)
+        else:
+            doorkeeper, mask = self.doorkeeper, self.doorkeeper_mask
+            for index in range(1, self.DOORKEEPER_HASHES + 1):
+                bit = (second + index * first) & mask
+                doorkeeper[bit >> 3] |= 1 << (bit & 7)
+
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def _age(self) -> None:
+        self.sketch.halve()
+        self.doorkeeper = bytearray(len(self.doorkeeper))
+        self.additions = 0
+        self.resets += 1
+
+    def frequency(self, key: Any) -> int:
+        """
+        Estimated number of recent accesses to the key.
+        """
+        first, second = self._hash(key)
+        return self.sketch.estimate(first, second) + self._in_doorkeeper(first, second)
+
+    def admit(self, candidate: Any, victim: Any) -> bool:
+        """
+        Returns True if the candidate should replace the victim, counting the decision.
+        """
+        if self.frequency(candidate) > self.frequency(victim):
+            self.admissions += 1
+            return True
+        self.rejections += 1
+        return False
+
+    def clear(self) -> None:
+        self.sketch = CountMinSketch(self.capacity)
+        self.doorkeeper = bytearray(len(self.doorkeeper))
+        self.additions = 0
+        self.admissions = 0
+        self.rejections = 0
+        self.resets = 0
+
+    @property
+    def admission_metrics(self) -> Dict[str, Any]:
+        decisions = self.admissions + self.rejections
+        return {
+            "admissions": self.admissions,
+            "rejections": self.rejections,
+            "admission_ratio": round(self.admissions / decisions, 2) if decisions else 0.00,
+            "resets": self.resets,
+            "sample_size": self.sample_size,
+            "memory_bytes": self.sketch.nbytes + len(self.doorkeeper)
+        }
+
+    def __repr__(self):
+        return f"<TinyLFUAdmission(capacity={self.capacity}, admissions={self.admissions}, rejections={self.rejections})>"
@@ -0,0 +1,222 @@
+# --------------- Imports ---------------
+
+from itertools import count
+from threading import Lock, local
+from typing import Any, Dict, FrozenSet, List, Tuple
+
+from macho.clock import PRECISE_CLOCK, Clock
+from macho.metrics import SpaceSaving
+
+# --------------- Hot-key Replication ---------------
+
+HOT_MISS = object()     # Returned by read() when the calling thread's replica holds no valid copy
+
+class HotKeyReplicas():
+    """
+    Detects the hottest keys read through Cache.get() and serves them from read-only replicas.
+
+    One out of every 'sample_rate' reads is offered to a Space-Saving tracker and counted against
+    its shard. The tracker holds at least 4 / threshold counters, so its over-estimation stays below
+    a quarter of the threshold and keys just above it are reliably found. Every 'window' samples
+    the hot set is recomputed: a key is hot once its guaranteed count reaches 'threshold' of the
+    sampled reads, after which all counts are halved, so keys cool down again once their traffic
+    moves elsewhere.
+
+    A hot key is copied into 'replica_count' plain dicts. Every thread is assigned one replica
+    (round-robin, on first use) and reads it without taking any lock, so readers of a single hot
+    key are no longer serialized on its shard's lock. Writes invalidate every replica of the key.
+
+    ----- Parameters -----
+    top_k: int
+        Maximum number of hot keys, and of keys reported as the top-K.
+    replica_count: int
+        Number of read-only copies kept pr. hot key.
+    threshold: float
+        Share of the sampled reads a key needs to become hot (between 0.0 - 1.0).
+    shard_count: int
+        Number of shards the sampled reads are counted against.
+    sample_rate: int
+        Offers 1 out of every N reads to the tracker (Defaults to 16).
+    window: int
+        Samples between hot set refreshes (Defaults to 1024).
+    clock: Clock
+        Time source of the replicas' expiry times, shared with the shards (Defaults to the precise clock).
+
+    ----- Notes -----
+    Replicas carry the entry's expiry, but do not follow capacity evictions: an evicted hot key
+    is served until a sampled read misses its shard, a write replaces it or it expires.
+    """
+
+    __slots__ = (
+        "top_k",
+        "replica_count",
+        "threshold",
+        "shard_count",
+        "sample_rate",
+        "window",
+        "clock",
+        "tracker",
+        "shard_requests",
+        "hot",
+        "replicas",
+        "assignments",
+        "local",
+        "lock",
+        "tick",
+        "samples",
+        "refreshes",
+        "promotions",
+        "replica_hits",
+        "replica_misses",
+        "invalidations"
+    )
+
+    def __init__(
+            self,
+            top_k: int,
+            replica_count: int,
+            threshold: float,
+            shard_count: int,
+            sample_rate: int = 16,
+            window: int = 1024,
+            clock: Clock = PRECISE_CLOCK
+        ):
+        if not isinstance(top_k, int) or top_k <= 0:
+            raise ValueError("Parameter 'top_k' must be a positive integer")
+        if not isinstance(replica_count, int) or replica_count <= 0:
+            raise ValueError("Parameter 'replica_count' must be a positive integer")
+        if not isinstance(threshold, float) or not 0.00 < threshold < 1.00:
+            raise ValueError("Parameter 'threshold' must be a float between 0.00 - 1.00")
+
+        self.top_k = top_k
+        self.replica_count = replica_count
+        self.threshold = threshold
+        self.shard_count = shard_count
+        self.sample_rate = sample_rate
+        self.window = window
+        self.clock = clock
+        self.tracker = SpaceSaving(max(top_k, round(4 / threshold)))
+        self.shard_requests = [0] * shard_count
+        self.hot: FrozenSet[Any] = frozenset()
+        self._reset_replicas()
+        self.tick = 0
+        self.samples = 0
+        self.refreshes = 0
+        self.promotions = 0
+        self.replica_hits = 0
+        self.replica_misses = 0
+        self.invalidations = 0
+
+    def _reset_replicas(self) -> None:
+        self.replicas: List[Dict[Any, Tuple[Any, float]]] = [{} for _ in range(self.replica_count)]    # Key -> (value, expiry)
+        self.assignments = count()
+        self.local = local()
+        self.lock = Lock()
+
+    def _replica(self) -> Dict[Any, Tuple[Any, float]]:
+        index = getattr(self.local, "replica", None)
+        if index is None:
+            index = self.local.replica = next(self.assignments) % self.replica_count
+        return self.replicas[index]
+
+    def should_sample(self) -> bool:
+        """
+        Returns True for 1 out of every 'sample_rate' calls. Racing increments may skip a sample.
+        """
+        self.tick += 1
+        if self.tick < self.sample_rate:
+            return False
+        self.tick = 0
+        return True
+
+    def record(self, key: Any, shard_index: int) -> None:
+        """
+        Offers a sampled read to the tracker, refreshing the hot set once a window is complete.
+        """
+        with self.lock:
+            self.tracker.offer(key)
+            self.shard_requests[shard_index] += 1
+            self.samples += 1
+            if self.samples >= self.window:
+                self._refresh()
+
+    def _refresh(self) -> None:
+        floor = max(self.threshold * self.tracker.total, 1.0)
+        hot = frozenset(key for key, hits, error in self.tracker.top(self.top_k) if hits - error >= floor)
+        for key in self.hot - hot:
+            self.invalidate(key)
+        self.promotions += len(hot - self.hot)
+        self.hot = hot
+
+        self.tracker.halve()
+        self.shard_requests = [requests >> 1 for requests in self.shard_requests]
+        self.samples = 0
+        self.refreshes += 1
+
+    def read(self, key: Any) -> Any:
+        record = self._replica().get(key)
+        if record is not None and self.clock.now() <= record[1]:
+            self.replica_hits += 1
+            return record[0]
+        self.replica_misses += 1
+        return HOT_MISS
+
+    def install(self, key: Any, value: Any, expiry: float) -> None:
+        self._replica()[key] = (value, expiry)
+
+    def invalidate(self, key: Any) -> None:
+        for replica in self.replicas:
+            if replica.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        for replica in self.replicas:
+            replica.clear()
+
+    @property
+    def shard_skew(self) -> float:
+        """
+        Busiest shard's sampled reads divided by the mean, 1.0 means perfectly even traffic.
+        """
+        total = sum(self.shard_requests)
+        if not total:
+            return 0.00
+        return round(max(self.shard_requests) * self.shard_count / total, 2)
+
+    @property
+    def hot_key_metrics(self) -> Dict[str, Any]:
+        reads = self.replica_hits + self.replica_misses
+        return {
+            "hot_keys": [str(key) for key in self.hot],
+            "top_k": [
+                {"key": str(key), "count": hits, "error": error}
+                for key, hits, error in self.tracker.top(self.top_k)
+            ],
+            "replicas": self.replica_count,
+            "replica_hits": self.replica_hits,
+            "replica_hit_ratio": round(self.replica_hits / reads, 2) if reads else 0.00,
+            "invalidations": self.invalidations,
+            "promotions": self.promotions,
+            "refreshes": self.refreshes,
+            "sample_rate": self.sample_rate,
+            "shard_requests": list(self.shard_requests),
+            "shard_skew": self.shard_skew
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        The tracker & hot set are carried over, replicas are refilled by the copy's own readers.
+        """
+        with self.lock:
+            return {
+                name: getattr(self, name) for name in self.__slots__
+                if name not in ("replicas", "assignments", "local", "lock")
+            }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self._reset_replicas()
+
+    def __repr__(self):
+        return f"<HotKeyReplicas(top_k={self.top_k}, replicas={self.replica_count}, hot={len(self.hot)})>"
@@ -0,0 +1,140 @@
+# --------------- Imports ---------------
+
+from threading import Lock
+from typing import Any, Dict, List, Tuple
+
+import mmh3
+import sys
+
+# --------------- Value Interning ---------------
+
+_INTERNABLE = (bytes, str)      # Immutable values only, a shared copy must never change under another key
+
+def _digest(value: Any) -> Tuple[type, int]:
+    data = value.encode("utf-8", "surrogatepass") if type(value) is str else value     # Lone surrogates are valid str values
+    return type(value), mmh3.hash128(data, seed=13)
+
+class InternStore():
+    """
+    A content-addressed, refcounted store of cached values, shared by every shard of a cache.
+
+    Values are keyed by their type and 128-bit MurmurHash3 digest. Adding a value equal to one already
+    stored returns the stored object instead, so any number of keys holding byte-identical values keep
+    a single copy. Shards release their reference on eviction, expiry, replacement and clear(), and the
+    value is dropped once no entry refers to it.
+
+    ----- Notes -----
+    - Only bytes & str values are interned, other values are cached as-is.
+    - A digest collision (two different values) is detected by comparing the values, the newcomer is
+      then cached as its own copy and counted in 'collisions'.
+    - Releases look values up by identity, so they never rehash the value.
+    """
+
+    __slots__ = ("values", "ids", "lock", "hits", "misses", "collisions", "bytes_stored", "bytes_saved")
+
+    def __init__(self):
+        self.values: Dict[Tuple[type, int], List[Any]] = {}     # Digest -> [value, refcount, nbytes]
+        self.ids: Dict[int, Tuple[type, int]] = {}              # id() of every stored value -> digest
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+        self.bytes_stored = 0           # Size of every distinct stored value
+        self.bytes_saved = 0            # Size of every duplicate reference, i.e. the copies not kept
+
+    def intern(self, value: Any) -> Any:
+        """
+        Returns the shared copy of the value, adding a reference to it.
+        """
+        if type(value) not in _INTERNABLE:
+            return value
+        digest = _digest(value)
+        with self.lock:
+            record = self.values.get(digest)
+            if record is None:
+                nbytes = sys.getsizeof(value)
+                self.values[digest] = [value, 1, nbytes]
+                self.ids[id(value)] = digest
+                self.bytes_stored += nbytes
+                self.misses += 1
+                return value
+            if record[0] != value:
+                self.collisions += 1
+                return value
+            record[1] += 1
+            self.bytes_saved += record[2]
+            self.hits += 1
+            return record[0]
+
+    def release(self, value: Any) -> None:
+        """
+        Drops a reference to the value, removing it once unreferenced. Values never interned are ignored.
+        """
+        if type(value) not in _INTERNABLE:
+            return
+        with self.lock:
+            digest = self.ids.get(id(value))
+            if digest is None:
+                return
+            record = self.values[digest]
+            record[1] -= 1
+            if record[1]:
+                self.bytes_saved -= record[2]
+                return
+            del self.values[digest]
+            del self.ids[id(value)]
+            self.bytes_stored -= record[2]
+
+    def clear(self) -> None:
+        with self.lock:
+            self.values.clear()
+            self.ids.clear()
+            self.hits = 0
+            self.misses = 0
+            self.collisions = 0
+            self.bytes_stored = 0
+            self.bytes_saved = 0
+
+    @property
+    def intern_metrics(self) -> Dict[str, Any]:
+        values = len(self.values)
+        references = sum(record[1] for record in list(self.values.values()))
+        return {
+            "values": values,
+            "references": references,
+            "dedup_ratio": round(references / values, 2) if values else 0.00,
+            "bytes_stored": self.bytes_stored,
+            "bytes_saved": self.bytes_saved,
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Stored values & refcounts, pickled alongside the shards, so entries keep pointing at the shared copies.
+        """
+        with self.lock:
+            return {
+                "records": [(record[0], record[1]) for record in self.values.values()],
+                "counters": (self.hits, self.misses, self.collisions, self.bytes_saved)
+            }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.values = {}
+        self.ids = {}
+        self.lock = Lock()
+        self.bytes_stored = 0
+        for value, refcount in state["records"]:
+            digest = _digest(value)
+            nbytes = sys.getsizeof(value)
+            self.values[digest] = [value, refcount, nbytes]
+            self.ids[id(value)] = digest
+            self.bytes_stored += nbytes
+        self.hits, self.misses, self.collisions, self.bytes_saved = state["counters"]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __repr__(self):
+        return f"<InternStore(values={len(self.values)}, bytes_saved={self.bytes_saved})>"
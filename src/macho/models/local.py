@@ -0,0 +1,87 @@
+# --------------- Imports ---------------
+
+from typing import Any, Dict, List, Tuple
+
+import threading
+
+# --------------- Thread-local L1 Cache ---------------
+
+L1_MISS = object()      # Returned by lookup() when the thread's L1 holds no valid copy
+
+HIT_BATCH = 64          # L1 hits buffered before they are folded back into their shards
+
+class L1Cache():
+    """
+    A tiny, lock-free front cache owned by a single thread.
+
+    Every record remembers the shard it was read from and that shard's write epoch at the time.
+    Any add, eviction or expiry in the shard bumps its epoch, so a record is only served while
+    its shard has not changed since, and the hottest keys are answered without touching a lock.
+
+    ----- Parameters -----
+    capacity: int
+        Maximum number of records, the oldest record is dropped once full.
+
+    ----- Notes -----
+    - Only ever accessed by its owning thread, the counters are read by metrics without a lock.
+    - Hits are folded back into their shards (hit counters, recency & admission frequencies) once
+      HIT_BATCH of them are buffered, or on flush_hits(). Shard metrics may lag by up to one batch pr. thread.
+    """
+
+    __slots__ = ("capacity", "entries", "hits", "misses", "invalidations", "pending", "thread_name", "__weakref__")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.entries: Dict[Any, Tuple[Any, Any, int, float]] = {}      # Key -> (value, shard, epoch, expiry)
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.pending: List[Tuple[Any, Any]] = []       # (shard, key) of hits not yet folded back
+        self.thread_name = threading.current_thread().name
+
+    def lookup(self, key: Any) -> Any:
+        record = self.entries.get(key)
+        if record is not None:
+            value, shard, epoch, expiry = record
+            if shard.epoch == epoch and shard.clock.now() <= expiry:
+                self.hits += 1
+                self.pending.append((shard, key))
+                if len(self.pending) >= HIT_BATCH:
+                    self.flush_hits()
+                return value
+            del self.entries[key]
+            self.invalidations += 1
+        self.misses += 1
+        return L1_MISS
+
+    def flush_hits(self) -> None:
+        """
+        Folds the buffered hits back into their shards, one lock acquisition pr. shard.
+        """
+        pending, self.pending = self.pending, []
+        batches: Dict[int, Tuple[Any, List[Any]]] = {}
+        for shard, key in pending:
+            batches.setdefault(id(shard), (shard, []))[1].append(key)
+        for shard, keys in batches.values():
+            shard.absorb_hits(keys)
+
+    def store(self, key: Any, value: Any, shard: Any, epoch: int, expiry: float) -> None:
+        entries = self.entries
+        if key not in entries and len(entries) >= self.capacity:
+            del entries[next(iter(entries))]
+        entries[key] = (value, shard, epoch, expiry)
+
+    @property
+    def l1_metrics(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "thread": self.thread_name,
+            "size": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hits / total, 2) if total else 0.00
+        }
+
+    def __repr__(self):
+        return f"<L1Cache(thread={self.thread_name}, size={len(self.entries)}, capacity={self.capacity})>"
@@ -1,12 +1,19 @@
 # --------------- Imports ---------------
 
 from threading import RLock
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from collections import OrderedDict, deque
-from statistics import median
+from array import array
 
+import copy
+
+from macho.clock import PRECISE_CLOCK, Clock
 from macho.logging import get_logger
+from macho.metrics import LogHistogram
+from macho.models.admission import TinyLFUAdmission
+from macho.models.interning import InternStore
 
+import heapq
 import time
 import random
 import sys
@@ -15,25 +22,56 @@ import sys
 
 logger = get_logger(__name__)
 
+# --------------- Instrumentation Levels ---------------
+
+INSTRUMENTATION_LEVELS = ("off", "counters", "sampled", "full")
+
+_MISSING = object()     # Sentinel returned by _lookup() when no live entry exists
+_TOMBSTONE = object()   # Marks a freed position in a shard's slot array
+
+def _sample_gap(sample_rate: int) -> int:
+    """
+    Calls until the next timed one, uniform over 1 - (2N - 1) so that 1 out of every N calls is timed
+    on average, without lining up with a repeating pattern of operations (e.g. add, hit, miss).
+    """
+    return random.randint(1, 2 * sample_rate - 1)
+
 # --------------- Entry Model ---------------
 
 class CacheEntry():
-    __slots__ = ("value", "expiry", "creation", "last_access_time")
+    """
+    A single cached value with its lifecycle times.
+
+    ----- Notes -----
+    Times are in the time base of the owning cache's clock, which passes 'now' to every method.
+    Without it, the default precise clock (time.monotonic()) is read.
+    """
+
+    __slots__ = ("value", "expiry", "creation", "last_access_time", "first_hit", "hits", "nbytes", "slot", "cost", "size")
 
-    def __init__(self, value: Any, ttl: float):
+    def __init__(self, value: Any, ttl: float, cost: float = 1.0, size: int = 0, now: Optional[float] = None):
         self.value = value
-        self.creation = time.monotonic()
+        self.creation = PRECISE_CLOCK.now() if now is None else now        # Owning caches pass their clock's time
         self.expiry = self.creation + ttl
         self.last_access_time = self.creation
+        self.first_hit = 0.0    # Monotonic time of the first hit, 0.0 until hit
+        self.hits = 0
+        self.nbytes = 0         # Shallow size of key, entry & value, accounted by the owning cache
+        self.slot = -1          # Position in the owning cache's slot array
+        self.cost = cost        # Caller-supplied cost of recomputing the value, saved by every hit
+        self.size = size        # Caller-supplied size, 0 falls back to 'nbytes'
 
-    def lifespan(self) -> float:
-        return time.monotonic() - self.creation
+    def lifespan(self, now: Optional[float] = None) -> float:
+        return (PRECISE_CLOCK.now() if now is None else now) - self.creation
 
-    def is_expired(self) -> bool:
-        return time.monotonic() > self.expiry
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (PRECISE_CLOCK.now() if now is None else now) > self.expiry
     
     def __repr__(self):
-        return f"<CacheEntry(value={self.value}, expires_in={self.expiry - time.monotonic():.2f}s)>"
+        # Absolute expiry, the entry does not know which clock's time base it was created in
+        return f"<CacheEntry(value={self.value}, expiry={self.expiry:.2f})>"
+
+_ENTRY_SIZE = sys.getsizeof(CacheEntry(None, 0.0))
     
 
 # --------------- Caching Models ---------------
@@ -48,6 +86,10 @@ class BaseCache():
     default_ttl: float
         Time-to-live for individual data entries stored in the cache, protrayed in seconds.
     
+    ----- Notes -----
+    Entry lifecycles (lifespan, idle time, hits & time-to-first-hit) are recorded into fixed-memory
+    histograms whenever an entry is evicted or expires, so reading them never depends on the entry count.
+
     ----- Exceptions -----
     MetricLifespanException
         Raised if no available lifespan data metrics when metric_lifespan() is called.
@@ -62,11 +104,33 @@ class BaseCache():
         "hits",
         "misses",
         "evictions",
-        "lifespan",
+        "expirations",
+        "lifespan_histogram",
+        "idle_histogram",
+        "hits_histogram",
+        "first_hit_histogram",
+        "memory_bytes",
         "add_latency",
-        "get_latency"
+        "get_latency",
+        "miss_latency",
+        "sample_rate",
+        "sample_tick",
+        "get_tick",
+        "evict_listener",
+        "removal_buffer",
+        "admission",
+        "slots",
+        "free_slots",
+        "epoch",
+        "saved_cost",
+        "clock",
+        "interning",
+        "successor"
     )
 
+    instrumentation = "full"    # Overridden by the specialized classes returned from instrumented()
+    _base_class = None          # Eviction strategy's class, set on the specialized classes
+
     def __init__(self, max_cache_size: int, default_ttl: float):
         self.max_cache_size = max_cache_size
         self.default_ttl = default_ttl
@@ -74,22 +138,352 @@ class BaseCache():
         self.lock = RLock()
         self.hits = 0
         self.misses = 0
-        self.evictions = 0
-        self.lifespan = deque(maxlen=1000)
-        self.add_latency = deque(maxlen=1000)
-        self.get_latency = deque(maxlen=1000)
-
+        self.evictions = 0                     # Entries removed by capacity or expiry
+        self.expirations = 0                   # Share of 'evictions' caused by expiry
+        self.lifespan_histogram = LogHistogram()       # Microseconds from creation to eviction/expiry
+        self.idle_histogram = LogHistogram()           # Microseconds since the last access, at eviction/expiry
+        self.hits_histogram = LogHistogram()           # Hits pr. entry over its lifetime
+        self.first_hit_histogram = LogHistogram()      # Microseconds from creation to first hit (hit entries only)
+        self.memory_bytes = 0                  # Running total of entry sizes, keeps memory_size O(1)
+        self.add_latency = LogHistogram()      # Nanosecond latencies of add() calls
+        self.get_latency = LogHistogram()      # Nanosecond latencies of get() calls resulting in a hit
+        self.miss_latency = LogHistogram()     # Nanosecond latencies of get() calls resulting in a miss
+        self.sample_rate = 1                   # 'sampled' instrumentation times 1 out of every N calls on average
+        self.sample_tick = 0                   # Calls left until the next timed add()
+        self.get_tick = 0                      # Calls left until the next timed get()
+        self.evict_listener: Optional[Callable[[Any], None]] = None     # Called with every evicted/expired key
+        self.removal_buffer: Optional[List[Tuple[Any, Any, str]]] = None    # (key, value, cause), None disables
+        self.admission: Optional[TinyLFUAdmission] = None     # Admission filter in front of the eviction strategy
+        self.slots: List[Any] = []             # Keys by stable position, scan() cursors walk this array
+        self.free_slots: List[int] = []        # Tombstoned positions, reused last-in first-out
+        self.epoch = 0                         # Bumped by every write, keeps thread-local L1 copies coherent
+        self.saved_cost = 0.0                  # Sum of the recompute costs of every hit entry
+        self.clock: Clock = PRECISE_CLOCK      # Time source of every expiry, creation & access time
+        self.interning: Optional[InternStore] = None       # Shared value store, deduplicates identical values
+        self.successor: Optional[BaseCache] = None         # Set once migrate() retired the shard, operations are forwarded
 
-    def _purge_expired(self) -> None:
+    def _purge_expired(self, now: float) -> None:
         """
-        Iterates through current data storage and deletes expired cache entries.
+        Iterates through current data storage and deletes cache entries expired at 'now'.
         """
         for key in list(self.cache.keys()):
-            if self.cache[key].is_expired():
-                self.evictions += 1
-                ls = self.cache[key].lifespan()
-                self.lifespan.append(ls)
-                del self.cache[key]
+            if self.cache[key].expiry < now:
+                self._evict(key, "expired")
+
+    def _remove(self, key: Any) -> CacheEntry:
+        """
+        Deletes a single cache entry and updates the memory accounting. Lock must be held by the caller.
+        """
+        removed = self.cache.pop(key)
+        if self.interning is not None:
+            self.interning.release(removed.value)
+        self.epoch += 1
+        self.memory_bytes -= removed.nbytes
+        self.slots[removed.slot] = _TOMBSTONE
+        self.free_slots.append(removed.slot)
+        return removed
+
+    def _evict(self, key: Any, cause: str = "evicted") -> None:
+        """
+        Deletes a single cache entry and records its lifecycle. Lock must be held by the caller.
+        'cause' is either 'evicted' (capacity) or 'expired' (time-to-live).
+        """
+        if self.evict_listener is not None:
+            self.evict_listener(key)
+        removed = self._remove(key)
+        self.evictions += 1
+        if cause == "expired":
+            self.expirations += 1
+        now = self.clock.now()
+        self.lifespan_histogram.record(int((now - removed.creation) * 1e6))
+        self.idle_histogram.record(int((now - removed.last_access_time) * 1e6))
+        self.hits_histogram.record(removed.hits)
+        if removed.hits:
+            self.first_hit_histogram.record(int((removed.first_hit - removed.creation) * 1e6))
+        if self.removal_buffer is not None:
+            self.removal_buffer.append((key, removed.value, cause))
+
+    def take_removals(self) -> List[Tuple[Any, Any, str]]:
+        """
+        Returns & resets the buffered removal notifications (empty if none were recorded).
+        """
+        if not self.removal_buffer:         # Lock-free fast path, the common case
+            return []
+        with self.lock:
+            removals, self.removal_buffer = self.removal_buffer, []
+            return removals
+
+    def _victim(self) -> Any:
+        """
+        Returns the key of the next entry to evict once the cache is full.
+        Overridden by the individual eviction strategies.
+        """
+        raise NotImplementedError
+
+    def _on_access(self, key: Any, entry: CacheEntry) -> None:
+        """
+        Bookkeeping performed by the eviction strategy on every cache hit.
+        """
+
+    def _insert(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> bool:
+        """
+        Stores the key-value pair, evicting entries chosen by the eviction strategy if needed.
+        Lock must be held by the caller, no metrics are recorded.
+        'cost' & 'size' describe the value for cost-aware strategies (see GDSFCache).
+
+        ----- Return -----
+        Bool:
+            False if the admission filter rejected a new key in favour of the victim, True otherwise.
+        """
+        now = self.clock.now()          # Read once, shared by the purge & the new entry
+        self._purge_expired(now)
+
+        if self.admission is not None:
+            self.admission.record(key)
+
+        if key in self.cache:
+            replaced = self._remove(key)
+            if self.removal_buffer is not None:
+                self.removal_buffer.append((key, replaced.value, "replaced"))
+        elif self.admission is not None and len(self.cache) >= self.max_cache_size:
+            victim = self._victim()
+            if not self.admission.admit(key, victim):
+                return False
+            self._evict(victim)
+
+        while len(self.cache) >= self.max_cache_size:
+            self._evict(self._victim())
+        if self.interning is not None:
+            value = self.interning.intern(value)
+        entry = CacheEntry(value, self.default_ttl, cost, size, now)
+        entry.nbytes = _ENTRY_SIZE + sys.getsizeof(key) + sys.getsizeof(value)
+        self.memory_bytes += entry.nbytes
+        self.epoch += 1
+        if self.free_slots:         # A replaced key gets its own slot straight back
+            entry.slot = self.free_slots.pop()
+            self.slots[entry.slot] = key
+        else:
+            entry.slot = len(self.slots)
+            self.slots.append(key)
+        self.cache[key] = entry
+        return True
+
+    def _lookup(self, key: Any) -> Any:
+        """
+        Retrieves the value stored under the key, or the _MISSING sentinel if no live entry exists.
+        Lock must be held by the caller, no metrics are recorded.
+        """
+        now = self.clock.now()
+        self._purge_expired(now)
+
+        if self.admission is not None:
+            self.admission.record(key)
+
+        entry = self.cache.get(key)
+
+        if entry is None:
+            return _MISSING
+        if entry.expiry < now:
+            self._evict(key, "expired")
+            return _MISSING
+        self._record_hit(key, entry, now)
+        return entry.value
+
+    def _record_hit(self, key: Any, entry: CacheEntry, now: float) -> None:
+        """
+        Hit bookkeeping of the entry & the eviction strategy. Lock must be held by the caller.
+        """
+        self._on_access(key, entry)
+        entry.last_access_time = now
+        if not entry.hits:
+            entry.first_hit = entry.last_access_time
+        entry.hits += 1
+        self.saved_cost += entry.cost
+
+    def absorb_hits(self, keys: List[Any]) -> None:
+        """
+        Folds hits answered from thread-local L1 copies back into the shard: hit counters, saved cost,
+        the eviction strategy's recency & the admission filter's frequencies. Called in batches by the L1.
+        Keys evicted or expired since are only counted as hits, they were still valid when served.
+        """
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.absorb_hits(keys)
+            now = self.clock.now()
+            for key in keys:
+                if self.admission is not None:
+                    self.admission.record(key)
+                entry = self.cache.get(key)
+                if entry is not None and entry.expiry >= now:
+                    self._record_hit(key, entry, now)
+            if self.instrumentation != "off":
+                self.hits += len(keys)
+
+    def resize(self, max_cache_size: int) -> int:
+        """
+        Changes the cache's capacity, evicting entries chosen by the eviction strategy until they fit.
+
+        ----- Parameters -----
+        max_cache_size: int
+            The new maximum number of items/values.
+
+        ----- Return -----
+        Int:
+            Number of entries evicted.
+
+        ----- Exceptions -----
+        ValueError
+            Raised if max_cache_size is not a positive integer.
+        """
+        if not isinstance(max_cache_size, int) or max_cache_size <= 0:
+            raise ValueError("Parameter 'max_cache_size' must be a positive integer")
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.resize(max_cache_size)
+            self._purge_expired(self.clock.now())       # Expired entries go first, they are free to drop
+            self.max_cache_size = max_cache_size
+            evicted = 0
+            while len(self.cache) > max_cache_size:
+                self._evict(self._victim())
+                evicted += 1
+            return evicted
+
+    def migrate(self, cache_class: type, **policy_options: Any) -> "BaseCache":
+        """
+        Moves every entry, counter & histogram into a new shard of another eviction strategy, e.g. to switch
+        policy at runtime. The entries keep their values, times & hits and are handed to the new strategy
+        in this shard's eviction order (see _adopt()).
+
+        The shard is retired afterwards: it holds nothing and forwards every later add(), get() & resize()
+        to the new shard, so callers still holding a reference to it never read or write stale data.
+
+        ----- Parameters -----
+        cache_class: type
+            The new eviction strategy's cache-class (e.g. SLRUCache), specialized for this shard's instrumentation.
+        **policy_options: Any
+            Extra keyword arguments for the new cache-class, e.g. protected_ratio=0.8.
+
+        ----- Return -----
+        BaseCache:
+            The new shard.
+        """
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.migrate(cache_class, **policy_options)
+            successor = instrumented(cache_class, self.instrumentation)(
+                self.max_cache_size, self.default_ttl, **policy_options
+            )
+            for name in _MIGRATED_SLOTS:
+                setattr(successor, name, getattr(self, name))
+            successor.epoch = self.epoch + 1
+            successor._adopt()
+
+            self.successor = successor
+            self.epoch += 1             # Invalidates L1 & replica copies read from this shard
+            self.cache = OrderedDict()
+            self.slots = []
+            self.free_slots = []
+            self.memory_bytes = 0
+            self.evict_listener = None
+            self.removal_buffer = None
+            self.interning = None       # References moved with the entries
+            logger.debug(f"Shard migrated from {type(self).__name__} to {type(successor).__name__}")
+            return successor
+
+    def _adopt(self) -> None:
+        """
+        Builds the eviction strategy's own bookkeeping for entries moved in by migrate(), which are already
+        stored in the cache in the previous strategy's eviction order. Lock must be held by the caller.
+        LRU, FIFO & Random need nothing beyond that order.
+        """
+
+    # ----- Instrumented operations ('full' level, see instrumented() for the other levels) -----
+
+    def add(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> None:
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.add(key, value, cost, size)
+            start_time = time.perf_counter_ns()
+            self._insert(key, value, cost, size)
+            self.add_latency.record(time.perf_counter_ns() - start_time)
+
+    def get(self, key: Any, default: Any = None) -> Optional[Any]:
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.get(key, default)
+            start_time = time.perf_counter_ns()
+            value = self._lookup(key)
+
+            if value is _MISSING:
+                self.misses += 1
+                self.miss_latency.record(time.perf_counter_ns() - start_time)
+                return default
+            self.hits += 1
+            self.get_latency.record(time.perf_counter_ns() - start_time)
+            return value
+
+    def _add_untimed(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> None:
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.add(key, value, cost, size)
+            self._insert(key, value, cost, size)
+
+    def _get_uncounted(self, key: Any, default: Any = None) -> Optional[Any]:
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.get(key, default)
+            value = self._lookup(key)
+            return default if value is _MISSING else value
+
+    def _get_counted(self, key: Any, default: Any = None) -> Optional[Any]:
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.get(key, default)
+            value = self._lookup(key)
+
+            if value is _MISSING:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def _add_sampled(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> None:
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.add(key, value, cost, size)
+            self.sample_tick -= 1
+            if self.sample_tick > 0:
+                self._insert(key, value, cost, size)
+                return
+            self.sample_tick = _sample_gap(self.sample_rate)
+            start_time = time.perf_counter_ns()
+            self._insert(key, value, cost, size)
+            self.add_latency.record(time.perf_counter_ns() - start_time)
+
+    def _get_sampled(self, key: Any, default: Any = None) -> Optional[Any]:
+        with self.lock:
+            if self.successor is not None:
+                return self.successor.get(key, default)
+            self.get_tick -= 1
+            if self.get_tick > 0:
+                value = self._lookup(key)
+
+                if value is _MISSING:
+                    self.misses += 1
+                    return default
+                self.hits += 1
+                return value
+            self.get_tick = _sample_gap(self.sample_rate)
+            start_time = time.perf_counter_ns()
+            value = self._lookup(key)
+
+            if value is _MISSING:
+                self.misses += 1
+                self.miss_latency.record(time.perf_counter_ns() - start_time)
+                return default
+            self.hits += 1
+            self.get_latency.record(time.perf_counter_ns() - start_time)
+            return value
     
     def clear(self) -> None:
         """
@@ -97,20 +491,44 @@ class BaseCache():
         Utilizes RLock for Thread safesty.
         """
         with self.lock:
+            if self.removal_buffer is not None:
+                self.removal_buffer.extend((key, entry.value, "cleared") for key, entry in self.cache.items())
+            if self.interning is not None:
+                for entry in self.cache.values():
+                    self.interning.release(entry.value)
             self.cache.clear()
+            self.epoch += 1
+            self.slots = []
+            self.free_slots = []
+            self.memory_bytes = 0
             self.hits = 0
             self.misses = 0
             self.evictions = 0
-            self.lifespan.clear()
-            self.add_latency.clear()
-            self.get_latency.clear()
+            self.expirations = 0
+            self.saved_cost = 0.0
+            for histogram in self.lifecycle_histograms.values():
+                histogram.reset()
+            self.add_latency.reset()
+            self.get_latency.reset()
+            self.miss_latency.reset()
+            if self.admission is not None:
+                self.admission.clear()
 
-    def _extract_latency_data(self, data: deque, label: str) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_latency_data(histogram: LogHistogram, label: str) -> Dict[str, Any]:
+        summary = histogram.summary(scale=1e9)      # Nanoseconds -> seconds
         return {
-            f"{label}_latency_seconds": sum(data) / len(data),
-            f"max_{label}_latency": max(data),
-            f"min_{label}_latency": min(data),
-            f"{label}_latency": list(data)
+            f"{label}_latency_seconds": summary["mean"],
+            f"max_{label}_latency": summary["max"],
+            f"min_{label}_latency": summary["min"],
+            f"p50_{label}_latency": summary["p50"],
+            f"p90_{label}_latency": summary["p90"],
+            f"p99_{label}_latency": summary["p99"],
+            f"p999_{label}_latency": summary["p999"],
+            f"{label}_count": summary["count"],
+            f"{label}_latency": [
+                [low / 1e9, high / 1e9, count] for low, high, count in histogram.buckets()
+            ]
         }
 
     @property
@@ -135,60 +553,83 @@ class BaseCache():
         return round(self.hits / total, 2) if total else 0.00
     
     @property
-    def metric_lifespan(self) -> Dict[str, float]:
-        if not self.lifespan:
-            return {
-                "max": 0.0,
-                "min": 0.0,
-                "count": 0,
-                "total": 0,
-                "average": 0,
-                "median": 0.0,
-                "all_lifespans": []
-            }
-        
-        lifespan_values = list(self.lifespan)
-        total = sum(lifespan_values)
-        count = len(lifespan_values)
-        
+    def metric_lifespan(self) -> Dict[str, Any]:
+        return self.summarize_lifespan(self.lifespan_histogram)
+
+    @staticmethod
+    def summarize_lifespan(histogram: LogHistogram) -> Dict[str, Any]:
+        """
+        Summarizes a lifespan histogram in seconds, buckets as [low, high, count].
+        """
+        summary = histogram.summary(scale=1e6)      # Microseconds -> seconds
+        return {
+            "max": summary["max"],
+            "min": summary["min"],
+            "count": summary["count"],
+            "total": histogram.total / 1e6,
+            "average": summary["mean"],
+            "median": summary["p50"],
+            "p90": summary["p90"],
+            "p99": summary["p99"],
+            "buckets": [[low / 1e6, high / 1e6, count] for low, high, count in histogram.buckets()]
+        }
+
+    @property
+    def lifecycle_histograms(self) -> Dict[str, LogHistogram]:
+        return {
+            "lifespan": self.lifespan_histogram,
+            "idle": self.idle_histogram,
+            "hits": self.hits_histogram,
+            "first_hit": self.first_hit_histogram
+        }
+
+    @property
+    def lifecycle(self) -> Dict[str, Any]:
+        return self.summarize_lifecycle(self.lifecycle_histograms, self.evictions, self.expirations)
+
+    @staticmethod
+    def summarize_lifecycle(histograms: Dict[str, LogHistogram], evictions: int, expirations: int) -> Dict[str, Any]:
+        """
+        Converts lifecycle histograms into summaries of lifespan, idle time & time-to-first-hit (seconds)
+        and hits pr. entry, along with how many entries capacity & expiry removed.
+        """
+        hits = histograms["hits"]
         return {
-            "max": max(lifespan_values),
-            "min": min(lifespan_values),
-            "count": count,
-            "total": total,
-            "average": total / count,
-            "median": median(lifespan_values),
-            "all_lifespans": lifespan_values
+            "evicted": evictions - expirations,
+            "expired": expirations,
+            "expired_ratio": round(expirations / evictions, 2) if evictions else 0.00,
+            "lifespan": histograms["lifespan"].summary(scale=1e6),
+            "idle_time": histograms["idle"].summary(scale=1e6),
+            "time_to_first_hit": histograms["first_hit"].summary(scale=1e6),
+            "hits_per_entry": hits.summary(),
+            "never_hit": hits.counts[0]         # Bucket 0 holds exactly the entries removed without a hit
         }
     
     @property
-    def memory_size(self):
-        size = sys.getsizeof(self.cache)
-        for k, v in self.cache.items():
-            size += (sys.getsizeof(k) + sys.getsizeof(v))
-        return size
+    def memory_size(self) -> int:
+        return sys.getsizeof(self.cache) + self.memory_bytes
     
     @property
-    def latencies(self) -> Dict[str, float]:
+    def latency_histograms(self) -> Dict[str, LogHistogram]:
+        return {
+            "add": self.add_latency,
+            "get": self.get_latency,
+            "miss": self.miss_latency
+        }
+
+    @property
+    def latencies(self) -> Dict[str, Any]:
+        return self.summarize_latencies(self.latency_histograms)
+
+    @classmethod
+    def summarize_latencies(cls, histograms: Dict[str, LogHistogram]) -> Dict[str, Any]:
+        """
+        Converts 'add', 'get' and 'miss' latency histograms into the flat latency dictionary
+        exposed by latencies() (all values in seconds, buckets as [low, high, count]).
+        """
         latencies = {}
-        if self.add_latency:
-            latencies.update(self._extract_latency_data(self.add_latency, "add"))
-        else:
-            latencies.update({
-                "add_latency_seconds": 0.0,
-                "max_add_latency": 0.0,
-                "min_add_latency": 0.0,
-                "add_latency": []
-            })
-        if self.get_latency:
-            latencies.update(self._extract_latency_data(self.get_latency, "get"))
-        else:
-            latencies.update({
-                "get_latency_seconds": 0.0,
-                "max_get_latency": 0.0,
-                "min_get_latency": 0.0,
-                "get_latency": []
-            })
+        for label, histogram in histograms.items():
+            latencies.update(cls._extract_latency_data(histogram, label))
         return latencies
         
     @property
@@ -201,27 +642,163 @@ class BaseCache():
             "misses": self.misses, 
             "total_requests": self.total_requests,
             "hit_ratio": self.hit_ratio,
+            "saved_cost": self.saved_cost,
             "evictions": self.evictions,
             "memory_size": self.memory_size,
             "lifespan_metrics": self.metric_lifespan,
+            "lifecycle": self.lifecycle,
             "latencies": self.latencies
         }
+        if self.admission is not None:
+            metrics["admission"] = self.admission.admission_metrics
 
         return metrics
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Returns a point-in-time copy of counters, size, latency & lifecycle histograms without taking the lock.
+
+        Every field is read with a single (GIL-atomic) operation, so scraping metrics never blocks
+        add()/get() callers. Fields may be off by in-flight operations, but never torn.
+        """
+        return {
+            "policy": type(self).__name__,
+            "current_size": len(self.cache),
+            "max_size": self.max_cache_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "memory_bytes": self.memory_size,
+            "latencies": {
+                label: histogram.copy()
+                for label, histogram in self.latency_histograms.items()
+            },
+            "lifecycle": {
+                label: histogram.copy()
+                for label, histogram in self.lifecycle_histograms.items()
+            }
+        }
+    
+    # ----- Pickling -----
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Returns the cache's state with entries stored column-wise, in eviction order.
+
+        Expiry, creation & last access times are stored relative to the clock's now, as monotonic
+        times have no meaning across processes. Locks, listeners & buffered removals are not pickled.
+        """
+        with self.lock:
+            now = self.clock.now()
+            state = {
+                name: _snapshot(getattr(self, name))
+                for klass in type(self).__mro__
+                for name in getattr(klass, "__slots__", ())
+                if name not in ("lock", "cache", "evict_listener", "removal_buffer", "slots", "free_slots", "successor")
+            }
+            entries = list(self.cache.values())
+            state["keys"] = list(self.cache.keys())
+            state["values"] = [entry.value for entry in entries]
+            state["remaining_ttl"] = array("d", [entry.expiry - now for entry in entries])
+            state["age"] = array("d", [now - entry.creation for entry in entries])
+            state["idle"] = array("d", [now - entry.last_access_time for entry in entries])
+            state["since_first_hit"] = array("d", [now - entry.first_hit if entry.hits else -1.0 for entry in entries])
+            state["entry_hits"] = array("q", [entry.hits for entry in entries])     # 'hits' is the shard's counter
+            state["nbytes"] = array("q", [entry.nbytes for entry in entries])
+            state["cost"] = array("d", [entry.cost for entry in entries])
+            state["size"] = array("q", [entry.size for entry in entries])
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        state = dict(state)
+        columns = zip(
+            state.pop("keys"), state.pop("values"), state.pop("remaining_ttl"),
+            state.pop("age"), state.pop("idle"), state.pop("since_first_hit"), state.pop("entry_hits"), state.pop("nbytes"),
+            state.pop("cost"), state.pop("size")
+        )
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        now = self.clock.now()
+        self.lock = RLock()
+        self.evict_listener = None
+        self.removal_buffer = None
+        self.successor = None
+        self.cache = OrderedDict()
+        self.slots = []                 # Rebuilt densely, in eviction order
+        self.free_slots = []
+        for key, value, remaining_ttl, age, idle, since_first_hit, hits, nbytes, cost, size in columns:
+            entry = CacheEntry.__new__(CacheEntry)
+            entry.value = value
+            entry.expiry = now + remaining_ttl
+            entry.creation = now - age
+            entry.last_access_time = now - idle
+            entry.first_hit = now - since_first_hit if hits else 0.0
+            entry.hits = hits
+            entry.nbytes = nbytes
+            entry.cost = cost
+            entry.size = size
+            entry.slot = len(self.slots)
+            self.slots.append(key)
+            self.cache[key] = entry
+
+    def __reduce_ex__(self, protocol):
+        # Specialized classes from instrumented() are created at runtime, rebuild them from the base class
+        return (_rebuild_cache, (self._base_class or type(self), self.instrumentation, self.__getstate__()))
     
     def __contains__(self, key: Any) -> bool:
         with self.lock:
             entry = self.cache.get(key)
-            return entry is not None and not entry.is_expired()
+            return entry is not None and not entry.is_expired(self.clock.now())
         
     def __len__(self) -> int:
         return self.current_size
     
     def __iter__(self):
+        return self.iter_snapshot()
+
+    # ----- Non-blocking iteration -----
+
+    def scan(self, slot: int, count: int) -> Tuple[int, List[Tuple[Any, Any]]]:
+        """
+        Returns the live entries within the next 'count' positions of the slot array, holding the lock
+        for that chunk only. Entries never change position while cached, so walking the array chunk by
+        chunk returns every entry present for the whole walk at least once.
+
+        ----- Parameters -----
+        slot: int
+            Position to continue from, 0 to start.
+        count: int
+            Maximum number of positions examined (and entries returned).
+
+        ----- Return -----
+        Tuple[int, List[Tuple[Any, Any]]]:
+            The position to continue from (0 once the end is reached) and the (key, value) pairs found.
+        """
+        items = []
+        with self.lock:
+            end = min(slot + count, len(self.slots))
+            now = self.clock.now()
+            for key in self.slots[slot:end]:
+                if key is not _TOMBSTONE:
+                    entry = self.cache[key]
+                    if entry.expiry >= now:     # Expired entries are skipped, not evicted
+                        items.append((key, entry.value))
+            return (end if end < len(self.slots) else 0), items
+
+    def iter_snapshot(self):
+        """
+        Yields the live (key, value) pairs, copying the keys in one short critical section.
+        Entries removed after the copy are skipped, entries added after it are not returned.
+        """
         with self.lock:
-            for key, entry in self.cache.items():
-                if not entry.is_expired():
-                    yield key, entry.value
+            keys = list(self.cache)
+        for key in keys:
+            entry = self.cache.get(key)         # Single GIL-atomic read, no lock held while yielding
+            if entry is not None and not entry.is_expired(self.clock.now()):
+                yield key, entry.value
         
     
 class LRUCache(BaseCache):
@@ -241,42 +818,35 @@ class LRUCache(BaseCache):
     def __init__(self, max_cache_size: int, default_ttl: float):
         super().__init__(max_cache_size, default_ttl)
 
-    def add(self, key: Any, value: Any) -> None:
-        with self.lock:
-            start_time = time.monotonic()
-            self._purge_expired()
+    def _victim(self) -> Any:
+        return next(iter(self.cache))           # Least recently used entry sits at the front
 
-            self.cache.pop(key, None)
+    def _on_access(self, key: Any, entry: CacheEntry) -> None:
+        self.cache.move_to_end(key)
+        
+class FIFOCache(BaseCache):
+    """
+    Cache-class that utilizes FIFO (First in, First out) eviction strategy.
+    Inherits functionality and properties from BaseCache.
+
+    ----- Parameters -----
+    max_cache_size: int
+        Maximum number of items/values capable of being stored in the cache.
+    default_ttl: float
+        Time-to-live for individual data entries stored in the cache, protrayed in seconds.
+    """
 
-            while len(self.cache) >= self.max_cache_size:
-                removed = self.cache.popitem(last=False)
-                self.evictions += 1
-                self.lifespan.append(removed[1].lifespan())
-            self.cache[key] = CacheEntry(value, self.default_ttl)
-            end_time = time.monotonic()
-            self.add_latency.append(end_time - start_time)
+    __slots__ = ()      # Initialize Slots to inherit variables from BaseCache
 
-    def get(self, key: Any) -> Optional[Any]:
-        with self.lock:
-            start_time = time.monotonic()
-            self._purge_expired()
+    def __init__(self, max_cache_size: int, default_ttl: float):
+        super().__init__(max_cache_size, default_ttl)
 
-            entry = self.cache.get(key)
+    def _victim(self) -> Any:
+        return next(iter(self.cache))           # Oldest inserted entry sits at the front
 
-            if entry is None or entry.is_expired():
-                self.cache.pop(key, None)
-                self.misses += 1
-                return None
-            self.cache.move_to_end(key)
-            self.hits += 1
-            end_time = time.monotonic()
-            entry.last_access_time = end_time
-            self.get_latency.append(end_time - start_time)
-            return entry.value
-        
-class FIFOCache(BaseCache):
+class RandomCache(BaseCache):
     """
-    Cache-class that utilizes FIFO (First in, First out) eviction strategy.
+    Cache-class that utilizes Random (Randomized entries) eviction strategy.
     Inherits functionality and properties from BaseCache.
 
     ----- Parameters -----
@@ -291,88 +861,431 @@ class FIFOCache(BaseCache):
     def __init__(self, max_cache_size: int, default_ttl: float):
         super().__init__(max_cache_size, default_ttl)
 
-    def add(self, key: Any, value: Any) -> None:
+    def _victim(self) -> Any:
+        return random.choice(list(self.cache.keys()))
+
+def _check_ratio(name: str, ratio: float) -> None:
+    if not isinstance(ratio, float):
+        raise TypeError(f"Parameter '{name}' must be of type: float")
+    if not 0.00 < ratio < 1.00:
+        raise ValueError(f"{name} value must be between 0.00 - 1.00")
+
+class SLRUCache(BaseCache):
+    """
+    Cache-class that utilizes SLRU (Segmented LRU) eviction strategy.
+    Inherits functionality and properties from BaseCache.
+
+    New entries enter a probationary segment and are promoted to the protected segment on their
+    first hit. Entries pushed out of the full protected segment are demoted back to probation,
+    and evictions always come from probation first. A scan touching every key once therefore
+    only cycles through probation, leaving the protected hot set intact.
+
+    ----- Parameters -----
+    max_cache_size: int
+        Maximum number of items/values capable of being stored in the cache.
+    default_ttl: float
+        Time-to-live for individual data entries stored in the cache, protrayed in seconds.
+    protected_ratio: float
+        Share of 'max_cache_size' reserved for the protected segment (Defaults to 0.8).
+    """
+
+    __slots__ = ("protected_capacity", "probation", "protected", "promotions", "demotions")
+
+    def __init__(self, max_cache_size: int, default_ttl: float, protected_ratio: float = 0.8):
+        _check_ratio("protected_ratio", protected_ratio)
+        super().__init__(max_cache_size, default_ttl)
+        self.protected_capacity = max(1, int(max_cache_size * protected_ratio))
+        self.probation: OrderedDict[Any, None] = OrderedDict()     # Segments only hold keys, in LRU order
+        self.protected: OrderedDict[Any, None] = OrderedDict()
+        self.promotions = 0
+        self.demotions = 0
+
+    def _victim(self) -> Any:
+        return next(iter(self.probation or self.protected))
+
+    def _on_access(self, key: Any, entry: CacheEntry) -> None:
+        if key in self.protected:
+            self.protected.move_to_end(key)
+            return
+        del self.probation[key]
+        self.protected[key] = None
+        self.promotions += 1
+        if len(self.protected) > self.protected_capacity:
+            demoted, _ = self.protected.popitem(last=False)
+            self.probation[demoted] = None      # Demoted entries get one more chance at the probation MRU end
+            self.demotions += 1
+
+    def _insert(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> bool:
+        protected = key in self.protected       # Overwriting a protected entry keeps it protected
+        if not super()._insert(key, value, cost, size):
+            return False
+        if protected:
+            self.protected[key] = None
+        else:
+            self.probation[key] = None
+        return True
+
+    def _remove(self, key: Any) -> CacheEntry:
+        removed = super()._remove(key)
+        if key in self.probation:
+            del self.probation[key]
+        else:
+            del self.protected[key]
+        return removed
+
+    def _adopt(self) -> None:
+        for key, entry in self.cache.items():       # Entries hit before keep their protection, while it has room
+            if entry.hits and len(self.protected) < self.protected_capacity:
+                self.protected[key] = None
+            else:
+                self.probation[key] = None
+
+    def resize(self, max_cache_size: int) -> int:
         with self.lock:
-            start_time = time.monotonic()
-            self._purge_expired()
+            ratio = self.protected_capacity / self.max_cache_size
+            evicted = super().resize(max_cache_size)
+            self.protected_capacity = max(1, int(max_cache_size * ratio))
+            while len(self.protected) > self.protected_capacity:
+                demoted, _ = self.protected.popitem(last=False)
+                self.probation[demoted] = None
+                self.demotions += 1
+            return evicted
+
+    def clear(self) -> None:
+        with self.lock:
+            super().clear()
+            self.probation.clear()
+            self.protected.clear()
+            self.promotions = 0
+            self.demotions = 0
+
+    @property
+    def segment_metrics(self) -> Dict[str, int]:
+        return {
+            "probation_size": len(self.probation),
+            "protected_size": len(self.protected),
+            "protected_capacity": self.protected_capacity,
+            "promotions": self.promotions,
+            "demotions": self.demotions
+        }
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        metrics = super().metrics
+        metrics["segments"] = self.segment_metrics
+        return metrics
+
+class TwoQueueCache(BaseCache):
+    """
+    Cache-class that utilizes 2Q eviction strategy.
+    Inherits functionality and properties from BaseCache.
+
+    New entries enter a FIFO probationary queue (A1in). Keys evicted from it are remembered in a
+    bounded ghost queue (A1out, keys only), and only keys re-added while still remembered are
+    promoted into the protected LRU segment (Am). One-off accesses, like a scan, never reach Am.
 
-            self.cache.pop(key, None)
+    ----- Parameters -----
+    max_cache_size: int
+        Maximum number of items/values capable of being stored in the cache.
+    default_ttl: float
+        Time-to-live for individual data entries stored in the cache, protrayed in seconds.
+    in_ratio: float
+        Share of 'max_cache_size' the probationary queue may hold before it is evicted from (Defaults to 0.25).
+    out_ratio: float
+        Number of evicted keys remembered by the ghost queue, relative to 'max_cache_size' (Defaults to 0.5).
+
+    ----- Notes -----
+    'demotions' counts entries evicted from the probationary queue into the ghost queue,
+    'promotions' counts ghost keys re-added into the protected segment.
+    """
+
+    __slots__ = ("in_capacity", "ghost_capacity", "probation", "protected", "ghost", "promotions", "demotions")
+
+    def __init__(self, max_cache_size: int, default_ttl: float, in_ratio: float = 0.25, out_ratio: float = 0.5):
+        _check_ratio("in_ratio", in_ratio)
+        _check_ratio("out_ratio", out_ratio)
+        super().__init__(max_cache_size, default_ttl)
+        self.in_capacity = max(1, int(max_cache_size * in_ratio))
+        self.ghost_capacity = max(1, int(max_cache_size * out_ratio))
+        self.probation: OrderedDict[Any, None] = OrderedDict()     # A1in, FIFO order
+        self.protected: OrderedDict[Any, None] = OrderedDict()     # Am, LRU order
+        self.ghost: OrderedDict[Any, None] = OrderedDict()         # A1out, keys of recently evicted A1in entries
+        self.promotions = 0
+        self.demotions = 0
+
+    def _victim(self) -> Any:
+        if len(self.probation) > self.in_capacity or not self.protected:
+            return next(iter(self.probation))
+        return next(iter(self.protected))
 
-            while len(self.cache) >= self.max_cache_size:
-                removed = self.cache.popitem(last=False)
-                self.evictions += 1
-                self.lifespan.append(removed[1].lifespan())
-            self.cache[key] = CacheEntry(value, self.default_ttl)
-            end_time = time.monotonic()
-            self.add_latency.append(end_time - start_time)
+    def _on_access(self, key: Any, entry: CacheEntry) -> None:
+        if key in self.protected:               # Hits in A1in leave the FIFO order untouched
+            self.protected.move_to_end(key)
 
-    def get(self, key: Any) -> Optional[Any]:
+    def _insert(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> bool:
+        ghost = key not in self.protected and key in self.ghost
+        if key in self.protected or ghost:
+            segment = self.protected
+        else:
+            segment = self.probation
+        if not super()._insert(key, value, cost, size):
+            return False
+        if ghost:
+            self.ghost.pop(key, None)           # May have been pushed out by the insert's own evictions
+            self.promotions += 1
+        segment[key] = None
+        return True
+
+    def _remove(self, key: Any) -> CacheEntry:
+        removed = super()._remove(key)
+        if key in self.probation:
+            del self.probation[key]
+        else:
+            del self.protected[key]
+        return removed
+
+    def _evict(self, key: Any, cause: str = "evicted") -> None:
+        if key in self.probation and cause == "evicted":     # Expired entries are not remembered
+            self.ghost[key] = None
+            self.demotions += 1
+            if len(self.ghost) > self.ghost_capacity:
+                self.ghost.popitem(last=False)
+        super()._evict(key, cause)
+
+    def _adopt(self) -> None:
+        for key, entry in self.cache.items():       # Entries hit before count as re-referenced, as a ghost hit would
+            if entry.hits:
+                self.protected[key] = None
+            else:
+                self.probation[key] = None
+
+    def resize(self, max_cache_size: int) -> int:
         with self.lock:
-            start_time = time.monotonic()
-            self._purge_expired()
+            in_ratio = self.in_capacity / self.max_cache_size
+            out_ratio = self.ghost_capacity / self.max_cache_size
+            evicted = super().resize(max_cache_size)
+            self.in_capacity = max(1, int(max_cache_size * in_ratio))
+            self.ghost_capacity = max(1, int(max_cache_size * out_ratio))
+            while len(self.ghost) > self.ghost_capacity:
+                self.ghost.popitem(last=False)
+            return evicted
 
-            entry = self.cache.get(key)
+    def clear(self) -> None:
+        with self.lock:
+            super().clear()
+            self.probation.clear()
+            self.protected.clear()
+            self.ghost.clear()
+            self.promotions = 0
+            self.demotions = 0
 
-            if entry is None or entry.is_expired():
-                self.cache.pop(key, None)
-                self.misses += 1
-                return None
-            self.hits += 1
-            end_time = time.monotonic()
-            entry.last_access_time = end_time
-            self.get_latency.append(end_time - start_time)
-            return entry.value
+    @property
+    def segment_metrics(self) -> Dict[str, int]:
+        return {
+            "probation_size": len(self.probation),
+            "protected_size": len(self.protected),
+            "ghost_size": len(self.ghost),
+            "promotions": self.promotions,
+            "demotions": self.demotions
+        }
 
-class RandomCache(BaseCache):
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        metrics = super().metrics
+        metrics["segments"] = self.segment_metrics
+        return metrics
+
+class GDSFCache(BaseCache):
     """
-    Cache-class that utilizes Random (Randomized entries) eviction strategy.
+    Cache-class that utilizes GDSF (GreedyDual-Size-Frequency) eviction strategy.
     Inherits functionality and properties from BaseCache.
 
+    Every entry is given the priority L + frequency * cost / size, where cost & size are supplied
+    through add() and frequency counts the insert plus every hit. The entry with the lowest priority
+    is evicted, raising the inflation value L to its priority, so expensive entries that stop being
+    accessed are eventually overtaken by newer ones.
+
+    Priorities are kept in a binary heap. A hit pushes a new heap item instead of moving the old one,
+    stale items are discarded once they reach the top, and the heap is rebuilt when stale items
+    outnumber the live ones, keeping every operation O(log n) amortized.
+
     ----- Parameters -----
     max_cache_size: int
         Maximum number of items/values capable of being stored in the cache.
     default_ttl: float
         Time-to-live for individual data entries stored in the cache, protrayed in seconds.
+
+    ----- Notes -----
+    Entries added without a size are weighed by their shallow memory footprint ('nbytes').
     """
 
-    __slots__ = ()      # Initialize Slots to inherit variables from BaseCache
+    __slots__ = ("heap", "priorities", "inflation", "sequence", "rebuilds")
 
     def __init__(self, max_cache_size: int, default_ttl: float):
         super().__init__(max_cache_size, default_ttl)
+        self.heap: List[Tuple[float, int, Any]] = []                # (priority, sequence, key), lowest on top
+        self.priorities: Dict[Any, Tuple[float, int]] = {}          # Key -> (priority, sequence) of its live heap item
+        self.inflation = 0.0
+        self.sequence = 0                   # Tie-breaker, heap items never compare keys
+        self.rebuilds = 0
 
-    def add(self, key: Any, value: Any) -> None:
-        with self.lock:
-            start_time = time.monotonic()
-            self._purge_expired()
+    def _push(self, key: Any, entry: CacheEntry, frequency: int) -> None:
+        priority = self.inflation + frequency * entry.cost / (entry.size or entry.nbytes)
+        self.sequence += 1
+        self.priorities[key] = (priority, self.sequence)
+        heapq.heappush(self.heap, (priority, self.sequence, key))
+        if len(self.heap) > 2 * len(self.priorities) + 64:
+            self._rebuild()
 
-            self.cache.pop(key, None)
+    def _rebuild(self) -> None:
+        self.heap = [(priority, sequence, key) for key, (priority, sequence) in self.priorities.items()]
+        heapq.heapify(self.heap)
+        self.rebuilds += 1
 
-            while len(self.cache) >= self.max_cache_size:
-                random_key = random.choice(list(self.cache.keys()))
-                removed = self.cache.pop(random_key)
-                self.evictions += 1
-                self.lifespan.append(removed.lifespan())
-            self.cache[key] = CacheEntry(value, self.default_ttl)
-            end_time = time.monotonic()
-            self.add_latency.append(end_time - start_time)
+    def _victim(self) -> Any:
+        heap, priorities = self.heap, self.priorities
+        while priorities.get(heap[0][2]) != heap[0][:2]:        # Superseded or removed since pushed
+            heapq.heappop(heap)
+        return heap[0][2]
 
-    def get(self, key: Any) -> Optional[Any]:
+    def _adopt(self) -> None:
+        for key, entry in self.cache.items():
+            self._push(key, entry, entry.hits + 1)
+
+    def _on_access(self, key: Any, entry: CacheEntry) -> None:
+        self._push(key, entry, entry.hits + 2)      # Counted before _lookup() increments 'hits'
+
+    def _insert(self, key: Any, value: Any, cost: float = 1.0, size: int = 0) -> bool:
+        if not super()._insert(key, value, cost, size):
+            return False
+        self._push(key, self.cache[key], 1)
+        return True
+
+    def _remove(self, key: Any) -> CacheEntry:
+        removed = super()._remove(key)
+        del self.priorities[key]            # Its heap items turn stale
+        return removed
+
+    def _evict(self, key: Any, cause: str = "evicted") -> None:
+        if cause == "evicted":
+            self.inflation = self.priorities[key][0]
+        super()._evict(key, cause)
+
+    def clear(self) -> None:
         with self.lock:
-            start_time = time.monotonic()
-            self._purge_expired()
+            super().clear()
+            self.heap.clear()
+            self.priorities.clear()
+            self.inflation = 0.0
+            self.rebuilds = 0
 
-            entry = self.cache.get(key)
-            
-            if entry is None or entry.is_expired():
-                self.cache.pop(key, None)
-                self.misses += 1
-                return None
-            self.hits += 1
-            end_time = time.monotonic()
-            entry.last_access_time = end_time
-            self.get_latency.append(end_time - start_time)
-            return entry.value
-    
+    @property
+    def priority_metrics(self) -> Dict[str, Any]:
+        return {
+            "inflation": self.inflation,
+            "heap_size": len(self.heap),
+            "stale_items": len(self.heap) - len(self.priorities),
+            "rebuilds": self.rebuilds
+        }
 
-    
-        
\ No newline at end of file
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        metrics = super().metrics
+        metrics["priorities"] = self.priority_metrics
+        return metrics
+
+# --------------- Migration Helpers ---------------
+
+_MIGRATED_SLOTS = (     # BaseCache state carried over by migrate(), strategy-specific slots are rebuilt by _adopt()
+    "cache",
+    "hits",
+    "misses",
+    "evictions",
+    "expirations",
+    "lifespan_histogram",
+    "idle_histogram",
+    "hits_histogram",
+    "first_hit_histogram",
+    "memory_bytes",
+    "add_latency",
+    "get_latency",
+    "miss_latency",
+    "sample_rate",
+    "sample_tick",
+    "get_tick",
+    "evict_listener",
+    "removal_buffer",
+    "admission",
+    "slots",
+    "free_slots",
+    "saved_cost",
+    "clock",
+    "interning"
+)
+
+# --------------- Pickling Helpers ---------------
+
+def _snapshot(value: Any) -> Any:
+    """
+    Copies mutable metric containers, so they can be pickled after the lock is released.
+    """
+    if isinstance(value, LogHistogram):
+        return value.copy()
+    if isinstance(value, (deque, OrderedDict, dict, list)):
+        return copy.copy(value)
+    return value
+
+def _rebuild_cache(cache_class: type, level: str, state: Dict[str, Any]) -> BaseCache:
+    cache = object.__new__(instrumented(cache_class, level))
+    cache.__setstate__(state)
+    return cache
+
+# --------------- Instrumentation ---------------
+
+_instrumented_classes: Dict[Any, type] = {}
+
+_LEVEL_METHODS = {      # Method implementations (add, get) used by each instrumentation level
+    "off": (BaseCache._add_untimed, BaseCache._get_uncounted),
+    "counters": (BaseCache._add_untimed, BaseCache._get_counted),
+    "sampled": (BaseCache._add_sampled, BaseCache._get_sampled),
+}
+
+def instrumented(cache_class: type, level: str) -> type:
+    """
+    Returns a specialized subclass of the cache-class for the given instrumentation level.
+
+    The selected add() & get() implementations contain no timing (or counting) code at all,
+    so disabled levels pay nothing pr. operation. Classes are created once and reused.
+
+    ----- Parameters -----
+    cache_class: type
+        The eviction strategy's cache-class (e.g. LRUCache).
+    level: str
+        One of 'off', 'counters', 'sampled' or 'full'.
+
+    ----- Return -----
+    Type:
+        The cache-class itself for 'full', otherwise its specialized subclass.
+    """
+    if level not in INSTRUMENTATION_LEVELS:
+        raise ValueError(f"Instrumentation level {level} not supported")
+    if level == "full":
+        return cache_class
+
+    specialized = _instrumented_classes.get((cache_class, level))
+    if specialized is None:
+        add_method, get_method = _LEVEL_METHODS[level]
+        specialized = type(
+            f"{level.capitalize()}{cache_class.__name__}",
+            (cache_class,),
+            {
+                "__slots__": (),
+                "__module__": cache_class.__module__,
+                "instrumentation": level,
+                "_base_class": cache_class,
+                "add": add_method,
+                "get": get_method
+            }
+        )
+        _instrumented_classes[(cache_class, level)] = specialized
+    return specialized
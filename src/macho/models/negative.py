@@ -0,0 +1,152 @@
+# --------------- Imports ---------------
+
+from threading import Lock
+from typing import Any, Dict, Optional
+from array import array
+
+from macho.clock import PRECISE_CLOCK, Clock
+from macho.logging import get_logger
+
+import mmh3
+import sys
+
+# --------------- Logger Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Negative Cache ---------------
+
+_FINGERPRINT_SIZE = sys.getsizeof(1 << 63) + sys.getsizeof(0.0)     # 64-bit int key & float expiry pr. entry
+
+class NegativeCache():
+    """
+    A compact, TTL-bounded set of keys known to be missing from the origin.
+
+    Only a 64-bit fingerprint and an expiry time are stored pr. key, never a CacheEntry or the key itself,
+    so negative lookups take no slot in the main cache. Once full, the oldest fingerprint is dropped.
+
+    ----- Parameters -----
+    max_size: int
+        Maximum number of fingerprints stored.
+    ttl: float
+        Default time-to-live for negative entries, portrayed in seconds.
+    clock: Clock
+        Time source of the expiry times, shared with the owning cache (Defaults to the precise clock).
+
+    ----- Notes -----
+    Two keys sharing a fingerprint (probability ~2^-64 pr. pair) would both be reported missing.
+    """
+
+    __slots__ = ("max_size", "ttl", "clock", "fingerprints", "lock", "hits", "misses", "evictions", "expirations")
+
+    def __init__(self, max_size: int, ttl: float, clock: Clock = PRECISE_CLOCK):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clock = clock
+        self.fingerprints: Dict[int, float] = {}      # Fingerprint -> expiry, in insertion order
+        self.lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def fingerprint(key: Any) -> int:
+        return mmh3.hash64(str(key), seed=7, signed=False)[0]
+
+    def add(self, key: Any, ttl: Optional[float] = None) -> None:
+        """
+        Marks the key as missing for 'ttl' seconds (Defaults to the cache's ttl).
+        """
+        fingerprint = self.fingerprint(key)
+        expiry = self.clock.now() + (self.ttl if ttl is None else ttl)
+        with self.lock:
+            if self.fingerprints.pop(fingerprint, None) is None and len(self.fingerprints) >= self.max_size:
+                del self.fingerprints[next(iter(self.fingerprints))]
+                self.evictions += 1
+            self.fingerprints[fingerprint] = expiry
+
+    def contains(self, key: Any) -> bool:
+        """
+        Returns True if the key is currently known to be missing, counting the lookup as hit or miss.
+        """
+        fingerprint = self.fingerprint(key)
+        expiry = self.fingerprints.get(fingerprint)
+        if expiry is None:
+            self.misses += 1
+            return False
+        if self.clock.now() > expiry:
+            with self.lock:
+                if self.fingerprints.get(fingerprint) == expiry:     # Not refreshed in the meantime
+                    del self.fingerprints[fingerprint]
+                    self.expirations += 1
+            self.misses += 1
+            return False
+        self.hits += 1
+        return True
+
+    def discard(self, key: Any) -> None:
+        """
+        Forgets the key, called once a value for it is stored in the main cache.
+        """
+        fingerprint = self.fingerprint(key)
+        if fingerprint in self.fingerprints:
+            with self.lock:
+                self.fingerprints.pop(fingerprint, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.fingerprints.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        with self.lock:             # Fingerprints & remaining TTLs stored column-wise
+            now = self.clock.now()
+            return {
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "clock": self.clock,
+                "fingerprints": array("Q", self.fingerprints.keys()),
+                "remaining_ttl": array("d", [expiry - now for expiry in self.fingerprints.values()]),
+                "counters": (self.hits, self.misses, self.evictions, self.expirations)
+            }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.max_size = state["max_size"]
+        self.ttl = state["ttl"]
+        self.clock = state["clock"]
+        now = self.clock.now()
+        self.fingerprints = {
+            fingerprint: now + remaining
+            for fingerprint, remaining in zip(state["fingerprints"], state["remaining_ttl"])
+        }
+        self.lock = Lock()
+        self.hits, self.misses, self.evictions, self.expirations = state["counters"]
+
+    @property
+    def memory_size(self) -> int:
+        return sys.getsizeof(self.fingerprints) + len(self.fingerprints) * _FINGERPRINT_SIZE
+
+    @property
+    def negative_metrics(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "current_size": len(self.fingerprints),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 2) if total else 0.00,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "memory_size": self.memory_size
+        }
+
+    def __len__(self) -> int:
+        return len(self.fingerprints)
+
+    def __repr__(self):
+        return f"<NegativeCache(size={len(self.fingerprints)}, max_size={self.max_size}, ttl={self.ttl})>"
@@ -0,0 +1,98 @@
+# --------------- Imports ---------------
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, List, Tuple
+
+from macho.logging import get_logger
+
+# --------------- Logger Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Removal Notifications ---------------
+
+REMOVAL_CAUSES = ("evicted", "expired", "replaced", "cleared")
+
+RemovalListener = Callable[[Any, Any, str], None]
+
+class RemovalDispatcher():
+    """
+    Delivers removal notifications (key, value, cause) to the registered listeners off the caller's thread.
+
+    Shards only append notifications to a buffer while their lock is held. The buffers are handed to
+    dispatch(), which queues them and schedules a single delivery task on a one-thread executor.
+    Notifications queued while a delivery is running are picked up by that same task, so a burst of
+    removals is delivered in large batches, in removal order.
+
+    ----- Notes -----
+    - Exceptions raised by a listener are logged and counted in 'errors', other listeners still run.
+    - A slow listener delays later notifications, never the cache operations producing them.
+    """
+
+    __slots__ = ("listeners", "pending", "lock", "scheduled", "executor", "delivered", "batches", "errors", "causes")
+
+    def __init__(self):
+        self.listeners: List[RemovalListener] = []
+        self.pending: List[Tuple[Any, Any, str]] = []
+        self.lock = Lock()
+        self.scheduled = False
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="macho-removal")
+        self.delivered = 0
+        self.batches = 0
+        self.errors = 0
+        self.causes: Dict[str, int] = dict.fromkeys(REMOVAL_CAUSES, 0)
+
+    def add_listener(self, listener: RemovalListener) -> None:
+        with self.lock:
+            self.listeners = self.listeners + [listener]    # Copy-on-write, deliveries iterate a stable list
+
+    def dispatch(self, notifications: List[Tuple[Any, Any, str]]) -> None:
+        """
+        Queues a shard's buffered notifications for delivery.
+        """
+        with self.lock:
+            self.pending.extend(notifications)
+            if self.scheduled:
+                return
+            self.scheduled = True
+        self.executor.submit(self._deliver)
+
+    def _deliver(self) -> None:
+        while True:
+            with self.lock:
+                batch, self.pending = self.pending, []
+                if not batch:
+                    self.scheduled = False
+                    return
+                listeners = self.listeners
+            for key, value, cause in batch:
+                self.causes[cause] += 1
+                for listener in listeners:
+                    try:
+                        listener(key, value, cause)
+                    except Exception:
+                        self.errors += 1
+                        logger.exception(f"Removal listener {listener!r} failed for key {key!r}")
+            self.delivered += len(batch)
+            self.batches += 1
+
+    def close(self) -> None:
+        """
+        Delivers the queued notifications and stops the executor.
+        """
+        self.executor.shutdown(wait=True)
+
+    @property
+    def removal_metrics(self) -> Dict[str, Any]:
+        return {
+            "listeners": len(self.listeners),
+            "pending": len(self.pending),
+            "delivered": self.delivered,
+            "batches": self.batches,
+            "errors": self.errors,
+            "causes": dict(self.causes)
+        }
+
+    def __repr__(self):
+        return f"<RemovalDispatcher(listeners={len(self.listeners)}, delivered={self.delivered})>"
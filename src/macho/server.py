@@ -0,0 +1,305 @@
+# --------------- Imports ---------------
+
+from macho.cluster import ClusterClient
+from macho.logging import get_logger
+from macho.main import Cache
+
+from multiprocessing import AuthenticationError, get_context
+from multiprocessing.connection import Connection, Listener
+from threading import Event, Lock, Thread
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+import argparse
+import os
+import socket
+
+# --------------- Logging Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Cache Server ---------------
+#
+# Serves a single Cache to ClusterClients, one node of a Macho cluster:
+#
+#   MACHO_AUTHKEY=secret python -m macho.server --port 7001 --max-cache-size 100000 --shard-count 8
+#
+# Requests are (command, payload) tuples, answered with ('ok', result) or ('error', message):
+#   ('get', [keys])                         -> {key: value} of the keys found
+#   ('add', [(key, value, cost, size)])     -> number of pairs added
+#   ('clear', None), ('ping', None), ('metrics', None)
+
+AUTHKEY_ENV = "MACHO_AUTHKEY"
+
+_ABSENT = object()
+
+class CacheServer():
+    """
+    Serves a Cache over TCP to ClusterClients, one thread pr. client connection.
+
+    Connections are authenticated with the shared 'authkey' (HMAC challenge of multiprocessing.connection)
+    before any request is read, and stay open for as many requests as the client's pool sends.
+
+    ----- Parameters -----
+    cache: Cache
+        The cache served.
+    authkey: bytes
+        Shared secret of the cluster.
+    address: Tuple[str, int]
+        (host, port) to listen on, port 0 picks a free port (Defaults to ('127.0.0.1', 0)).
+
+    ----- Notes -----
+    Requests & values are pickled, only listen on trusted networks.
+    """
+
+    __slots__ = ("cache", "listener", "address", "lock", "connections", "requests", "errors", "stopped", "thread")
+
+    def __init__(self, cache: Cache, authkey: bytes, address: Tuple[str, int] = ("127.0.0.1", 0)):
+        if not isinstance(authkey, bytes):
+            raise TypeError("Parameter 'authkey' must be of type: bytes")
+        self.cache = cache
+        self.listener = Listener(address, family="AF_INET", authkey=authkey)
+        self.address: Tuple[str, int] = self.listener.address
+        self.lock = Lock()
+        self.connections: Set[Connection] = set()
+        self.requests = 0
+        self.errors = 0
+        self.stopped = Event()
+        self.thread: Optional[Thread] = None
+
+    def serve_forever(self) -> None:
+        logger.info(f"Cache server listening on {self.address[0]}:{self.address[1]}")
+        while not self.stopped.is_set():
+            try:
+                connection = self.listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError) as error:
+                self.errors += 1
+                logger.warning(f"Cache server rejected a connection: {error!r}")
+                continue
+            except OSError:
+                if self.stopped.is_set():
+                    break
+                raise
+            Thread(target=self._serve, args=(connection,), name="macho-server-connection", daemon=True).start()
+        self.listener.close()
+
+    def start(self) -> "CacheServer":
+        """
+        Serves from a background thread, e.g. to run a node inside the current process.
+        """
+        self.thread = Thread(target=self.serve_forever, name="macho-server", daemon=True)
+        self.thread.start()
+        return self
+
+    def _serve(self, connection: Connection) -> None:
+        with self.lock:
+            self.connections.add(connection)
+        try:
+            while True:
+                try:
+                    request = connection.recv()
+                except (EOFError, OSError):
+                    break
+                connection.send(self.handle(request))
+        except OSError:
+            pass                # Client went away before reading the response
+        finally:
+            with self.lock:
+                self.connections.discard(connection)
+            connection.close()
+
+    def handle(self, request: Tuple[str, Any]) -> Tuple[str, Any]:
+        """
+        Runs a single (command, payload) request against the cache.
+        """
+        try:
+            command, payload = request
+            if command == "get":
+                result = self._get(payload)
+            elif command == "add":
+                for key, value, cost, size in payload:
+                    self.cache.add(key, value, cost, size)
+                result = len(payload)
+            elif command == "clear":
+                self.cache.clear()
+                result = None
+            elif command == "ping":
+                result = {"address": f"{self.address[0]}:{self.address[1]}", "pid": os.getpid(), "size": len(self.cache)}
+            elif command == "metrics":
+                result = self.cache.get_metrics()
+            else:
+                raise ValueError(f"Unknown command {command!r}")
+        except Exception as error:
+            self.errors += 1
+            logger.exception("Cache server request failed")
+            return "error", f"{type(error).__name__}: {error}"
+        self.requests += 1
+        return "ok", result
+
+    def _get(self, keys: List[Any]) -> Dict[Any, Any]:
+        found = {}
+        for key in keys:
+            value = self.cache.get(key, _ABSENT)
+            if value is not _ABSENT:
+                found[key] = value
+        return found
+
+    def close(self) -> None:
+        """
+        Stops accepting connections and closes the open ones.
+        """
+        self.stopped.set()
+        try:
+            socket.create_connection(self.address, timeout=1.0).close()     # Wakes the blocked accept()
+        except OSError:
+            pass
+        with self.lock:
+            connections = list(self.connections)
+        for connection in connections:
+            connection.close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __repr__(self):
+        return f"<CacheServer(address={self.address[0]}:{self.address[1]}, connections={len(self.connections)})>"
+
+# --------------- Local Cluster ---------------
+
+def _run_node(address: Tuple[str, int], authkey: bytes, cache_options: Dict[str, Any], ready: Connection) -> None:
+    server = CacheServer(Cache(**cache_options), authkey, address)
+    ready.send(server.address)
+    ready.close()
+    server.serve_forever()
+
+class LocalCluster():
+    """
+    Starts 'nodes' cache servers as separate processes on one host, e.g. for tests & experiments.
+
+    ----- Parameters -----
+    nodes: int
+        Number of server processes (Defaults to 3).
+    authkey: Optional[bytes]
+        Shared secret (Defaults to 16 random bytes).
+    cache_options: Optional[Dict[str, Any]]
+        Keyword arguments of every node's Cache, e.g. {'max_cache_size': 10_000} (Defaults to None).
+    host: str
+        Interface the servers listen on (Defaults to '127.0.0.1').
+    """
+
+    __slots__ = ("authkey", "cache_options", "context", "processes", "addresses")
+
+    def __init__(
+            self,
+            nodes: int = 3,
+            authkey: Optional[bytes] = None,
+            cache_options: Optional[Dict[str, Any]] = None,
+            host: str = "127.0.0.1"
+        ):
+        if not isinstance(nodes, int) or nodes <= 0:
+            raise ValueError("Parameter 'nodes' must be a positive integer")
+        self.authkey = authkey if authkey is not None else os.urandom(16)
+        self.cache_options = dict(cache_options or {})
+        self.context = get_context("spawn")         # Nodes never inherit the parent's threads or locks
+        self.processes: List[Any] = []
+        self.addresses: List[Tuple[str, int]] = []
+        try:
+            for _ in range(nodes):
+                process, address = self._start((host, 0))
+                self.processes.append(process)
+                self.addresses.append(address)
+        except BaseException:
+            self.close()
+            raise
+
+    def _start(self, address: Tuple[str, int]) -> Tuple[Any, Tuple[str, int]]:
+        reader, writer = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=_run_node, args=(address, self.authkey, self.cache_options, writer), daemon=True
+        )
+        process.start()
+        writer.close()
+        try:
+            if not reader.poll(30.0):
+                raise RuntimeError(f"Cache server on {address[0]}:{address[1]} did not start")
+            bound = reader.recv()
+        except EOFError:
+            raise RuntimeError(f"Cache server on {address[0]}:{address[1]} exited during start-up") from None
+        finally:
+            reader.close()
+        return process, bound
+
+    @property
+    def nodes(self) -> List[str]:
+        return [f"{host}:{port}" for host, port in self.addresses]
+
+    def client(self, **options: Any) -> ClusterClient:
+        """
+        Returns a ClusterClient for every node, options are passed on (e.g. replicas=2).
+        """
+        return ClusterClient(self.nodes, self.authkey, **options)
+
+    def stop_node(self, index: int) -> None:
+        process = self.processes[index]
+        process.terminate()
+        process.join()
+
+    def restart_node(self, index: int) -> None:
+        """
+        Restarts a node on its previous port, with an empty cache.
+        """
+        if self.processes[index].is_alive():
+            self.stop_node(index)
+        self.processes[index], _ = self._start(self.addresses[index])
+
+    def close(self) -> None:
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            process.join()
+
+    def __enter__(self) -> "LocalCluster":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self):
+        return f"<LocalCluster(nodes={', '.join(self.nodes)})>"
+
+# --------------- Command Line ---------------
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m macho.server",
+        description=f"Serve a Macho cache as one node of a cluster. The shared secret is read from ${AUTHKEY_ENV}."
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=7000, help="Port to listen on, 0 picks a free port")
+    parser.add_argument("--max-cache-size", type=int, default=10_000, help="Entries held by this node")
+    parser.add_argument("--ttl", type=float, default=600.0, help="Time-to-live of every entry, in seconds")
+    parser.add_argument("--shard-count", type=int, default=1, help="Shards of the node's cache")
+    parser.add_argument("--strategy", default="lru", help="Eviction strategy of the node's cache")
+    args = parser.parse_args(argv)
+
+    authkey = os.environ.get(AUTHKEY_ENV)
+    if not authkey:
+        parser.error(f"Set ${AUTHKEY_ENV} to the cluster's shared secret")
+
+    cache = Cache(
+        max_cache_size=args.max_cache_size,
+        ttl=args.ttl,
+        shard_count=args.shard_count,
+        strategy=args.strategy
+    )
+    server = CacheServer(cache, authkey.encode(), (args.host, args.port))
+    print(f"Macho cache server listening on {server.address[0]}:{server.address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+# --------------- Imports ---------------
+
+from macho.logging import get_logger
+from macho.trace import OP_GET, read_trace, trace_shard
+from macho.tuning import ghost_class
+from macho.utility import split_capacity
+from macho.utility.utils import cache_list
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence
+from array import array
+
+import argparse
+import json
+import time
+
+# --------------- Logging Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Trace Replay ---------------
+#
+# Replays a trace recorded with Cache.start_trace() against every eviction strategy in cache_list,
+# across a grid of cache sizes (and shard counts), to produce hit-ratio curves.
+#
+#   python -m macho.simulate trace.bin --sizes 100 1000 10000 --shards 1 4 --output results.json
+#
+# TTL expiry is not simulated (entries never expire during a replay), so the shards are ghost caches
+# without the expiry scan. Keys are routed to the shard hash_value() picks in a real sharded Cache.
+
+_OPS: Optional[array] = None        # Trace loaded once pr. worker process by _load_trace()
+_KEYS: Optional[array] = None
+
+
+def _load_trace(path: str) -> None:
+    global _OPS, _KEYS
+    _OPS = array("B")
+    _KEYS = array("Q")
+    for op, key_hash, _ in read_trace(path):
+        _OPS.append(op)
+        _KEYS.append(key_hash)
+
+
+def replay(policy: str, size: int, shards: int = 1, fill_on_miss: bool = True) -> Dict[str, Any]:
+    """
+    Replays the loaded trace against a single cache configuration.
+
+    ----- Parameters -----
+    policy: str
+        Eviction strategy registered in cache_list.
+    size: int
+        Total cache capacity.
+    shards: int
+        Number of shards the capacity is split across (Defaults to 1).
+    fill_on_miss: bool
+        Insert the key after every missed get(), like a cache-aside application would (Defaults to True).
+        The add() calls in a trace only follow the misses of the recording cache's own policy.
+
+    ----- Return -----
+    Dict[str, Any]
+        The configuration, hits, misses, hit ratio and replay throughput (ops/s).
+    """
+    ghost = ghost_class(cache_list[policy])
+    shard_list = [ghost(capacity, float("inf")) for capacity in split_capacity(size, shards)]
+
+    start = time.perf_counter()
+    for op, key_hash in zip(_OPS, _KEYS):
+        shard = shard_list[trace_shard(key_hash, shards)]
+        if op == OP_GET:
+            if shard.get(key_hash) is None and fill_on_miss:
+                shard.add(key_hash, True)
+        else:
+            shard.add(key_hash, True)
+    elapsed = time.perf_counter() - start
+
+    hits = sum(shard.hits for shard in shard_list)
+    misses = sum(shard.misses for shard in shard_list)
+    return {
+        "policy": policy,
+        "size": size,
+        "shards": shards,
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": hits / (hits + misses) if hits + misses else 0.0,
+        "ops_per_second": len(_OPS) / elapsed if elapsed else 0.0
+    }
+
+
+def _replay_task(config: tuple) -> Dict[str, Any]:
+    return replay(*config)
+
+
+def run_simulation(
+    path: str,
+    sizes: Sequence[int],
+    policies: Optional[Sequence[str]] = None,
+    shard_counts: Sequence[int] = (1,),
+    fill_on_miss: bool = True,
+    workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Replays a trace against every policy x size x shard count configuration in a process pool.
+
+    ----- Parameters -----
+    path: str
+        Trace file recorded with Cache.start_trace().
+    sizes: Sequence[int]
+        Cache capacities to simulate.
+    policies: Optional[Sequence[str]]
+        Eviction strategies to simulate (Defaults to every policy in cache_list).
+    shard_counts: Sequence[int]
+        Shard counts to simulate (Defaults to (1,)).
+    fill_on_miss: bool
+        Insert the key after every missed get() (Defaults to True).
+    workers: Optional[int]
+        Size of the process pool (Defaults to the number of CPUs).
+
+    ----- Return -----
+    Dict[str, Any]
+        'results' (one entry pr. configuration) and 'curves' (hit ratio by size, pr. policy & shard count).
+    """
+    policies = list(policies) if policies else list(cache_list)
+    for policy in policies:
+        if policy not in cache_list:
+            raise ValueError(f"Eviction Strategy {policy} not supported")
+
+    configs = [
+        (policy, size, shards, fill_on_miss)
+        for policy in policies
+        for shards in shard_counts
+        for size in sizes
+        if size >= shards                   # Every shard needs room for at least one entry
+    ]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_load_trace, initargs=(path,)) as pool:
+        results = list(pool.map(_replay_task, configs))
+
+    curves: Dict[str, List[Dict[str, Any]]] = {}
+    for result in results:
+        label = result["policy"] if len(shard_counts) == 1 else f"{result['policy']}/{result['shards']}"
+        curves.setdefault(label, []).append({"size": result["size"], "hit_ratio": result["hit_ratio"]})
+
+    logger.info(f"Simulated {len(configs)} cache configurations for trace {path}")
+    return {"trace": path, "results": results, "curves": curves}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m macho.simulate",
+        description="Replay a Macho access trace against every eviction strategy and cache size."
+    )
+    parser.add_argument("trace", help="Trace file recorded with Cache.start_trace()")
+    parser.add_argument("--sizes", type=int, nargs="+", required=True, help="Cache capacities to simulate")
+    parser.add_argument("--policies", nargs="+", default=None, help="Eviction strategies (default: all)")
+    parser.add_argument("--shards", type=int, nargs="+", default=[1], help="Shard counts to simulate")
+    parser.add_argument(
+        "--no-fill-on-miss",
+        dest="fill_on_miss",
+        action="store_false",
+        help="Only replay the trace's own add() calls instead of inserting keys after missed gets"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size")
+    parser.add_argument("--output", default=None, help="Write the results as JSON to this file")
+    args = parser.parse_args(argv)
+
+    report = run_simulation(
+        path=args.trace,
+        sizes=args.sizes,
+        policies=args.policies,
+        shard_counts=args.shards,
+        fill_on_miss=args.fill_on_miss,
+        workers=args.workers
+    )
+
+    print(f"{'policy':<10}{'shards':>8}{'size':>10}{'hit ratio':>12}{'ops/s':>14}")
+    for result in report["results"]:
+        print(
+            f"{result['policy']:<10}{result['shards']:>8}{result['size']:>10}"
+            f"{result['hit_ratio']:>12.4f}{result['ops_per_second']:>14.0f}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+# --------------- Imports ---------------
+
+from .writer import WRITE_MODES, StoreWriter, WriteBehindWriter, create_store_writer
+
+# --------------- Package Manager ---------------
+
+__all__ = ["WRITE_MODES", "StoreWriter", "WriteBehindWriter", "create_store_writer"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
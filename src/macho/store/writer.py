@@ -0,0 +1,344 @@
+# --------------- Imports ---------------
+
+from macho.logging import get_logger
+from macho.metrics import LogHistogram
+
+from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from threading import Condition, Lock, Thread
+
+import time
+
+# --------------- Logging Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Store Writers ---------------
+
+WRITE_MODES = ("through", "behind")
+
+_NOT_PENDING = object()     # Returned by pending() for keys without an unflushed write
+
+class StoreWriter():
+    """
+    Write-through hook, passes every add() synchronously to the backing store.
+
+    ----- Parameters -----
+    writer: Callable[[Dict[Any, Any]], None]
+        Persists a batch of key-value pairs to the backing store (e.g. one SQLite executemany()).
+        Exceptions propagate to the add() caller, and the value is not cached.
+    """
+
+    __slots__ = ("writer", "lock", "writes", "flushed", "batches", "errors", "flush_latency")
+
+    mode = "through"
+
+    def __init__(self, writer: Callable[[Dict[Any, Any]], None]):
+        if not callable(writer):
+            raise TypeError("Parameter 'writer' must be callable")
+
+        self.writer = writer
+        self.lock = Lock()
+        self.writes = 0
+        self.flushed = 0
+        self.batches = 0
+        self.errors = 0
+        self.flush_latency = LogHistogram()     # Nanosecond latencies of writer() calls
+
+    def _write_batch(self, batch: Dict[Any, Any]) -> None:
+        start_time = time.perf_counter_ns()
+        try:
+            self.writer(batch)
+        except Exception:
+            with self.lock:
+                self.errors += 1
+            raise
+        with self.lock:
+            self.flush_latency.record(time.perf_counter_ns() - start_time)
+            self.flushed += len(batch)
+            self.batches += 1
+
+    def write(self, key: Any, value: Any) -> None:
+        """
+        Persists the key-value pair before returning.
+        """
+        with self.lock:
+            self.writes += 1
+        self._write_batch({key: value})
+
+    def pending(self, key: Any, default: Any = _NOT_PENDING) -> Any:
+        """
+        Returns the value of an unflushed write to the key, or 'default'. Write-through never has any.
+        """
+        return default
+
+    def on_evict(self, key: Any) -> None:
+        """
+        Called by the shards when an entry leaves the cache. Write-through entries are never dirty.
+        """
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def queue_depth(self) -> int:
+        return 0
+
+    @property
+    def store_metrics(self) -> Dict[str, Any]:
+        summary = self.flush_latency.summary(scale=1e9)     # Nanoseconds -> seconds
+        return {
+            "write_mode": self.mode,
+            "writes": self.writes,
+            "flushed": self.flushed,
+            "batches": self.batches,
+            "errors": self.errors,
+            "queue_depth": self.queue_depth,
+            "coalesced": 0,
+            "coalescing_ratio": 0.00,
+            "flush_latency_seconds": summary["mean"],
+            "p50_flush_latency": summary["p50"],
+            "p99_flush_latency": summary["p99"],
+            "max_flush_latency": summary["max"]
+        }
+
+    def __reduce__(self):
+        # Only the configuration is pickled, counters & queued writes stay with the original
+        return (StoreWriter, (self.writer,))
+
+    def __repr__(self):
+        return f"<{type(self).__name__}(writes={self.writes}, flushed={self.flushed})>"
+
+
+class WriteBehindWriter(StoreWriter):
+    """
+    Write-behind hook, queues writes and persists them in batches from a background worker thread.
+
+    Repeated writes to a queued key overwrite the queued value in place (coalescing), so the store only
+    receives the latest value, and the key keeps its original flush position. The worker flushes once
+    'flush_batch_size' keys are queued or 'flush_interval' seconds after the first queued write.
+
+    ----- Parameters -----
+    writer: Callable[[Dict[Any, Any]], None]
+        Persists a batch of key-value pairs to the backing store, called from the worker thread only.
+    max_queue_size: int
+        Maximum number of distinct keys waiting to be flushed. write() blocks while the queue is full.
+    flush_interval: float
+        Seconds a write may wait in the queue for more writes to coalesce/batch with.
+    flush_batch_size: int
+        Maximum number of key-value pairs pr. writer() call.
+
+    ----- Notes -----
+    - A failed batch is logged, counted in 'errors' and re-queued (without overwriting newer writes),
+      then retried after 'flush_interval' seconds. Once closed, failed batches are dropped.
+    - Evicting or expiring a queued key from the cache triggers an immediate flush of that key alone,
+      so the store catches up without cutting the other keys' coalescing short. pending() serves
+      the unflushed value to the loader meanwhile.
+    - Call close() (or Cache.close()) before exiting, the worker is a daemon thread.
+    """
+
+    __slots__ = (
+        "max_queue_size",
+        "flush_interval",
+        "flush_batch_size",
+        "queue",
+        "in_flight",
+        "condition",
+        "urgent",
+        "evicted",
+        "deadline",
+        "closed",
+        "coalesced",
+        "eviction_flushes",
+        "worker"
+    )
+
+    mode = "behind"
+
+    def __init__(
+            self,
+            writer: Callable[[Dict[Any, Any]], None],
+            max_queue_size: int = 1024,
+            flush_interval: float = 0.1,
+            flush_batch_size: int = 256
+        ):
+        if not isinstance(max_queue_size, int) or max_queue_size <= 0:
+            raise ValueError("Parameter 'max_queue_size' must be a positive integer")
+        if not isinstance(flush_interval, float) or flush_interval <= 0:
+            raise ValueError("Parameter 'flush_interval' must be a positive float")
+        if not isinstance(flush_batch_size, int) or flush_batch_size <= 0:
+            raise ValueError("Parameter 'flush_batch_size' must be a positive integer")
+
+        super().__init__(writer)
+        self.max_queue_size = max_queue_size
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.queue: OrderedDict[Any, Any] = OrderedDict()     # Dirty keys in first-write order
+        self.in_flight: Dict[Any, Any] = {}                    # Batch currently passed to writer()
+        self.condition = Condition(self.lock)
+        self.urgent = False                 # Flush everything now (flush(), close() or a full queue)
+        self.evicted: List[Any] = []        # Dirty keys evicted from the cache, flushed ahead of the rest
+        self.deadline = 0.0                 # Flush time of the oldest queued write
+        self.closed = False
+        self.coalesced = 0
+        self.eviction_flushes = 0
+        self.worker = Thread(target=self._run, name="macho-write-behind", daemon=True)
+        self.worker.start()
+
+    def write(self, key: Any, value: Any) -> None:
+        """
+        Queues the key-value pair, coalescing it with an unflushed write to the same key.
+        Blocks while 'max_queue_size' distinct keys are waiting to be flushed.
+        """
+        with self.condition:
+            if self.closed:
+                raise RuntimeError("Write-behind writer is closed")
+            self.writes += 1
+            if key in self.queue:
+                self.queue[key] = value
+                self.coalesced += 1
+                return
+            while len(self.queue) >= self.max_queue_size:
+                self.urgent = True
+                self.condition.notify_all()
+                self.condition.wait()
+            self.queue[key] = value
+            if len(self.queue) == 1:
+                self.deadline = time.monotonic() + self.flush_interval
+                self.condition.notify_all()
+            elif len(self.queue) >= self.flush_batch_size:
+                self.condition.notify_all()
+
+    def pending(self, key: Any, default: Any = _NOT_PENDING) -> Any:
+        with self.lock:
+            value = self.queue.get(key, _NOT_PENDING)
+            if value is _NOT_PENDING:
+                value = self.in_flight.get(key, default)
+            return value
+
+    def on_evict(self, key: Any) -> None:
+        if key in self.queue:           # Lock-free pre-check, evictions of clean keys cost one lookup
+            with self.condition:
+                self.evicted.append(key)
+                self.eviction_flushes += 1
+                self.condition.notify_all()
+
+    def _next_batch(self) -> Optional[Dict[Any, Any]]:
+        """
+        Waits for a batch to flush. Returns None once closed and drained. Lock must be held by the caller.
+        """
+        while True:
+            if not self.queue:
+                if self.closed:
+                    return None
+                self.condition.wait()
+                continue
+            if (self.urgent or self.closed or len(self.queue) >= self.flush_batch_size
+                    or time.monotonic() >= self.deadline):
+                self.urgent = False
+                self.evicted.clear()
+                count = min(len(self.queue), self.flush_batch_size)
+                return dict(self.queue.popitem(last=False) for _ in range(count))
+            if self.evicted:        # Only the evicted keys, the rest keep coalescing until the deadline
+                keys = [key for key in dict.fromkeys(self.evicted) if key in self.queue][:self.flush_batch_size]
+                self.evicted.clear()
+                if keys:
+                    return {key: self.queue.pop(key) for key in keys}
+                continue
+            self.condition.wait(self.deadline - time.monotonic())
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                batch = self._next_batch()
+                if batch is None:
+                    return
+                self.in_flight = batch
+                self.condition.notify_all()         # Wake writers blocked on a full queue
+
+            failed = False
+            try:
+                self._write_batch(batch)
+            except Exception:
+                failed = True
+                logger.exception(f"Write-behind flush of {len(batch)} entries failed, retrying")
+
+            with self.condition:
+                retry = failed and not self.closed      # A closing writer drops the batch instead
+                if retry:           # Re-queue in front, newer writes to the same keys take precedence
+                    for key, value in reversed(batch.items()):
+                        if key not in self.queue:
+                            self.queue[key] = value
+                            self.queue.move_to_end(key, last=False)
+                self.in_flight = {}
+                self.condition.notify_all()
+                if retry:
+                    self.condition.wait(self.flush_interval)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Flushes every queued write and waits for the store to acknowledge them.
+
+        ----- Return -----
+        Bool:
+            True if the queue was drained, False if 'timeout' seconds passed first.
+        """
+        with self.condition:
+            self.urgent = True
+            self.condition.notify_all()
+            return self.condition.wait_for(lambda: not self.queue and not self.in_flight, timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Flushes the remaining writes and stops the worker thread.
+        """
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+        self.worker.join(timeout)
+
+    def __reduce__(self):
+        # Writes still unflushed (e.g. the store is down) are carried over & flushed by the copy's worker
+        with self.lock:
+            unflushed = {**self.in_flight, **self.queue}
+        args = (self.writer, self.max_queue_size, self.flush_interval, self.flush_batch_size)
+        return (WriteBehindWriter, args, unflushed or None)
+
+    def __setstate__(self, unflushed: Dict[Any, Any]) -> None:
+        with self.condition:            # Queued directly, write() would block on a full queue while unpickling
+            self.queue.update(unflushed)
+            self.deadline = time.monotonic() + self.flush_interval
+            self.condition.notify_all()
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self.queue)
+
+    @property
+    def store_metrics(self) -> Dict[str, Any]:
+        metrics = super().store_metrics
+        metrics["max_queue_size"] = self.max_queue_size
+        metrics["coalesced"] = self.coalesced
+        metrics["coalescing_ratio"] = round(self.coalesced / self.writes, 2) if self.writes else 0.00
+        metrics["eviction_flushes"] = self.eviction_flushes
+        return metrics
+
+
+def create_store_writer(
+    mode: str,
+    writer: Callable[[Dict[Any, Any]], None],
+    max_queue_size: int = 1024,
+    flush_interval: float = 0.1,
+    flush_batch_size: int = 256
+) -> StoreWriter:
+    """
+    Creates the store writer for the given write mode ('through' or 'behind').
+    """
+    if mode == "through":
+        return StoreWriter(writer)
+    if mode == "behind":
+        return WriteBehindWriter(writer, max_queue_size, flush_interval, flush_batch_size)
+    raise ValueError(f"Write mode must be one of: {', '.join(WRITE_MODES)}")
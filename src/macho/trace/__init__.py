@@ -0,0 +1,9 @@
+# --------------- Imports ---------------
+
+from .recorder import OP_GET, OP_ADD, TraceRecorder, read_trace, hash_key, trace_shard
+
+# --------------- Package Manager ---------------
+
+__all__ = ["OP_GET", "OP_ADD", "TraceRecorder", "read_trace", "hash_key", "trace_shard"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
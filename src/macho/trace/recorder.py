@@ -0,0 +1,156 @@
+# --------------- Imports ---------------
+
+from macho.logging import get_logger
+from macho.utility.utils import shard_hash
+
+from typing import Any, Iterator, Tuple
+from threading import Lock
+
+import mmh3
+import struct
+import time
+
+# --------------- Logging Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Trace Format ---------------
+#
+# Header:  8-byte magic, start time (float64 epoch seconds).
+# Record:  op code (uint8), 64-bit key hash (uint64), microseconds since previous record (uint32).
+#          The key hash's low 32 bits are the key's shard_hash(), so replays route keys to shards like Cache does.
+# All values little-endian, 13 bytes pr. record.
+
+TRACE_MAGIC = b"MACHOTR1"
+HEADER = struct.Struct("<8sd")
+RECORD = struct.Struct("<BQI")
+
+OP_GET = 1
+OP_ADD = 2
+
+_MAX_DELTA = (1 << 32) - 1
+
+_SHARD_BITS = (1 << 32) - 1
+
+
+def hash_key(key: Any) -> int:
+    """
+    Hashes a cache key into the unsigned 64-bit identifier stored in traces.
+    The high 32 bits come from a 64-bit MurmurHash3, the low 32 bits are the key's shard_hash().
+    """
+    key_str = str(key)
+    return (mmh3.hash64(key_str, seed=42, signed=False)[0] & ~_SHARD_BITS) | shard_hash(key_str)
+
+
+def trace_shard(key_hash: int, count: int) -> int:
+    """
+    Returns the shard of 'count' that hash_value() routes the traced key to.
+    """
+    return (key_hash & _SHARD_BITS) % count
+
+# --------------- Trace Recorder ---------------
+
+class TraceRecorder():
+    """
+    Records cache accesses (op type, hashed key, timestamp) into a compact binary trace file.
+
+    Records are packed into an in-memory buffer and written in large chunks, so recording costs
+    one hash and one struct pack pr. operation. Raw keys are never written, only their 64-bit hash.
+
+    ----- Parameters -----
+    path: str
+        Destination trace file (overwritten).
+    buffer_records: int
+        Number of records buffered in memory before writing to disk (Defaults to 4096).
+    """
+
+    __slots__ = ("path", "file", "buffer", "buffer_limit", "last_ns", "records", "lock")
+
+    def __init__(self, path: str, buffer_records: int = 4096):
+        if not isinstance(buffer_records, int) or buffer_records <= 0:
+            raise ValueError("Parameter 'buffer_records' must be a positive integer")
+
+        self.path = path
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(TRACE_MAGIC, time.time()))
+        self.buffer = bytearray()
+        self.buffer_limit = buffer_records * RECORD.size
+        self.last_ns = time.perf_counter_ns()
+        self.records = 0
+        self.lock = Lock()
+
+    def record(self, op: int, key: Any) -> None:
+        """
+        Appends a single access to the trace.
+
+        ----- Parameters -----
+        op: int
+            OP_GET or OP_ADD.
+        key: Any
+            The accessed key, stored as hash_key(key).
+        """
+        key_hash = hash_key(key)
+        with self.lock:
+            if self.file is None:
+                return
+            now = time.perf_counter_ns()
+            delta = (now - self.last_ns) // 1000
+            self.last_ns = now
+            self.buffer += RECORD.pack(op, key_hash, delta if delta < _MAX_DELTA else _MAX_DELTA)
+            self.records += 1
+            if len(self.buffer) >= self.buffer_limit:
+                self.file.write(self.buffer)
+                self.buffer.clear()
+
+    def close(self) -> None:
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write(self.buffer)
+            self.buffer.clear()
+            self.file.close()
+            self.file = None
+        logger.info(f"Trace with {self.records} records written to {self.path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self):
+        return f"<TraceRecorder(path={self.path}, records={self.records})>"
+
+# --------------- Trace Reader ---------------
+
+def read_trace(path: str) -> Iterator[Tuple[int, int, int]]:
+    """
+    Iterates over every record of a trace file.
+
+    ----- Parameters -----
+    path: str
+        The trace file written by TraceRecorder.
+
+    ----- Return -----
+    Iterator[Tuple[int, int, int]]
+        (op code, key hash, microseconds since the start of the trace) tuples.
+
+    ----- Exceptions -----
+    ValueError
+        Raised if the file is not a Macho trace.
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+
+    if len(data) < HEADER.size:
+        raise ValueError(f"{path} is not a Macho trace file")
+    magic, _ = HEADER.unpack_from(data)
+    if magic != TRACE_MAGIC:
+        raise ValueError(f"{path} is not a Macho trace file")
+
+    body = memoryview(data)[HEADER.size:]
+    usable = len(body) - len(body) % RECORD.size        # Ignore a partially written trailing record
+    elapsed = 0
+    for op, key_hash, delta in RECORD.iter_unpack(body[:usable]):
+        elapsed += delta
+        yield op, key_hash, elapsed
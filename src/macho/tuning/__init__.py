@@ -0,0 +1,9 @@
+# --------------- Imports ---------------
+
+from .tuning import MissRatioEstimator, AutoTuner, ghost_class
+
+# --------------- Package Manager ---------------
+
+__all__ = ["MissRatioEstimator", "AutoTuner", "ghost_class"]
+__version__ = "0.0.1"
+__author__ = "HysingerDev"
\ No newline at end of file
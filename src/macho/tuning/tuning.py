@@ -0,0 +1,452 @@
+# --------------- Imports ---------------
+
+from collections import deque
+from threading import Event, Lock, Thread
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from macho.logging import get_logger
+from macho.models import BaseCache, instrumented
+from macho.trace import OP_GET
+from macho.utility.utils import cache_list, check_cache_list
+
+import random
+import time
+import weakref
+
+# --------------- Logger Setup ---------------
+
+logger = get_logger(__name__)
+
+# --------------- Ghost Caches ---------------
+
+_MASK = (1 << 64) - 1
+
+_ghost_classes: Dict[type, type] = {}
+
+def _skip_purge(self: BaseCache, now: float) -> None:
+    """
+    Ghost entries never expire, so the O(n) expiry scan is skipped altogether.
+    """
+
+def ghost_class(cache_class: type) -> type:
+    """
+    Returns the ghost variant of a cache-class: 'counters' instrumentation (hits & misses only) and
+    no expiry scan. Ghosts store the sampled key hashes with the value True, never the cached values.
+    """
+    ghost = _ghost_classes.get(cache_class)
+    if ghost is None:
+        ghost = type(
+            f"Ghost{cache_class.__name__}",
+            (instrumented(cache_class, "counters"),),
+            {"__slots__": (), "__module__": __name__, "_purge_expired": _skip_purge}
+        )
+        _ghost_classes[cache_class] = ghost
+    return ghost
+
+# --------------- Miss-ratio Curve Estimation ---------------
+
+class MissRatioEstimator():
+    """
+    Estimates the miss-ratio curve of every eviction strategy in cache_list from a spatially sampled
+    (SHARDS) copy of the access stream, at a fraction of the cost of replaying it in full.
+
+    A key is sampled when its salted hash falls under 'rate' of the hash range, so every access to a sampled key is seen
+    and the sample keeps the reuse pattern of the full stream. For every strategy & size factor a ghost
+    cache scaled down by the same rate replays the sample with fill-on-miss, and its miss ratio estimates
+    the miss ratio of a full cache of 'capacity * factor' entries.
+
+    The hot path only hashes the key and appends sampled accesses to a queue. The queue is replayed into
+    the ghosts every 'interval' seconds by a background thread (or by calling process() by hand).
+
+    ----- Parameters -----
+    capacity: int
+        Capacity of the live cache, the size factors are relative to it.
+    strategy: str
+        The live cache's eviction strategy, its ghosts are given 'policy_options' (Defaults to 'lru').
+    policy_options: Optional[Dict[str, Any]]
+        Extra keyword arguments for the ghosts of 'strategy' (Defaults to None).
+    size_factors: Sequence[float]
+        Cache sizes simulated, relative to 'capacity'. 1.0 is always included (Defaults to (0.25, 0.5, 1.0, 2.0, 4.0)).
+    sample_rate: float
+        Share of the keys sampled, between 0.0 - 1.0 (Defaults to 0.01).
+    min_ghost_size: int
+        Smallest ghost simulating 'capacity', raises the rate for small caches (Defaults to 64).
+    window: int
+        Sampled reads after which the ghost counters are halved, so the curve follows workload shifts (Defaults to 100_000).
+    queue_size: int
+        Maximum number of unprocessed samples, further samples are dropped & counted (Defaults to 65_536).
+    interval: float
+        Seconds between background passes, 0 disables the background thread (Defaults to 1.0).
+
+    ----- Notes -----
+    - Ghosts replay unsharded & without an admission filter, TTL expiry is not simulated.
+    - Keys are sampled by hash(), which is only stable within one process, the ghosts are reset when unpickled.
+    - 'gdsf' ghosts weigh the cost & size passed to add(), values added without a size weigh the same.
+    """
+
+    __slots__ = (
+        "capacity",
+        "strategy",
+        "policy_options",
+        "size_factors",
+        "sample_rate",
+        "min_ghost_size",
+        "window",
+        "queue_size",
+        "interval",
+        "rate",
+        "salt",
+        "limit",
+        "ghosts",
+        "pending",
+        "lock",
+        "requests",
+        "window_requests",
+        "dropped",
+        "errors",
+        "tuner",
+        "stopped",
+        "thread",
+        "__weakref__"
+    )
+
+    def __init__(
+            self,
+            capacity: int,
+            strategy: str = "lru",
+            policy_options: Optional[Dict[str, Any]] = None,
+            size_factors: Sequence[float] = (0.25, 0.5, 1.0, 2.0, 4.0),
+            sample_rate: float = 0.01,
+            min_ghost_size: int = 64,
+            window: int = 100_000,
+            queue_size: int = 65_536,
+            interval: float = 1.0
+        ):
+        if not isinstance(capacity, int) or capacity <= 0:
+            raise ValueError("Parameter 'capacity' must be a positive integer")
+        if not size_factors or not all(isinstance(factor, (int, float)) and factor > 0 for factor in size_factors):
+            raise ValueError("Parameter 'size_factors' must hold positive numbers")
+        if not isinstance(sample_rate, float):
+            raise TypeError("Parameter 'sample_rate' must be of type: float")
+        if not 0.00 < sample_rate <= 1.00:
+            raise ValueError("Sample rate value must be between 0.00 - 1.00")
+        if not isinstance(min_ghost_size, int) or min_ghost_size <= 0:
+            raise ValueError("Parameter 'min_ghost_size' must be a positive integer")
+        if not isinstance(window, int) or window <= 0:
+            raise ValueError("Parameter 'window' must be a positive integer")
+        if not isinstance(queue_size, int) or queue_size <= 0:
+            raise ValueError("Parameter 'queue_size' must be a positive integer")
+        if not isinstance(interval, (int, float)) or interval < 0:
+            raise ValueError("Parameter 'interval' must be a non-negative number")
+
+        self.size_factors = tuple(sorted({float(factor) for factor in size_factors} | {1.0}))
+        self.sample_rate = sample_rate
+        self.min_ghost_size = min_ghost_size
+        self.window = window
+        self.queue_size = queue_size
+        self.interval = interval
+        self.pending: Deque[Tuple[int, int, float, int]] = deque()     # (op, key hash, cost, size)
+        self.lock = Lock()
+        self.salt = random.getrandbits(64)      # Keeps the same (e.g. small integer) keys from always being sampled
+        self.dropped = 0
+        self.errors = 0
+        self.tuner: Optional[AutoTuner] = None
+        self.reset(capacity, strategy, policy_options)
+        self.stopped = Event()
+        self.thread: Optional[Thread] = None
+        if interval:
+            self.thread = Thread(
+                target=_estimate, args=(weakref.ref(self), self.stopped, interval), name="macho-mrc", daemon=True
+            )
+            self.thread.start()
+
+    def reset(self, capacity: int, strategy: str, policy_options: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Rebuilds every ghost for a new capacity or strategy of the live cache, discarding the curve so far.
+        """
+        check_cache_list(strategy)
+        with self.lock:
+            self.capacity = capacity
+            self.strategy = strategy.casefold()
+            self.policy_options = dict(policy_options or {})
+            self.rate = min(1.0, max(self.sample_rate, self.min_ghost_size / capacity))
+            self.limit = int(self.rate * _MASK)
+            self.ghosts: Dict[Tuple[str, float], BaseCache] = {}
+            for policy, cache_class in cache_list.items():
+                options = self.policy_options if policy == self.strategy else {}
+                for factor in self.size_factors:
+                    size = max(1, round(capacity * factor * self.rate))
+                    self.ghosts[(policy, factor)] = ghost_class(cache_class)(size, float("inf"), **options)
+            self.pending.clear()
+            self.requests = 0
+            self.window_requests = 0
+
+    def record(self, op: int, key: Any, cost: float = 1.0, size: int = 0) -> None:
+        """
+        Queues the access if the key is sampled. Called for every add() (OP_ADD) & get() (OP_GET) of the live cache.
+        """
+        token = hash((self.salt, key)) & _MASK
+        if token < self.limit:
+            if len(self.pending) < self.queue_size:
+                self.pending.append((op, token, cost, size))
+            else:
+                self.dropped += 1
+
+    def process(self) -> int:
+        """
+        Replays the queued samples into every ghost, a missed read is added like a cache-aside application would.
+
+        ----- Return -----
+        Int:
+            Number of samples replayed.
+        """
+        with self.lock:
+            ghosts = list(self.ghosts.values())
+            pending = self.pending
+            processed = 0
+            while pending:
+                op, token, cost, size = pending.popleft()
+                processed += 1
+                if op == OP_GET:
+                    for ghost in ghosts:
+                        if ghost.get(token) is None:
+                            ghost.add(token, True)
+                    self.requests += 1
+                    self.window_requests += 1
+                    if self.window_requests >= self.window:
+                        self._decay()
+                else:
+                    for ghost in ghosts:
+                        ghost.add(token, True, cost, size)
+            return processed
+
+    def _decay(self) -> None:
+        for ghost in self.ghosts.values():
+            ghost.hits //= 2
+            ghost.misses //= 2
+        self.window_requests = 0
+
+    def miss_ratios(self) -> Dict[str, Dict[float, Optional[float]]]:
+        """
+        Returns the estimated miss ratio pr. strategy & size factor, None until a sampled read was replayed.
+        """
+        with self.lock:
+            curve: Dict[str, Dict[float, Optional[float]]] = {}
+            for (policy, factor), ghost in self.ghosts.items():
+                total = ghost.hits + ghost.misses
+                curve.setdefault(policy, {})[factor] = ghost.misses / total if total else None
+            return curve
+
+    @property
+    def curve(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        The estimated miss-ratio curve of every strategy, as [{'size', 'miss_ratio'}] in ascending size.
+        """
+        return {
+            policy: [
+                {
+                    "size": round(self.capacity * factor),
+                    "miss_ratio": round(ratio, 4) if ratio is not None else None
+                }
+                for factor, ratio in ratios.items()
+            ]
+            for policy, ratios in self.miss_ratios().items()
+        }
+
+    def close(self) -> None:
+        """
+        Stops the background thread, the curve estimated so far stays readable.
+        """
+        self.stopped.set()
+
+    @property
+    def estimator_metrics(self) -> Dict[str, Any]:
+        metrics = {
+            "strategy": self.strategy,
+            "capacity": self.capacity,
+            "rate": self.rate,
+            "sampled_requests": self.requests,
+            "pending": len(self.pending),
+            "dropped": self.dropped,
+            "ghosts": len(self.ghosts),
+            "errors": self.errors,
+            "curve": self.curve
+        }
+        if self.tuner is not None:
+            metrics["auto_tune"] = self.tuner.tuner_metrics
+        return metrics
+
+    def __repr__(self):
+        return f"<MissRatioEstimator(capacity={self.capacity}, rate={self.rate:.4f}, ghosts={len(self.ghosts)})>"
+
+def _estimate(estimator_ref: "weakref.ref[MissRatioEstimator]", stopped: Event, interval: float) -> None:
+    while not stopped.wait(interval):
+        estimator = estimator_ref()
+        if estimator is None:
+            return
+        try:
+            estimator.process()
+            if estimator.tuner is not None:
+                estimator.tuner.step(estimator)
+        except Exception:
+            estimator.errors += 1
+            logger.exception("Miss-ratio curve estimation failed")
+        del estimator
+
+# --------------- Auto-tuning ---------------
+
+class AutoTuner():
+    """
+    Resizes the cache or switches its eviction strategy once the estimated miss-ratio curve shows a gain.
+
+    After every estimator pass with at least 'min_samples' sampled reads, the estimated hit ratio of the
+    live configuration (its strategy at factor 1.0) is compared to:
+    - Every other strategy at the same size, switching to the best one if it gains at least 'threshold'.
+    - Larger sizes of the live strategy, growing to the smallest one gaining at least 'threshold', never
+      beyond 'max_size'.
+    - Smaller sizes, shrinking to the smallest one losing at most 'shrink_threshold', never below 'min_size'.
+    A change resets the estimator, so the next one is only made on a curve measured after it.
+
+    ----- Parameters -----
+    cache: Any
+        The Cache to tune, weakly referenced. Must provide switch_strategy() & resize().
+    threshold: float
+        Hit ratio gain required to switch strategy or grow, between 0.0 - 1.0 (Defaults to 0.02).
+    min_samples: int
+        Sampled reads required before a decision (Defaults to 2000).
+    max_size: Optional[int]
+        Largest capacity grown to (Defaults to 4x the capacity at creation).
+    min_size: Optional[int]
+        Smallest capacity shrunk to, at least the cache's shard count (Defaults to 1/4 of the capacity at creation).
+    shrink_threshold: Optional[float]
+        Hit ratio loss accepted to shrink, None never shrinks (Defaults to None).
+    tune_size: bool
+        Allows resizing (Defaults to True).
+    tune_policy: bool
+        Allows switching strategy (Defaults to True).
+    """
+
+    __slots__ = (
+        "cache_ref",
+        "threshold",
+        "min_samples",
+        "max_size",
+        "min_size",
+        "shrink_threshold",
+        "tune_size",
+        "tune_policy",
+        "actions",
+        "last_action"
+    )
+
+    def __init__(
+            self,
+            cache: Any,
+            threshold: float = 0.02,
+            min_samples: int = 2000,
+            max_size: Optional[int] = None,
+            min_size: Optional[int] = None,
+            shrink_threshold: Optional[float] = None,
+            tune_size: bool = True,
+            tune_policy: bool = True
+        ):
+        if not isinstance(threshold, float):
+            raise TypeError("Parameter 'threshold' must be of type: float")
+        if not 0.00 < threshold < 1.00:
+            raise ValueError("Threshold value must be between 0.00 - 1.00")
+        if not isinstance(min_samples, int) or min_samples <= 0:
+            raise ValueError("Parameter 'min_samples' must be a positive integer")
+        if max_size is not None and (not isinstance(max_size, int) or max_size <= 0):
+            raise ValueError("Parameter 'max_size' must be a positive integer")
+        if min_size is not None and (not isinstance(min_size, int) or min_size <= 0):
+            raise ValueError("Parameter 'min_size' must be a positive integer")
+        if min_size is not None and min_size < cache.shard_count:      # resize() keeps at least one entry pr. shard
+            raise ValueError(f"Parameter 'min_size' must be at least the cache's shard count ({cache.shard_count})")
+        if shrink_threshold is not None and not 0.00 <= shrink_threshold < threshold:
+            raise ValueError("Shrink threshold value must be between 0.00 and 'threshold'")
+
+        self.cache_ref = weakref.ref(cache)
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.max_size = max_size if max_size is not None else cache.max_cache_size * 4
+        self.min_size = min_size if min_size is not None else max(cache.shard_count, cache.max_cache_size // 4)
+        self.shrink_threshold = shrink_threshold
+        self.tune_size = tune_size
+        self.tune_policy = tune_policy
+        self.actions = 0
+        self.last_action: Optional[Dict[str, Any]] = None
+
+    def decide(
+            self, curve: Dict[str, Dict[float, Optional[float]]], strategy: str, capacity: int
+        ) -> Optional[Tuple[str, Any, float]]:
+        """
+        Picks the change with the estimated gain, from a curve of miss ratios pr. strategy & size factor.
+
+        ----- Return -----
+        Optional[Tuple[str, Any, float]]:
+            ('strategy', name, hit ratio gain) or ('max_cache_size', size, hit ratio gain), None to keep the configuration.
+        """
+        ratios = curve[strategy]
+        if ratios[1.0] is None:
+            return None
+        current = 1.0 - ratios[1.0]
+
+        if self.tune_policy:
+            candidates = {policy: 1.0 - policy_ratios[1.0] for policy, policy_ratios in curve.items() if policy_ratios[1.0] is not None}
+            best = max(candidates, key=candidates.get)
+            if best != strategy and candidates[best] - current >= self.threshold:
+                return "strategy", best, candidates[best] - current
+
+        if self.tune_size:
+            for factor, ratio in ratios.items():        # Ascending, the smallest size that pays off wins
+                size = round(capacity * factor)
+                if factor > 1.0 and size <= self.max_size and (1.0 - ratio) - current >= self.threshold:
+                    return "max_cache_size", size, (1.0 - ratio) - current
+            if self.shrink_threshold is not None:
+                for factor, ratio in ratios.items():
+                    size = round(capacity * factor)
+                    if factor < 1.0 and size >= self.min_size and current - (1.0 - ratio) <= self.shrink_threshold:
+                        return "max_cache_size", size, (1.0 - ratio) - current
+        return None
+
+    def step(self, estimator: MissRatioEstimator) -> Optional[Tuple[str, Any, float]]:
+        """
+        Decides on the estimator's curve and applies the change to the cache.
+        """
+        cache = self.cache_ref()
+        if cache is None or estimator.requests < self.min_samples:
+            return None
+        decision = self.decide(estimator.miss_ratios(), estimator.strategy, estimator.capacity)
+        if decision is None:
+            return None
+
+        kind, value, gain = decision
+        previous = cache.strategy if kind == "strategy" else cache.max_cache_size
+        if kind == "strategy":
+            cache.switch_strategy(value)
+        else:
+            cache.resize(value)
+        estimator.reset(cache.max_cache_size, cache.strategy, cache.policy_options)
+        self.actions += 1
+        self.last_action = {
+            "time": time.time(),
+            "change": kind,
+            "from": previous,
+            "to": value,
+            "estimated_gain": round(gain, 4)
+        }
+        logger.info(f"Auto-tune changed {kind} from {previous} to {value}, estimated hit ratio gain {gain:+.2%}")
+        return decision
+
+    @property
+    def tuner_metrics(self) -> Dict[str, Any]:
+        return {
+            "threshold": self.threshold,
+            "max_size": self.max_size,
+            "min_size": self.min_size,
+            "actions": self.actions,
+            "last_action": self.last_action
+        }
+
+    def __repr__(self):
+        return f"<AutoTuner(threshold={self.threshold}, actions={self.actions})>"
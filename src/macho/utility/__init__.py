@@ -1,9 +1,9 @@
 # --------------- Imports ---------------
 
-from .utils import create_cache, hash_value, extract_general_info
+from .utils import create_cache, hash_value, shard_hash, extract_general_info, split_capacity
 
 # --------------- Package Manager ---------------
 
-__all__ = ["create_cache", "hash_value", "extract_general_info"]
+__all__ = ["create_cache", "hash_value", "shard_hash", "extract_general_info", "split_capacity"]
 __version__ = "0.0.1"
 __author__ = "HysingerDev"
\ No newline at end of file
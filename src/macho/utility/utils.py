@@ -2,7 +2,8 @@
 
 from typing import List, Optional, Union, Any, Dict
 
-from macho.models import BaseCache, LRUCache, FIFOCache, RandomCache
+from macho.models import BaseCache, LRUCache, FIFOCache, RandomCache, SLRUCache, TwoQueueCache, GDSFCache, TinyLFUAdmission, InternStore, instrumented
+from macho.clock import PRECISE_CLOCK, Clock
 from macho.errors import ShardException
 from macho.logging import get_logger
 
@@ -17,7 +18,10 @@ logger = get_logger(__name__)
 cache_list = {      # List of supported Eviction Strategies and corresponding cache-classes
     "lru": LRUCache,                
     "fifo": FIFOCache,
-    "random": RandomCache
+    "random": RandomCache,
+    "slru": SLRUCache,
+    "2q": TwoQueueCache,
+    "gdsf": GDSFCache
 }
 
 def check_cache_list(policy: str) -> BaseCache:
@@ -32,30 +36,74 @@ def check_cache_list(policy: str) -> BaseCache:
         raise ValueError(f"Eviction Strategy {policy} not supported")
     
 
+def split_capacity(max_capacity: int, shards: int) -> List[int]:
+    base = max_capacity // shards
+    remainder = max_capacity % shards
+    return [base + (1 if i < remainder else 0) for i in range(shards)]
+    
+
 # --------------- Hash Function ---------------
     
 
+def shard_hash(key: Any) -> int:
+    """
+    Unsigned 32-bit hash routing a key to its shard, also embedded in trace key hashes.
+    """
+    return mmh3.hash(str(key), seed=42, signed=False)
+
+
 def hash_value(key: Any, count: int) -> int:
-    key_str = str(key)
-    return mmh3.hash(key_str, seed=42, signed=False) % count
+    return shard_hash(key) % count
     
     
 # --------------- Cache Creation ---------------
     
-def _create_single_cache(capacity_num: int, ttl: float, policy: str) -> BaseCache:
-    cache_class = check_cache_list(policy=policy)
+def _create_single_cache(
+    capacity_num: int,
+    ttl: float,
+    policy: str,
+    instrumentation: str = "full",
+    sample_rate: int = 1,
+    policy_options: Optional[Dict[str, Any]] = None,
+    admission: bool = False,
+    clock: Clock = PRECISE_CLOCK,
+    interning: Optional[InternStore] = None
+) -> BaseCache:
+    cache_class = instrumented(check_cache_list(policy=policy), instrumentation)
+    new_cache = cache_class(max_cache_size=capacity_num, default_ttl=ttl, **(policy_options or {}))
+    new_cache.sample_rate = sample_rate
+    new_cache.clock = clock
+    new_cache.interning = interning
+    if admission:
+        new_cache.admission = TinyLFUAdmission(capacity_num)
     logger.debug(f"Single cache created with eviction policy {policy}")
-    return cache_class(max_cache_size=capacity_num, default_ttl=ttl)
+    return new_cache
 
     
-def _create_sharded_cache(ttl: float, num: int, shards_capacity: List[int], policy: str) -> List[BaseCache]:
+def _create_sharded_cache(
+    ttl: float,
+    num: int,
+    shards_capacity: List[int],
+    policy: str,
+    instrumentation: str = "full",
+    sample_rate: int = 1,
+    policy_options: Optional[Dict[str, Any]] = None,
+    admission: bool = False,
+    clock: Clock = PRECISE_CLOCK,
+    interning: Optional[InternStore] = None
+) -> List[BaseCache]:
     shards_list = []
 
-    cache_class = check_cache_list(policy=policy)
+    cache_class = instrumented(check_cache_list(policy=policy), instrumentation)
 
     for n in range(num):
         cap = shards_capacity[n]                                        # Pick the capacity num from list
-        new_cache = cache_class(max_cache_size=cap, default_ttl=ttl)    # Create new class instance with capacity
+        new_cache = cache_class(max_cache_size=cap, default_ttl=ttl, **(policy_options or {}))     # New shard with capacity
+        new_cache.sample_rate = sample_rate
+        new_cache.clock = clock                                         # One clock shared by every shard
+        new_cache.interning = interning                                 # Identical values are shared across shards
+        if admission:
+            new_cache.admission = TinyLFUAdmission(cap)                  # Frequencies are tracked pr. shard
         shards_list.append(new_cache)                                   # Append new cache class to final list
         
     logger.debug(f"{num} Cache Shards created with eviction policy {policy}")
@@ -87,13 +135,25 @@ def create_cache(
     ttl: float,
     shards: int, 
     policy: str,
-    shards_capacity: Optional[List[int]] = None
+    shards_capacity: Optional[List[int]] = None,
+    instrumentation: str = "full",
+    sample_rate: int = 1,
+    policy_options: Optional[Dict[str, Any]] = None,
+    admission: bool = False,
+    clock: Clock = PRECISE_CLOCK,
+    interning: Optional[InternStore] = None
 ) -> Union[BaseCache, List[BaseCache]]:
     if shards == 1:
         return _create_single_cache(
         capacity_num=max_capacity,
         ttl=ttl,
-        policy=policy
+        policy=policy,
+        instrumentation=instrumentation,
+        sample_rate=sample_rate,
+        policy_options=policy_options,
+        admission=admission,
+        clock=clock,
+        interning=interning
         )
     else:
         if shards_capacity is None:
@@ -102,6 +162,12 @@ def create_cache(
             ttl=ttl,
             num=shards,
             shards_capacity=shards_capacity,
-            policy=policy
+            policy=policy,
+            instrumentation=instrumentation,
+            sample_rate=sample_rate,
+            policy_options=policy_options,
+            admission=admission,
+            clock=clock,
+            interning=interning
         )
 